@@ -0,0 +1,67 @@
+"""
+Mede a latência de buscas pela fachada assíncrona sobre uma árvore em
+arquivo, variando a quantidade de corrotinas simultâneas.
+
+Uso:
+    python -m benchmarks.assincrona [quantidade_de_chaves] [t]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.ArvoreB import ArvoreB
+from src.ArvoreBAssincrona import ArvoreBAssincrona
+
+
+async def medir(arv: ArvoreBAssincrona, chaves, simultaneas: int) -> float:
+    """
+    Dispara `simultaneas` buscas ao mesmo tempo e retorna a latência
+    mediana, em milissegundos.
+    """
+    latencias = []
+
+    async def cliente(chave):
+        inicio = time.perf_counter()
+        await arv.buscar(chave)
+        latencias.append(time.perf_counter() - inicio)
+
+    await asyncio.gather(*(cliente(random.choice(chaves)) for _ in range(simultaneas)))
+    latencias.sort()
+    return latencias[len(latencias) // 2] * 1000
+
+
+def executar(quantidade: int = 100000, t: int = 32, semente: int = 42) -> None:
+    """
+    Imprime a latência mediana e a quantidade de lotes para cada nível
+    de simultaneidade.
+
+    Args:
+        quantidade (int): Número de chaves.
+        t (int): Grau mínimo.
+        semente (int): Semente do gerador de chaves.
+    """
+    random.seed(semente)
+    chaves = list(range(quantidade))
+    caminho = os.path.join(tempfile.mkdtemp(), "arvore.pag")
+    arvore = ArvoreB.abrir(caminho, m=t, capacidade_paginas=64)
+    arvore.inserir_lote(chaves)
+
+    async def principal():
+        arv = ArvoreBAssincrona(arvore)
+        print(f"n={quantidade} t={t}")
+        print(f"{'simultaneas':>11} | {'mediana ms':>10} | {'lotes':>6}")
+        for simultaneas in (1, 10, 100, 1000, 5000):
+            lotes = arv.lotes_busca
+            mediana = await medir(arv, chaves, simultaneas)
+            print(f"{simultaneas:>11} | {mediana:>10.3f} | {arv.lotes_busca - lotes:>6}")
+        await arv.fechar()
+
+    asyncio.run(principal())
+    os.remove(caminho)
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,48 @@
+"""
+Compara a busca chave a chave, em um laço Python, com buscar_lote, que
+desce com todo o vetor de consultas usando NumPy.
+
+Uso:
+    python -m benchmarks.busca_lote [quantidade_de_chaves] [quantidade_de_consultas] [t]
+"""
+import sys
+import time
+
+import numpy as np
+
+from src.ArvoreB import ArvoreB
+from src.PaginaCompacta import PaginaCompactaInt
+
+
+def executar(quantidade: int = 200000, consultas: int = 1000000, t: int = 64,
+             semente: int = 42) -> None:
+    """
+    Imprime o tempo total e por consulta das duas formas de busca.
+
+    Args:
+        quantidade (int): Número de chaves na árvore.
+        consultas (int): Número de chaves consultadas.
+        t (int): Grau mínimo.
+        semente (int): Semente do gerador de consultas.
+    """
+    arvore = ArvoreB.de_ordenados(range(0, quantidade * 2, 2), t, contratos="desligado",
+                                  tipo_pagina=PaginaCompactaInt)
+    vetor = np.random.default_rng(semente).integers(0, quantidade * 2, size=consultas)
+
+    inicio = time.perf_counter()
+    esperado = [arvore.buscar(chave) is not None for chave in vetor.tolist()]
+    laco = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    mascara = arvore.buscar_lote(vetor)
+    lote = time.perf_counter() - inicio
+
+    assert mascara.tolist() == esperado
+    print(f"n={quantidade} consultas={consultas} t={t}")
+    for nome, segundos in (("buscar", laco), ("buscar_lote", lote)):
+        print(f"{nome:>11} | {segundos:>8.3f}s | {segundos / consultas * 1e9:>8.1f} ns/consulta")
+    print(f"{'ganho':>11} | {laco / lote:>7.1f}x")
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:4]))
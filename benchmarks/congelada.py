@@ -0,0 +1,60 @@
+"""
+Compara a árvore congelada com a ArvoreB: tempo de partida a partir de
+um arquivo (carregar a imagem contra mapear com mmap) e latência de busca.
+
+Uso:
+    python -m benchmarks.congelada [quantidade_de_chaves] [t]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.ArvoreB import ArvoreB
+from src.ArvoreBCongelada import ArvoreBCongelada
+
+
+def cronometrar(funcao) -> float:
+    """
+    Executa a função uma vez e retorna o tempo decorrido em segundos.
+    """
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def executar(quantidade: int = 1000000, t: int = 64, semente: int = 42) -> None:
+    """
+    Imprime o tempo de partida e o tempo médio de busca das duas formas.
+
+    Args:
+        quantidade (int): Número de chaves.
+        t (int): Grau mínimo.
+        semente (int): Semente do gerador de consultas.
+    """
+    arvore = ArvoreB.de_ordenados(range(0, quantidade * 2, 2), t, contratos="desligado")
+    consultas = [random.Random(semente).randrange(quantidade * 2) for _ in range(200000)]
+    with tempfile.TemporaryDirectory() as pasta:
+        imagem = os.path.join(pasta, "arvore.img")
+        congelada = os.path.join(pasta, "arvore.cong")
+        arvore.salvar(imagem)
+        arvore.congelar().salvar(congelada)
+
+        resultado = {}
+        partida = cronometrar(lambda: resultado.update(
+            ArvoreB=ArvoreB.carregar(imagem, contratos="desligado")))
+        partida_mmap = cronometrar(lambda: resultado.update(
+            ArvoreBCongelada=ArvoreBCongelada.abrir(congelada)))
+
+        print(f"n={quantidade} t={t}")
+        print(f"{'variante':>16} | {'partida':>9} | {'buscar µs':>9}")
+        for nome, segundos in (("ArvoreB", partida), ("ArvoreBCongelada", partida_mmap)):
+            buscar = resultado[nome].buscar
+            busca = cronometrar(lambda: [buscar(chave) for chave in consultas])
+            print(f"{nome:>16} | {segundos:>8.4f}s | {busca / len(consultas) * 1e6:>9.2f}")
+        resultado["ArvoreBCongelada"].fechar()
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,133 @@
+"""
+Compara a latência por operação da descida iterativa (ArvoreB) com a
+descida recursiva usada anteriormente, em que busca, inserção e remoção
+chamavam a si mesmas uma vez por nível.
+
+Uso:
+    python -m benchmarks.descida [quantidade_de_chaves]
+"""
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from typing import Callable, List, Optional
+
+from src.ArvoreB import ArvoreB
+from src.Pagina import Pagina
+
+GRAUS = [2, 3, 4, 8, 32]
+
+
+class ArvoreBRecursiva(ArvoreB):
+    """
+    Árvore B que desce pelas páginas com recursão, como antes da adoção
+    dos laços com pilha explícita. Serve apenas de referência.
+    """
+
+    def _buscar_em_pagina(self, pagina: Optional[Pagina], chave: int) -> Optional[int]:
+        if pagina is None:
+            return None
+        i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+        if i < pagina.qtdRegistros and chave == pagina.registros[i]:
+            return pagina.registros[i]
+        if pagina.folha:
+            return None
+        return self._buscar_em_pagina(pagina.paginas[i], chave)
+
+    def _inserir_em_pagina_nao_cheia(self, pagina: Pagina, chave: int) -> None:
+        self._tocar(pagina)
+        if self.tamanhos_subarvore:
+            pagina.tamanho += 1
+        if pagina.folha:
+            i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+            pagina.registros.insert(i, chave)
+            pagina.qtdRegistros += 1
+            return
+
+        i = bisect_right(pagina.registros, chave, 0, pagina.qtdRegistros)
+        filho = self._filho(pagina, i)
+
+        if filho.qtdRegistros == self.max_chaves:
+            if i > 0 and pagina.paginas[i - 1].qtdRegistros < self.max_chaves - 1:
+                self._emprestar_de_posterior(pagina, i - 1)
+                if chave < pagina.registros[i - 1]:
+                    i -= 1
+            elif i < pagina.qtdRegistros and pagina.paginas[i + 1].qtdRegistros < self.max_chaves - 1:
+                self._emprestar_de_anterior(pagina, i + 1)
+                if chave > pagina.registros[i]:
+                    i += 1
+            else:
+                self._dividir_pagina(pagina, i)
+                if chave > pagina.registros[i]:
+                    i += 1
+            filho = self._filho(pagina, i)
+
+        self._inserir_em_pagina_nao_cheia(filho, chave)
+
+    def _remover_em_pagina(self, pagina: Pagina, chave: int) -> bool:
+        self._tocar(pagina)
+        idx = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+        achou = idx < pagina.qtdRegistros and chave == pagina.registros[idx]
+
+        if pagina.folha:
+            if not achou:
+                return False
+            del pagina.registros[idx]
+            pagina.qtdRegistros -= 1
+            if self.tamanhos_subarvore:
+                pagina.tamanho -= 1
+            self._removida = True
+            return pagina.qtdRegistros < self.min_chaves
+
+        if achou:
+            filho, chave = self._remover_chave_em_pagina_interna(pagina, idx)
+        else:
+            filho = self._processar_remocao_em_filho(pagina, idx, chave)
+        abaixo = self._remover_em_pagina(filho, chave)
+
+        if self._removida and self.tamanhos_subarvore:
+            pagina.tamanho -= 1
+        return abaixo
+
+
+def _medir(operacao: Callable[[int], object], chaves: List[int]) -> float:
+    """
+    Executa a operação para cada chave e retorna a latência média em µs.
+    """
+    inicio = time.perf_counter()
+    for chave in chaves:
+        operacao(chave)
+    return (time.perf_counter() - inicio) / len(chaves) * 1e6
+
+
+def executar(quantidade: int = 50000, semente: int = 42) -> None:
+    """
+    Imprime uma tabela de latências médias por grau mínimo, com o ganho
+    relativo da variante iterativa sobre a recursiva.
+
+    Args:
+        quantidade (int): Número de chaves carregadas em cada árvore.
+        semente (int): Semente do gerador de chaves.
+    """
+    gerador = random.Random(semente)
+    chaves = gerador.sample(range(quantidade * 10), quantidade)
+    consultas = gerador.sample(chaves, min(quantidade, 10000))
+
+    print(f"{'t':>3} | {'variante':>9} | {'inserir µs':>10} | "
+          f"{'buscar µs':>9} | {'remover µs':>10}")
+    for t in GRAUS:
+        linhas = {}
+        for nome, classe in (("iterativa", ArvoreB), ("recursiva", ArvoreBRecursiva)):
+            arvore = classe(t, contratos="desligado")
+            linhas[nome] = (_medir(arvore.inserir, chaves),
+                            _medir(arvore.buscar, consultas),
+                            _medir(arvore.remover, consultas))
+            ins, bus, rem = linhas[nome]
+            print(f"{t:>3} | {nome:>9} | {ins:>10.2f} | {bus:>9.2f} | {rem:>10.2f}")
+        ganhos = [rec / it for it, rec in zip(linhas["iterativa"], linhas["recursiva"])]
+        print(f"{t:>3} | {'ganho':>9} | " + " | ".join(
+            f"{ganho:>{largura - 1}.2f}x" for ganho, largura in zip(ganhos, (10, 9, 10))))
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:2]))
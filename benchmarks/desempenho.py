@@ -0,0 +1,322 @@
+"""
+Conjunto reprodutível de benchmarks da ArvoreB: inserção, busca, varredura
+e remoção para várias ordens de chaves, tamanhos, graus e níveis de
+contrato. Para cada caso mede operações por segundo, latências p50/p99 por
+operação e o pico de memória da construção, e grava tudo em JSON para que
+execuções possam ser comparadas.
+
+Uso:
+    python -m benchmarks.desempenho [--tamanhos 1000,10000] [--graus 2,16,64]
+        [--ordens sequencial,aleatoria,decrescente,alternada]
+        [--contratos desligado,completo] [--saida arquivo.json]
+    python -m benchmarks.desempenho --comparar base.json [atual.json]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.ArvoreB import ArvoreB
+
+ORDENS = ("sequencial", "aleatoria", "decrescente", "alternada")
+OPERACOES = ("inserir", "buscar", "varredura", "remover")
+TAMANHO_VARREDURA = 100
+DIRETORIO_RESULTADOS = os.path.join(os.path.dirname(__file__), "resultados")
+
+
+def gerar_chaves(ordem: str, quantidade: int, semente: int) -> List[int]:
+    """
+    Gera as chaves 0..quantidade-1 na ordem pedida.
+
+    "decrescente" e "alternada" são adversariais: a primeira sempre divide
+    a página mais à esquerda e a segunda alterna entre os extremos (menor,
+    maior, segunda menor, ...), dividindo as duas bordas da árvore.
+
+    Args:
+        ordem (str): Uma das ORDENS.
+        quantidade (int): Número de chaves.
+        semente (int): Semente usada na ordem aleatória.
+
+    Returns:
+        List[int]: Chaves na ordem de inserção.
+    """
+    if ordem == "sequencial":
+        return list(range(quantidade))
+    if ordem == "decrescente":
+        return list(range(quantidade - 1, -1, -1))
+    if ordem == "alternada":
+        metade = (quantidade + 1) // 2
+        chaves = [None] * quantidade
+        chaves[0::2] = range(metade)
+        chaves[1::2] = range(quantidade - 1, metade - 1, -1)
+        return chaves
+    if ordem == "aleatoria":
+        chaves = list(range(quantidade))
+        random.Random(semente).shuffle(chaves)
+        return chaves
+    raise ValueError(f"Ordem de chaves desconhecida: {ordem!r}")
+
+
+def percentil(latencias: array, fracao: float) -> float:
+    """
+    Retorna o percentil de uma sequência já ordenada.
+
+    Args:
+        latencias (array): Latências ordenadas, em nanossegundos.
+        fracao (float): Percentil desejado, entre 0 e 1.
+
+    Returns:
+        float: Latência no percentil, em nanossegundos.
+    """
+    if not latencias:
+        return 0.0
+    return float(latencias[min(len(latencias) - 1, int(fracao * len(latencias)))])
+
+
+def cronometrar(operacao: Callable[[Any], Any], argumentos: Iterable[Any]) -> Dict[str, float]:
+    """
+    Executa a operação para cada argumento, cronometrando cada chamada.
+
+    Args:
+        operacao (Callable[[Any], Any]): Operação a medir.
+        argumentos (Iterable[Any]): Argumento de cada chamada.
+
+    Returns:
+        Dict[str, float]: Operações por segundo e latências p50/p99 em µs.
+    """
+    relogio = time.perf_counter_ns
+    latencias = array("q")
+    registrar = latencias.append
+    gc.collect()
+    inicio = relogio()
+    for argumento in argumentos:
+        antes = relogio()
+        operacao(argumento)
+        registrar(relogio() - antes)
+    total = relogio() - inicio
+    latencias = array("q", sorted(latencias))
+    return {
+        "operacoes": len(latencias),
+        "ops_por_segundo": len(latencias) / (total / 1e9) if total else 0.0,
+        "p50_us": percentil(latencias, 0.50) / 1000,
+        "p99_us": percentil(latencias, 0.99) / 1000,
+    }
+
+
+def medir_memoria(chaves: List[int], t: int, contratos: str) -> int:
+    """
+    Constrói a árvore sob o tracemalloc e retorna o pico de memória.
+
+    Args:
+        chaves (List[int]): Chaves na ordem de inserção.
+        t (int): Grau mínimo.
+        contratos (str): Nível de contratos.
+
+    Returns:
+        int: Pico de bytes alocados durante a construção.
+    """
+    gc.collect()
+    tracemalloc.start()
+    arvore = ArvoreB(t, contratos=contratos)
+    for chave in chaves:
+        arvore.inserir(chave)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico
+
+
+def medir_caso(ordem: str, quantidade: int, t: int, contratos: str,
+               semente: int, memoria: bool) -> List[Dict[str, Any]]:
+    """
+    Mede as quatro operações sobre uma árvore construída com as chaves na
+    ordem pedida.
+
+    Args:
+        ordem (str): Ordem das chaves.
+        quantidade (int): Número de chaves.
+        t (int): Grau mínimo.
+        contratos (str): Nível de contratos.
+        semente (int): Semente dos sorteios.
+        memoria (bool): Se True, mede também o pico de memória da construção.
+
+    Returns:
+        List[Dict[str, Any]]: Uma linha de resultado por operação.
+    """
+    sorteio = random.Random(semente)
+    chaves = gerar_chaves(ordem, quantidade, semente)
+    buscadas = chaves[:]
+    sorteio.shuffle(buscadas)
+    varreduras = [sorteio.randrange(quantidade) for _ in range(min(quantidade, 1000))]
+
+    arvore = ArvoreB(t, contratos=contratos)
+    medidas = {
+        "inserir": cronometrar(arvore.inserir, chaves),
+        "buscar": cronometrar(arvore.buscar, buscadas),
+        "varredura": cronometrar(
+            lambda inicio: sum(1 for _ in arvore.intervalo(inicio, inicio + TAMANHO_VARREDURA - 1)),
+            varreduras),
+        "remover": cronometrar(arvore.remover, chaves),
+    }
+    del arvore
+    pico = medir_memoria(chaves, t, contratos) if memoria else None
+    linhas = []
+    for operacao in OPERACOES:
+        linha = {"operacao": operacao, "ordem": ordem, "n": quantidade, "t": t,
+                 "contratos": contratos}
+        linha.update(medidas[operacao])
+        linha["memoria_pico_bytes"] = pico if operacao == "inserir" else None
+        linhas.append(linha)
+    return linhas
+
+
+def metadados(semente: int) -> Dict[str, Any]:
+    """
+    Descreve o ambiente da execução, para que resultados sejam comparáveis.
+
+    Args:
+        semente (int): Semente usada.
+
+    Returns:
+        Dict[str, Any]: Data, versão, plataforma, commit e semente.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "commit": commit,
+        "semente": semente,
+    }
+
+
+def chave_resultado(linha: Dict[str, Any]) -> tuple:
+    return (linha["operacao"], linha["ordem"], linha["n"], linha["t"], linha["contratos"])
+
+
+def comparar(base: Dict[str, Any], atual: Dict[str, Any]) -> None:
+    """
+    Imprime, para cada caso presente nas duas execuções, a razão entre as
+    vazões (acima de 1: a atual é mais rápida) e as latências p99.
+
+    Args:
+        base (Dict[str, Any]): Resultados de referência.
+        atual (Dict[str, Any]): Resultados a comparar.
+    """
+    anteriores = {chave_resultado(linha): linha for linha in base["resultados"]}
+    print(f"base: {base['metadados'].get('commit')}  atual: {atual['metadados'].get('commit')}")
+    print(f"{'operacao':>9} | {'ordem':>11} | {'n':>9} | {'t':>4} | {'contratos':>10} | "
+          f"{'vazao':>7} | {'p99':>7}")
+    for linha in atual["resultados"]:
+        anterior = anteriores.get(chave_resultado(linha))
+        if anterior is None or not anterior["ops_por_segundo"] or not linha["p99_us"]:
+            continue
+        vazao = linha["ops_por_segundo"] / anterior["ops_por_segundo"]
+        p99 = anterior["p99_us"] / linha["p99_us"]
+        print(f"{linha['operacao']:>9} | {linha['ordem']:>11} | {linha['n']:>9} | "
+              f"{linha['t']:>4} | {linha['contratos']:>10} | {vazao:>6.2f}x | {p99:>6.2f}x")
+
+
+def executar(tamanhos: List[int], graus: List[int], ordens: List[str],
+             contratos: List[str], limite_contratos: int, semente: int,
+             memoria: bool, saida: Optional[str]) -> Dict[str, Any]:
+    """
+    Executa todos os casos, imprime uma tabela e grava o JSON.
+
+    Níveis de contrato diferentes de "desligado" percorrem a árvore inteira
+    a cada operação e só são medidos até limite_contratos chaves.
+
+    Args:
+        tamanhos (List[int]): Quantidades de chaves.
+        graus (List[int]): Graus mínimos.
+        ordens (List[str]): Ordens de chaves.
+        contratos (List[str]): Níveis de contratos.
+        limite_contratos (int): Maior tamanho medido com contratos ligados.
+        semente (int): Semente dos sorteios.
+        memoria (bool): Se True, mede o pico de memória de cada construção.
+        saida (Optional[str]): Arquivo JSON; None grava em
+            benchmarks/resultados com data e hora no nome.
+
+    Returns:
+        Dict[str, Any]: Metadados e linhas de resultado.
+    """
+    relatorio = {"metadados": metadados(semente), "resultados": []}
+    print(f"{'operacao':>9} | {'ordem':>11} | {'n':>9} | {'t':>4} | {'contratos':>10} | "
+          f"{'ops/s':>11} | {'p50 us':>8} | {'p99 us':>8} | {'pico MiB':>8}")
+    for quantidade in tamanhos:
+        for t in graus:
+            for nivel in contratos:
+                if nivel != "desligado" and quantidade > limite_contratos:
+                    continue
+                for ordem in ordens:
+                    for linha in medir_caso(ordem, quantidade, t, nivel, semente, memoria):
+                        relatorio["resultados"].append(linha)
+                        pico = linha["memoria_pico_bytes"]
+                        pico = "" if pico is None else f"{pico / 2 ** 20:.1f}"
+                        print(f"{linha['operacao']:>9} | {ordem:>11} | {quantidade:>9} | "
+                              f"{t:>4} | {nivel:>10} | {linha['ops_por_segundo']:>11.0f} | "
+                              f"{linha['p50_us']:>8.2f} | {linha['p99_us']:>8.2f} | {pico:>8}",
+                              flush=True)
+    if saida is None:
+        os.makedirs(DIRETORIO_RESULTADOS, exist_ok=True)
+        saida = os.path.join(DIRETORIO_RESULTADOS,
+                             datetime.now().strftime("desempenho-%Y%m%d-%H%M%S.json"))
+    with open(saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, indent=2)
+    print(f"resultados gravados em {saida}")
+    return relatorio
+
+
+def _lista(tipo: Callable[[str], Any]) -> Callable[[str], List[Any]]:
+    return lambda texto: [tipo(item) for item in texto.split(",") if item]
+
+
+def principal(argumentos: Optional[List[str]] = None) -> None:
+    analisador = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    analisador.add_argument("--tamanhos", type=_lista(lambda s: int(float(s))),
+                            default=[1000, 10000, 100000])
+    analisador.add_argument("--graus", type=_lista(int), default=[2, 16, 64])
+    analisador.add_argument("--ordens", type=_lista(str), default=list(ORDENS))
+    analisador.add_argument("--contratos", type=_lista(str), default=["desligado", "completo"])
+    analisador.add_argument("--limite-contratos", type=int, default=1000)
+    analisador.add_argument("--semente", type=int, default=42)
+    analisador.add_argument("--sem-memoria", action="store_true")
+    analisador.add_argument("--saida")
+    analisador.add_argument("--comparar", nargs="+", metavar="JSON",
+                            help="compara uma execução de referência com a atual "
+                                 "(ou com um segundo arquivo, sem executar)")
+    opcoes = analisador.parse_args(argumentos)
+    for ordem in opcoes.ordens:
+        if ordem not in ORDENS:
+            analisador.error(f"ordem desconhecida: {ordem}")
+    if opcoes.comparar and len(opcoes.comparar) > 2:
+        analisador.error("--comparar aceita no máximo dois arquivos")
+
+    if opcoes.comparar and len(opcoes.comparar) == 2:
+        with open(opcoes.comparar[1], encoding="utf-8") as arquivo:
+            atual = json.load(arquivo)
+    else:
+        atual = executar(opcoes.tamanhos, opcoes.graus, opcoes.ordens, opcoes.contratos,
+                         opcoes.limite_contratos, opcoes.semente, not opcoes.sem_memoria,
+                         opcoes.saida)
+    if opcoes.comparar:
+        with open(opcoes.comparar[0], encoding="utf-8") as arquivo:
+            comparar(json.load(arquivo), atual)
+
+
+if __name__ == '__main__':
+    principal(sys.argv[1:])
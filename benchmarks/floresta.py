@@ -0,0 +1,61 @@
+"""
+Mede a vazão de inserções e buscas em lote de uma FlorestaParticionada
+com diferentes quantidades de processos, contra uma única ArvoreB.
+
+Uso:
+    python -m benchmarks.floresta [quantidade_de_chaves] [t] [tamanho_lote]
+"""
+import os
+import random
+import sys
+import time
+
+from src.ArvoreB import ArvoreB
+from src.FlorestaParticionada import FlorestaParticionada
+
+
+def vazao(funcao, operacoes: int) -> float:
+    """
+    Executa a função uma vez e retorna operações por segundo.
+    """
+    inicio = time.perf_counter()
+    funcao()
+    return operacoes / (time.perf_counter() - inicio)
+
+
+def executar(quantidade: int = 400000, t: int = 32, tamanho_lote: int = 20000,
+             semente: int = 42) -> None:
+    """
+    Imprime a vazão de inserção e de busca para 1, 2, 4, ... processos,
+    até o número de núcleos.
+
+    Args:
+        quantidade (int): Número de chaves.
+        t (int): Grau mínimo.
+        tamanho_lote (int): Chaves por chamada de inserir_lote/buscar_lote.
+        semente (int): Semente do gerador de chaves.
+    """
+    sorteio = random.Random(semente)
+    universo = quantidade * 10
+    chaves = sorteio.sample(range(universo), quantidade)
+    lotes = [chaves[i:i + tamanho_lote] for i in range(0, quantidade, tamanho_lote)]
+
+    arvore = ArvoreB(t, contratos="desligado")
+    print(f"n={quantidade} t={t} lote={tamanho_lote} nucleos={os.cpu_count()}")
+    print(f"{'processos':>9} | {'insercoes/s':>12} | {'buscas/s':>12}")
+    insercao = vazao(lambda: [arvore.inserir_lote(lote) for lote in lotes], quantidade)
+    busca = vazao(lambda: [[arvore.buscar(c) for c in lote] for lote in lotes], quantidade)
+    print(f"{'local':>9} | {insercao:>12.0f} | {busca:>12.0f}")
+
+    processos = 1
+    while processos <= (os.cpu_count() or 1):
+        limites = [universo * i // processos for i in range(1, processos)]
+        with FlorestaParticionada(t, limites) as floresta:
+            insercao = vazao(lambda: [floresta.inserir_lote(lote) for lote in lotes], quantidade)
+            busca = vazao(lambda: [floresta.buscar_lote(lote) for lote in lotes], quantidade)
+        print(f"{processos:>9} | {insercao:>12.0f} | {busca:>12.0f}")
+        processos *= 2
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,59 @@
+"""
+Compara o tempo de partida a frio: carregar uma imagem salva com
+ArvoreB.salvar() contra reinserir todas as chaves.
+
+Uso:
+    python -m benchmarks.imagem [quantidade_de_chaves] [t]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.ArvoreB import ArvoreB
+from src.PaginaCompacta import PaginaCompactaInt
+
+
+def cronometrar(funcao) -> float:
+    """
+    Executa a função uma vez e retorna o tempo decorrido em segundos.
+    """
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def executar(quantidade: int = 200000, t: int = 32, semente: int = 42) -> None:
+    """
+    Imprime os tempos de reinserção, de salvamento e de carga.
+
+    Args:
+        quantidade (int): Número de chaves.
+        t (int): Grau mínimo.
+        semente (int): Semente do gerador de chaves.
+    """
+    chaves = random.Random(semente).sample(range(quantidade * 10), quantidade)
+    arvore = ArvoreB(t, contratos="desligado")
+
+    def reinserir():
+        for chave in chaves:
+            arvore.inserir(chave)
+
+    caminho = os.path.join(tempfile.mkdtemp(), "arvore.img")
+    tempos = [
+        ("reinserir", cronometrar(reinserir)),
+        ("salvar", cronometrar(lambda: arvore.salvar(caminho))),
+        ("carregar", cronometrar(lambda: ArvoreB.carregar(caminho, contratos="desligado"))),
+        ("carregar (int)", cronometrar(lambda: ArvoreB.carregar(
+            caminho, contratos="desligado", tipo_pagina=PaginaCompactaInt))),
+    ]
+    os.remove(caminho)
+    print(f"n={quantidade} t={t}")
+    print(f"{'etapa':>14} | {'segundos':>9} | {'vs reinserir':>12}")
+    for nome, segundos in tempos:
+        print(f"{nome:>14} | {segundos:>9.3f} | {tempos[0][1] / segundos:>11.1f}x")
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,103 @@
+"""
+Mede a latência de busca, inserção e remoção em função do grau mínimo t,
+comparando a localização de posição por busca binária (ArvoreB) com a
+varredura linear usada anteriormente.
+
+Uso:
+    python -m benchmarks.latencia_grau [quantidade_de_chaves]
+"""
+import random
+import sys
+import time
+from typing import Callable, List, Optional
+
+from src.ArvoreB import ArvoreB
+from src.Pagina import Pagina
+
+GRAUS = [2, 8, 32, 64, 128, 256, 512]
+
+
+class ArvoreBLinear(ArvoreB):
+    """
+    Árvore B que localiza posições com varredura linear, como antes da
+    adoção de busca binária nas páginas. Serve apenas de referência.
+    """
+
+    def _buscar_em_pagina(self, pagina: Optional[Pagina], chave: int) -> Optional[int]:
+        while pagina is not None:
+            i = 0
+            while i < pagina.qtdRegistros and chave > pagina.registros[i]:
+                i += 1
+            if i < pagina.qtdRegistros and chave == pagina.registros[i]:
+                return pagina.registros[i]
+            if pagina.folha:
+                return None
+            pagina = pagina.paginas[i]
+        return None
+
+    def _inserir_em_pagina_nao_cheia(self, pagina: Pagina, chave: int) -> None:
+        if pagina.folha:
+            i = pagina.qtdRegistros - 1
+            pagina.registros.append(0)
+            while i >= 0 and chave < pagina.registros[i]:
+                pagina.registros[i + 1] = pagina.registros[i]
+                i -= 1
+            pagina.registros[i + 1] = chave
+            pagina.qtdRegistros += 1
+            return
+        super()._inserir_em_pagina_nao_cheia(pagina, chave)
+
+    def _remover_em_pagina(self, pagina: Pagina, chave: int) -> bool:
+        while True:
+            idx = 0
+            while idx < pagina.qtdRegistros and chave > pagina.registros[idx]:
+                idx += 1
+            achou = idx < pagina.qtdRegistros and chave == pagina.registros[idx]
+            if pagina.folha:
+                break
+            if achou:
+                pagina, chave = self._remover_chave_em_pagina_interna(pagina, idx)
+            else:
+                pagina = self._processar_remocao_em_filho(pagina, idx, chave)
+        if not achou:
+            return False
+        del pagina.registros[idx]
+        pagina.qtdRegistros -= 1
+        return pagina.qtdRegistros < self.min_chaves
+
+
+def _medir(operacao: Callable[[int], object], chaves: List[int]) -> float:
+    """
+    Executa a operação para cada chave e retorna a latência média em µs.
+    """
+    inicio = time.perf_counter()
+    for chave in chaves:
+        operacao(chave)
+    return (time.perf_counter() - inicio) / len(chaves) * 1e6
+
+
+def executar(quantidade: int = 20000, semente: int = 42) -> None:
+    """
+    Imprime uma tabela de latências médias por grau mínimo.
+
+    Args:
+        quantidade (int): Número de chaves carregadas em cada árvore.
+        semente (int): Semente do gerador de chaves.
+    """
+    gerador = random.Random(semente)
+    chaves = gerador.sample(range(quantidade * 10), quantidade)
+    consultas = gerador.sample(chaves, min(quantidade, 5000))
+
+    print(f"{'t':>5} | {'variante':>8} | {'inserir µs':>10} | "
+          f"{'buscar µs':>9} | {'remover µs':>10}")
+    for t in GRAUS:
+        for nome, classe in (("binaria", ArvoreB), ("linear", ArvoreBLinear)):
+            arvore = classe(t, contratos="desligado")
+            ins = _medir(arvore.inserir, chaves)
+            bus = _medir(arvore.buscar, consultas)
+            rem = _medir(arvore.remover, consultas)
+            print(f"{t:>5} | {nome:>8} | {ins:>10.2f} | {bus:>9.2f} | {rem:>10.2f}")
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,69 @@
+"""
+Compara o consumo de memória por chave das representações de página.
+
+Uso:
+    python -m benchmarks.memoria_paginas [quantidade_de_chaves] [t]
+"""
+import random
+import sys
+import tracemalloc
+
+from src.ArvoreB import ArvoreB
+from src.Pagina import Pagina
+from src.PaginaCompacta import PaginaCompacta, PaginaCompactaInt
+
+TIPOS = [
+    ("Pagina", Pagina),
+    ("PaginaCompacta", PaginaCompacta),
+    ("PaginaCompactaInt", PaginaCompactaInt),
+]
+
+# Afasta as chaves do cache de inteiros pequenos do interpretador.
+DESLOCAMENTO = 2 ** 40
+
+
+def medir(tipo_pagina, chaves, t: int) -> int:
+    """
+    Constrói uma árvore com as chaves e retorna os bytes alocados por ela.
+
+    Args:
+        tipo_pagina: Representação de página a usar.
+        chaves: Chaves inseridas, em ordem aleatória.
+        t (int): Grau mínimo.
+
+    Returns:
+        int: Bytes retidos pela árvore após a construção.
+    """
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    arvore = ArvoreB(t, contratos="desligado", tipo_pagina=tipo_pagina)
+    for chave in chaves:
+        # Cria o inteiro dentro da medição: listas retêm o objeto, array('q') não.
+        arvore.inserir(chave + DESLOCAMENTO)
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return depois - antes
+
+
+def executar(quantidade: int = 100000, t: int = 32, semente: int = 42) -> None:
+    """
+    Imprime bytes por chave de cada representação e a razão para Pagina.
+
+    Args:
+        quantidade (int): Número de chaves.
+        t (int): Grau mínimo.
+        semente (int): Semente do gerador de chaves.
+    """
+    chaves = random.Random(semente).sample(range(quantidade * 10), quantidade)
+    referencia = None
+    print(f"n={quantidade} t={t}")
+    print(f"{'representação':>18} | {'bytes/chave':>11} | {'vs Pagina':>9}")
+    for nome, tipo in TIPOS:
+        total = medir(tipo, chaves, t)
+        if referencia is None:
+            referencia = total
+        print(f"{nome:>18} | {total / quantidade:>11.1f} | {total / referencia:>8.2f}x")
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:3]))
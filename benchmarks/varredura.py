@@ -0,0 +1,61 @@
+"""
+Compara varreduras de intervalos curtos e longos na Árvore B, que sobe e
+desce pelas páginas internas, e na Árvore B+, que percorre as folhas
+encadeadas.
+
+Uso:
+    python -m benchmarks.varredura [quantidade_de_chaves] [t]
+"""
+import random
+import sys
+import time
+
+from src.ArvoreB import ArvoreB
+from src.ArvoreBMais import ArvoreBMais
+
+
+def cronometrar(funcao) -> float:
+    """
+    Executa a função uma vez e retorna o tempo decorrido em segundos.
+    """
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def executar(quantidade: int = 200000, t: int = 32, semente: int = 42) -> None:
+    """
+    Imprime o tempo de intervalos de vários comprimentos nas duas árvores.
+
+    Args:
+        quantidade (int): Número de chaves.
+        t (int): Grau mínimo.
+        semente (int): Semente do gerador de chaves.
+    """
+    sorteio = random.Random(semente)
+    chaves = sorteio.sample(range(quantidade * 4), quantidade)
+    arvores = [("ArvoreB", ArvoreB(t, contratos="desligado")),
+               ("ArvoreBMais", ArvoreBMais(t, contratos="desligado"))]
+    for _, arvore in arvores:
+        for chave in chaves:
+            arvore.inserir(chave)
+
+    print(f"n={quantidade} t={t}")
+    print(f"{'comprimento':>11} | " + " | ".join(f"{nome:>11}" for nome, _ in arvores))
+    for comprimento in (10, 1000, 100000, None):
+        inicios = [sorteio.randrange(quantidade * 4) for _ in range(200)] \
+            if comprimento else [None]
+        tempos = []
+        for _, arvore in arvores:
+            def varrer():
+                for inicio in inicios:
+                    fim = None if comprimento is None else inicio + comprimento
+                    for _ in arvore.intervalo(inicio, fim):
+                        pass
+            tempos.append(cronometrar(varrer))
+        rotulo = "tudo" if comprimento is None else str(comprimento)
+        print(f"{rotulo:>11} | " + " | ".join(f"{segundos:>10.3f}s" for segundos in tempos))
+
+
+if __name__ == '__main__':
+    executar(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,217 @@
+import os
+import struct
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+ASSINATURA = b"ARVOREB1"
+CABECALHO = struct.Struct("<8sIIqqq")
+TAMANHO_CABECALHO = 64
+CABECALHO_PAGINA = struct.Struct("<BxxxIq")
+SEM_PAGINA = -1
+
+
+class ArquivoPaginas:
+    def __init__(self, caminho: str, t: Optional[int] = None):
+        """
+        Abre (ou cria) um arquivo de páginas de tamanho fixo.
+
+        Cada página ocupa um slot com cabeçalho (folha, quantidade de chaves,
+        tamanho da subárvore), max_chaves chaves e 2*t identificadores de
+        filhos, todos inteiros de 64 bits. O slot da página `id` começa em
+        TAMANHO_CABECALHO + id * tamanho_slot.
+
+        Args:
+            caminho (str): Caminho do arquivo.
+            t (Optional[int]): Grau mínimo. Obrigatório ao criar; ao abrir um
+                arquivo existente, se informado, deve coincidir com o gravado.
+
+        Raises:
+            ValueError: Se o arquivo for inválido ou o grau não coincidir.
+        """
+        existe = os.path.exists(caminho) and os.path.getsize(caminho) > 0
+        self.caminho: str = caminho
+        self._fd: int = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o644)
+        if existe:
+            dados = os.pread(self._fd, CABECALHO.size, 0)
+            assinatura, t_arquivo, _, raiz, total, livre = CABECALHO.unpack(dados)
+            if assinatura != ASSINATURA:
+                os.close(self._fd)
+                raise ValueError(f"{caminho} não é um arquivo de páginas da Árvore B")
+            if t is not None and t != t_arquivo:
+                os.close(self._fd)
+                raise ValueError(f"Grau {t} difere do grau {t_arquivo} gravado no arquivo")
+            t = t_arquivo
+        else:
+            if t is None:
+                os.close(self._fd)
+                raise ValueError("O grau mínimo é obrigatório para criar o arquivo")
+            raiz, total, livre = SEM_PAGINA, 0, SEM_PAGINA
+        self.t: int = t
+        self.max_chaves: int = 2 * t - 1
+        self.tamanho_slot: int = CABECALHO_PAGINA.size + 8 * (self.max_chaves + 2 * t)
+        self.raiz: int = raiz
+        self.total: int = total
+        self.livre: int = livre
+        self._livres_pendentes: Dict[int, int] = {}
+        if not existe:
+            self.gravar_cabecalho()
+
+    def gravar_cabecalho(self) -> None:
+        """
+        Grava raiz, quantidade de slots e início da lista de slots livres.
+        """
+        dados = CABECALHO.pack(ASSINATURA, self.t, self.tamanho_slot,
+                               self.raiz, self.total, self.livre)
+        os.pwrite(self._fd, dados.ljust(TAMANHO_CABECALHO, b"\0"), 0)
+
+    def _deslocamento(self, pid: int) -> int:
+        return TAMANHO_CABECALHO + pid * self.tamanho_slot
+
+    def alocar(self) -> int:
+        """
+        Reserva um slot, reaproveitando a lista de livres quando possível.
+
+        Returns:
+            int: Identificador da página.
+        """
+        if self.livre != SEM_PAGINA:
+            pid = self.livre
+            if pid in self._livres_pendentes:
+                self.livre = self._livres_pendentes.pop(pid)
+            else:
+                dados = os.pread(self._fd, 8, self._deslocamento(pid) + CABECALHO_PAGINA.size)
+                self.livre = struct.unpack("<q", dados)[0]
+            return pid
+        pid = self.total
+        self.total += 1
+        return pid
+
+    def liberar(self, pid: int) -> None:
+        """
+        Devolve um slot à lista de livres. O encadeamento só é gravado no
+        slot em gravar_livres(), para que o conteúdo anterior continue
+        válido até lá.
+
+        Args:
+            pid (int): Identificador da página liberada.
+        """
+        self._livres_pendentes[pid] = self.livre
+        self.livre = pid
+
+    def livre_pendente(self, pid: int) -> Optional[int]:
+        """
+        Retorna o próximo slot livre encadeado a um slot liberado e ainda
+        não gravado.
+
+        Args:
+            pid (int): Identificador do slot.
+
+        Returns:
+            Optional[int]: Próximo da lista de livres, ou None se o slot não
+            estiver pendente.
+        """
+        return self._livres_pendentes.get(pid)
+
+    def gravar_livre(self, pid: int, proximo: int) -> None:
+        """
+        Grava no slot o encadeamento da lista de livres.
+
+        Args:
+            pid (int): Identificador do slot livre.
+            proximo (int): Próximo slot livre.
+        """
+        dados = CABECALHO_PAGINA.pack(0, 0, 0) + struct.pack("<q", proximo)
+        os.pwrite(self._fd, dados, self._deslocamento(pid))
+
+    def gravar_livres(self) -> None:
+        """
+        Grava os encadeamentos pendentes da lista de livres.
+        """
+        for pid, proximo in self._livres_pendentes.items():
+            self.gravar_livre(pid, proximo)
+        self._livres_pendentes.clear()
+
+    def ler(self, pid: int) -> Tuple[bool, List[int], List[int], int]:
+        """
+        Lê e decodifica o slot de uma página.
+
+        Args:
+            pid (int): Identificador da página.
+
+        Returns:
+            Tuple[bool, List[int], List[int], int]: folha, chaves, ids dos
+            filhos e tamanho da subárvore.
+        """
+        dados = os.pread(self._fd, self.tamanho_slot, self._deslocamento(pid))
+        folha, qtd, tamanho = CABECALHO_PAGINA.unpack_from(dados, 0)
+        inicio = CABECALHO_PAGINA.size
+        chaves = array("q")
+        chaves.frombytes(dados[inicio:inicio + 8 * qtd])
+        filhos = array("q")
+        if not folha:
+            inicio += 8 * self.max_chaves
+            filhos.frombytes(dados[inicio:inicio + 8 * (qtd + 1)])
+        return bool(folha), chaves.tolist(), filhos.tolist(), tamanho
+
+    def escrever(self, pid: int, folha: bool, chaves: List[int],
+                 filhos: List[int], tamanho: int) -> None:
+        """
+        Codifica e grava uma página no seu slot.
+
+        Args:
+            pid (int): Identificador da página.
+            folha (bool): Indica se a página é folha.
+            chaves (List[int]): Chaves da página.
+            filhos (List[int]): Identificadores dos filhos (vazio para folhas).
+            tamanho (int): Tamanho da subárvore.
+        """
+        self.escrever_slot(pid, self.codificar(folha, chaves, filhos, tamanho))
+
+    def escrever_slot(self, pid: int, dados: bytes) -> None:
+        """
+        Grava no slot uma página já codificada.
+
+        Args:
+            pid (int): Identificador da página.
+            dados (bytes): Conteúdo do slot, com tamanho_slot bytes.
+        """
+        os.pwrite(self._fd, dados, self._deslocamento(pid))
+
+    def codificar(self, folha: bool, chaves: List[int],
+                  filhos: List[int], tamanho: int) -> bytes:
+        """
+        Codifica uma página no formato do slot.
+
+        Args:
+            folha (bool): Indica se a página é folha.
+            chaves (List[int]): Chaves da página.
+            filhos (List[int]): Identificadores dos filhos (vazio para folhas).
+            tamanho (int): Tamanho da subárvore.
+
+        Returns:
+            bytes: Conteúdo do slot.
+        """
+        dados = bytearray(self.tamanho_slot)
+        CABECALHO_PAGINA.pack_into(dados, 0, folha, len(chaves), tamanho)
+        inicio = CABECALHO_PAGINA.size
+        bruto = array("q", chaves).tobytes()
+        dados[inicio:inicio + len(bruto)] = bruto
+        inicio += 8 * self.max_chaves
+        bruto = array("q", filhos).tobytes()
+        dados[inicio:inicio + len(bruto)] = bruto
+        return bytes(dados)
+
+    def sincronizar(self) -> None:
+        """
+        Força a gravação do arquivo no disco.
+        """
+        os.fsync(self._fd)
+
+    def fechar(self) -> None:
+        """
+        Grava a lista de livres e o cabeçalho, sincroniza e fecha o arquivo.
+        """
+        self.gravar_livres()
+        self.gravar_cabecalho()
+        self.sincronizar()
+        os.close(self._fd)
@@ -1,59 +1,657 @@
+import functools
+import os
+import threading
+import time
+import weakref
 import icontract
-from typing import Optional, List
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Optional, List, Set, Callable, Iterable, Iterator, Any, Dict, Tuple
 from .Pagina import Pagina
-
-
+from .ModoContratos import ModoContratos, VARIAVEL_NIVEL, DESLIGADO
+from .ArquivoPaginas import ArquivoPaginas
+from .PaginaDisco import GerenciadorPaginas
+from .RegistroEscrita import RegistroEscrita
+from .ImagemArvore import gravar_imagem, ler_imagem
+from .TravaLeituraEscrita import TravaLeituraEscrita
+from .Instrumentacao import Instrumentacao
+from .Perfil import Perfil
+from .ArvoreBCongelada import ArvoreBCongelada
+from .FiltroBloom import FiltroBloom
+
+
+def _exclusiva(metodo: Callable) -> Callable:
+    """
+    No modo concorrente, executa o método com a trava da árvore inteira em
+    modo de escrita, esperando as operações pontuais em andamento.
+    """
+    @functools.wraps(metodo)
+    def envolvido(self, *args: Any, **kwargs: Any) -> Any:
+        if self._trava_arvore is None:
+            return metodo(self, *args, **kwargs)
+        with self._trava_arvore.escrita():
+            return metodo(self, *args, **kwargs)
+    return envolvido
+
+
+def _medir_algoritmo(metodo: Callable) -> Callable:
+    """
+    No modo de perfil, mede a duração do corpo do método, sem os contratos.
+    Deve ser o decorador mais interno.
+    """
+    nome = metodo.__name__
+
+    @functools.wraps(metodo)
+    def envolvido(self, *args: Any, **kwargs: Any) -> Any:
+        if self.perfil is None:
+            return metodo(self, *args, **kwargs)
+        inicio = time.perf_counter_ns()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            self.perfil.medir_algoritmo(nome, time.perf_counter_ns() - inicio)
+    return envolvido
+
+
+def _medir_chamada(metodo: Callable) -> Callable:
+    """
+    No modo de perfil, mede a duração total do método, com os contratos.
+    """
+    nome = metodo.__name__
+
+    @functools.wraps(metodo)
+    def envolvido(self, *args: Any, **kwargs: Any) -> Any:
+        if self.perfil is None:
+            return metodo(self, *args, **kwargs)
+        inicio = time.perf_counter_ns()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            self.perfil.medir_chamada(nome, time.perf_counter_ns() - inicio)
+    return envolvido
+
+
+def _serializada(metodo: Callable) -> Callable:
+    """
+    Em árvores abertas com abrir(), executa o método sob a trava do
+    armazenamento e só depois de soltá-la espera o fsync do registro da
+    operação, para que as threads que esperam formem um commit em grupo.
+    """
+    @functools.wraps(metodo)
+    def envolvido(self, *args: Any, **kwargs: Any) -> Any:
+        armazenamento = self._armazenamento
+        if armazenamento is None:
+            return metodo(self, *args, **kwargs)
+        lsn = 0
+        try:
+            with armazenamento.trava:
+                try:
+                    return metodo(self, *args, **kwargs)
+                finally:
+                    lsn, armazenamento.pendente = armazenamento.pendente, 0
+        finally:
+            if lsn:
+                armazenamento.registro.confirmar(lsn)
+    return envolvido
+
+
+def _serializavel(*nomes: str) -> Callable[[type], type]:
+    """
+    Decorador de classe, aplicado por último, que envolve os métodos
+    indicados com _serializada().
+    """
+    def decorar(cls: type) -> type:
+        for nome in nomes:
+            setattr(cls, nome, _serializada(getattr(cls, nome)))
+        return cls
+    return decorar
+
+
+def _perfilavel(*nomes: str) -> Callable[[type], type]:
+    """
+    Decorador de classe, aplicado depois dos invariantes, que envolve os
+    métodos indicados com _medir_chamada().
+    """
+    def decorar(cls: type) -> type:
+        for nome in nomes:
+            setattr(cls, nome, _medir_chamada(getattr(cls, nome)))
+        return cls
+    return decorar
+
+
+@_serializavel("buscar", "inserir", "remover", "buscar_lote", "inserir_lote",
+                "remover_lote", "rank", "selecionar", "contar_intervalo", "altura",
+                "__len__", "estatisticas", "salvar", "congelar", "reconstruir_filtro",
+                "ponto_de_controle", "sincronizar", "fechar")
+@_perfilavel("buscar", "inserir", "remover")
 @icontract.invariant(
-    lambda self: self._folhas_mesmo_nivel(),
+    lambda self: not self.contratos.ativo() or self._folhas_mesmo_nivel(),
     "Nem todas as folhas estão no mesmo nível da árvore"
 )
 @icontract.invariant(
-    lambda self: all(
-        node.registros == sorted(node.registros)
+    lambda self: not self.contratos.ativo() or all(
+        list(node.registros) == sorted(node.registros)
         for node in self._todos_nos() if not node.folha
     ),
     "Existe um nó interno com chaves fora de ordem crescente"
 )
 @icontract.invariant(
-    lambda self: all(
-        node.registros == sorted(node.registros)
+    lambda self: not self.contratos.ativo() or all(
+        list(node.registros) == sorted(node.registros)
         for node in self._todos_nos() if node.folha
     ),
     "Existe uma folha com valores fora de ordem crescente"
 )
+@icontract.invariant(
+    lambda self: not self.contratos.ativo() or self._tamanhos_ok(),
+    "Existe uma página com tamanho de subárvore inconsistente"
+)
+@icontract.invariant(
+    lambda self: not self.contratos.ativo() or self._estatisticas_ok(),
+    "A altura ou as contagens de chaves e páginas mantidas estão inconsistentes"
+)
 class ArvoreB:
-    def __init__(self, m: int):
+    def __init__(self, m: int, contratos: Optional[str] = None,
+                 amostragem: Optional[int] = None,
+                 tipo_pagina: Callable[[int, bool], Pagina] = Pagina,
+                 tamanhos_subarvore: bool = False, concorrente: bool = False,
+                 instrumentacao: Optional[Instrumentacao] = None,
+                 perfil: Optional[Perfil] = None,
+                 filtro: Optional[FiltroBloom] = None):
         """
         Inicializa uma nova Árvore B.
 
         Args:
             m (int): Grau mínimo da árvore (t), define limites de chaves por página.
+            contratos (Optional[str]): Nível de verificação dos contratos
+                ("completo", "amostrado", "desligado" ou "incremental").
+                Padrão: variável de ambiente ARVOREB_CONTRATOS ou "completo".
+            amostragem (Optional[int]): No modo amostrado, verifica os contratos
+                a cada N operações. Padrão: ARVOREB_AMOSTRAGEM ou 100.
+            tipo_pagina (Callable[[int, bool], Pagina]): Representação das
+                páginas, ex.: Pagina, PaginaCompacta ou PaginaCompactaInt.
+            tamanhos_subarvore (bool): Mantém em cada página o número de chaves
+                da sua subárvore, habilitando rank, selecionar e contar_intervalo.
+            concorrente (bool): Permite o uso por várias threads. Cada página
+                ganha uma trava de leitores/escritor e buscar, inserir e
+                remover descem acoplando as travas (latch crabbing), liberando
+                os ancestrais assim que o filho está preparado. Iterações e
+                intervalos percorrem um instantâneo; as operações em lote,
+                salvar e snapshot seguram a árvore inteira. Exige
+                contratos desligados e não mantém tamanhos de subárvore.
+            instrumentacao (Optional[Instrumentacao]): Contadores de páginas
+                visitadas, comparações, divisões, fusões, empréstimos e
+                variações da raiz. None (padrão) desliga a contagem.
+            perfil (Optional[Perfil]): Histogramas de latência de buscar,
+                inserir e remover, separando algoritmo e contratos. None
+                (padrão) desliga as medições; ver também perfilar().
+            filtro (Optional[FiltroBloom]): Filtro de Bloom mantido a cada
+                inserção, que responde sem descer pela árvore às buscas e
+                às pré-condições de chaves certamente ausentes. É
+                reconstruído quando satura. None (padrão) desliga o filtro.
+
+        Raises:
+            ValueError: Se o modo concorrente for combinado com contratos
+                ligados, com tamanhos de subárvore ou com filtro.
 
         Attributes:
             raiz (Optional[Pagina]): Página raiz da árvore.
             t (int): Grau mínimo.
             min_chaves (int): Número mínimo de chaves (t - 1).
             max_chaves (int): Número máximo de chaves (2*t - 1).
+            contratos (ModoContratos): Controle do nível de verificação.
+            instrumentacao (Optional[Instrumentacao]): Contadores, se ligados.
+            perfil (Optional[Perfil]): Histogramas de latência, se ligados.
+            filtro (Optional[FiltroBloom]): Filtro de chaves ausentes, se ligado.
         """
+        if concorrente:
+            if contratos is None:
+                contratos = DESLIGADO
+            if contratos != DESLIGADO or tamanhos_subarvore:
+                raise ValueError("O modo concorrente exige contratos desligados "
+                                 "e não mantém tamanhos de subárvore")
+            if filtro is not None:
+                raise ValueError("O filtro de Bloom não é suportado no modo concorrente")
+        self.contratos: ModoContratos = ModoContratos(contratos, amostragem)
         self.raiz: Optional[Pagina] = None
         self.t: int = m
         self.min_chaves: int = m - 1
         self.max_chaves: int = 2 * m - 1
+        self.tipo_pagina: Callable[[int, bool], Pagina] = tipo_pagina
+        self.tamanhos_subarvore: bool = tamanhos_subarvore
+        self._tocadas: Optional[Set[Pagina]] = None
+        self._removida: bool = False
+        self._armazenamento: Optional[GerenciadorPaginas] = None
+        self._versao: int = 0
+        self._limite_copia: int = -1
+        self._instantaneos: "weakref.WeakSet[InstantaneoArvoreB]" = weakref.WeakSet()
+        self._trava_arvore: Optional[TravaLeituraEscrita] = \
+            TravaLeituraEscrita() if concorrente else None
+        self._trava_raiz: Optional[threading.Lock] = threading.Lock() if concorrente else None
+        self.instrumentacao: Optional[Instrumentacao] = instrumentacao
+        self.perfil: Optional[Perfil] = perfil
+        self.filtro: Optional[FiltroBloom] = filtro
+        self._altura: Optional[int] = 0
+        self._quantidade: Optional[int] = 0
+        self._paginas: Optional[int] = 0
+        self._raiz_estatisticas: Optional[Pagina] = None
+        self._trava_estatisticas: Optional[threading.Lock] = \
+            threading.Lock() if concorrente else None
+
+    @classmethod
+    def abrir(cls, caminho: str, m: Optional[int] = None,
+              capacidade_paginas: Optional[int] = None,
+              capacidade_bytes: Optional[int] = None, registro_escrita: bool = False,
+              confirmacao_sincrona: bool = True, atraso_grupo: float = 0.0,
+              **opcoes: Any) -> "ArvoreB":
+        """
+        Abre (ou cria) uma árvore cujas páginas ficam em um arquivo.
+
+        Cada página ocupa um slot de tamanho fixo e é lida sob demanda, de
+        modo que cada operação toca apenas as O(log n) páginas do caminho.
+        As páginas decodificadas ficam em um pool de buffers limitado, com
+        escrita adiada até o despejo. Com registro_escrita, as alterações
+        de cada operação vão para um registro de escrita antecipada
+        (`caminho` + "-wal") reaplicado ao abrir, o que torna a árvore
+        resistente a quedas sem gravar páginas a cada chave. As chaves
+        devem ser inteiros de 64 bits. Por percorrerem o arquivo inteiro,
+        os contratos ficam desligados por padrão nesse modo.
+
+        A árvore pode ser compartilhada por várias threads: as operações
+        pontuais e em lote são executadas uma por vez, mas cada uma espera
+        o fsync do registro só depois de liberar a árvore, de modo que as
+        escritas concorrentes são confirmadas juntas por um único fsync.
+        Iterações e intervalos não são serializados e não devem correr
+        junto com escritas. O modo concorrente (latch crabbing) não é
+        suportado.
+
+        Args:
+            caminho (str): Arquivo de páginas.
+            m (Optional[int]): Grau mínimo; obrigatório apenas na criação.
+            capacidade_paginas (Optional[int]): Capacidade do pool em páginas.
+            capacidade_bytes (Optional[int]): Capacidade do pool em bytes.
+            registro_escrita (bool): Ativa o registro de escrita antecipada.
+            confirmacao_sincrona (bool): Se True, cada operação espera o
+                fsync do registro (em grupo); se False, operações recentes
+                podem se perder em uma queda, mas a árvore continua íntegra,
+                e sincronizar() torna duráveis as já concluídas.
+            atraso_grupo (float): Espera do líder do commit em grupo, em segundos.
+            **opcoes (Any): Demais argumentos do construtor (exceto tipo_pagina).
+
+        Returns:
+            ArvoreB: Árvore ligada ao arquivo; deve ser encerrada com fechar().
+        """
+        if opcoes.get("concorrente"):
+            raise ValueError("O modo concorrente não é suportado em árvores abertas com abrir()")
+        arquivo = ArquivoPaginas(caminho, m)
+        registro = None
+        try:
+            if registro_escrita:
+                registro = RegistroEscrita(caminho + "-wal", atraso_grupo)
+            gerenciador = GerenciadorPaginas(arquivo, capacidade_paginas, capacidade_bytes,
+                                             registro, confirmacao_sincrona)
+        except ValueError:
+            if registro is not None:
+                registro.fechar()
+            arquivo.fechar()
+            raise
+        opcoes.setdefault("contratos", os.environ.get(VARIAVEL_NIVEL, DESLIGADO))
+        arvore = cls(arquivo.t, tipo_pagina=gerenciador.nova_pagina, **opcoes)
+        arvore._armazenamento = gerenciador
+        arvore.raiz = gerenciador.raiz()
+        return arvore
+
+    def fechar(self) -> None:
+        """
+        Grava as páginas pendentes e fecha o arquivo de uma árvore aberta
+        com abrir(). A árvore fica vazia e desligada do arquivo.
+        """
+        if self._armazenamento is not None:
+            self._armazenamento.fechar(self.raiz)
+            self._armazenamento = None
+            self.raiz = None
+
+    def ponto_de_controle(self) -> None:
+        """
+        Grava as páginas pendentes de uma árvore aberta com abrir() e, havendo
+        registro de escrita antecipada, o esvazia.
+        """
+        if self._armazenamento is not None:
+            self._armazenamento.ponto_controle()
+
+    def sincronizar(self) -> None:
+        """
+        Torna duráveis as operações já concluídas em uma árvore aberta com
+        abrir(), útil com confirmacao_sincrona=False. Com registro de
+        escrita antecipada, espera o fsync do registro, compartilhado com
+        as threads que estiverem confirmando; sem ele, faz um ponto de
+        controle.
+        """
+        if self._armazenamento is not None:
+            self._armazenamento.sincronizar()
+
+    @_exclusiva
+    def snapshot(self) -> "InstantaneoArvoreB":
+        """
+        Retorna, em O(1), uma visão somente leitura da árvore neste instante.
+
+        O instantâneo passa a compartilhar todas as páginas atuais. A partir
+        daí, cada operação de escrita copia as páginas que alteraria (o
+        caminho da raiz à folha e os irmãos envolvidos em empréstimos,
+        divisões e fusões) antes de modificá-las, de modo que o instantâneo
+        nunca vê alterações nem divisões pela metade. As páginas antigas são
+        liberadas quando o último instantâneo que as referencia é descartado.
+        Deve ser chamado entre operações de escrita.
+
+        Returns:
+            InstantaneoArvoreB: Visão imutável com as operações de leitura.
+
+        Raises:
+            ValueError: Se a árvore tiver sido aberta com abrir().
+        """
+        if self._armazenamento is not None:
+            raise ValueError("Instantâneos não são suportados em árvores abertas com abrir()")
+        instantaneo = InstantaneoArvoreB(self)
+        self._instantaneos.add(instantaneo)
+        self._versao += 1
+        return instantaneo
+
+    def _gravavel(self, pagina: Optional[Pagina]) -> Optional[Pagina]:
+        """
+        Retorna a própria página, se só a árvore a referencia, ou uma cópia
+        dela na versão atual, se algum instantâneo vivo a compartilha.
+
+        Args:
+            pagina (Optional[Pagina]): Página a alterar.
+
+        Returns:
+            Optional[Pagina]: Página que pode ser alterada.
+        """
+        if pagina is None or self._limite_copia < 0 or pagina.versao > self._limite_copia:
+            return pagina
+        copia = self._nova_pagina(pagina.folha)
+        self._ajustar_estatisticas(paginas=-1)  # a cópia substitui a original
+        copia.registros = pagina.registros[:]
+        copia.qtdRegistros = pagina.qtdRegistros
+        copia.tamanho = pagina.tamanho
+        if pagina.paginas is not None:
+            copia.paginas = pagina.paginas[:]
+        return copia
+
+    def _filho(self, pai: Pagina, indice: int) -> Pagina:
+        """
+        Obtém um filho que será alterado, copiando-o se estiver compartilhado
+        com um instantâneo. O pai já deve ser gravável.
+
+        Args:
+            pai (Pagina): Página pai.
+            indice (int): Índice do filho.
+
+        Returns:
+            Pagina: Filho que pode ser alterado.
+        """
+        filho = pai.paginas[indice]
+        if self._limite_copia >= 0 and filho.versao <= self._limite_copia:
+            filho = self._gravavel(filho)
+            pai.paginas[indice] = filho
+        return filho
+
+    def _iniciar_escrita(self) -> None:
+        """
+        Prepara uma operação que altera páginas: avisa o armazenamento, se
+        houver, e torna a raiz gravável se houver instantâneos vivos.
+        """
+        if self._armazenamento is not None:
+            self._armazenamento.iniciar_escrita()
+        self._conferir_raiz()
+        self._limite_copia = max((i.versao for i in self._instantaneos), default=-1)
+        self._substituir_raiz(self._gravavel(self.raiz))
+
+    def _concluir_operacao(self) -> None:
+        """
+        Encerra a operação no armazenamento, gravando as páginas alteradas.
+        """
+        if self._armazenamento is not None:
+            self._armazenamento.concluir(self.raiz)
+
+    def _nova_pagina(self, folha: bool) -> Pagina:
+        """
+        Cria uma página vazia na representação escolhida para a árvore.
+
+        Args:
+            folha (bool): Indica se a página é folha.
+
+        Returns:
+            Pagina: Nova página sem chaves.
+        """
+        pagina = self.tipo_pagina(self.t, folha)
+        self._ajustar_estatisticas(paginas=1)
+        if self._versao:
+            pagina.versao = self._versao
+        if self._trava_arvore is not None:
+            pagina.trava = TravaLeituraEscrita()
+        return pagina
+
+    def _como_registros(self, pagina: Pagina, valores: List[int]):
+        """
+        Cria uma sequência de chaves do mesmo tipo usado pela página.
+
+        Args:
+            pagina (Pagina): Página cujo tipo de registros deve ser mantido.
+            valores (List[int]): Chaves a copiar.
+
+        Returns:
+            Sequência de chaves (lista ou array) com os valores informados.
+        """
+        registros = pagina.registros[:0]
+        registros.extend(valores)
+        return registros
+
+    def _recalcular_tamanho(self, pagina: Pagina) -> None:
+        """
+        Recalcula o tamanho da subárvore a partir dos filhos, se mantido.
+
+        Args:
+            pagina (Pagina): Página cujos filhos já têm tamanho correto.
+        """
+        if not self.tamanhos_subarvore:
+            return
+        pagina.tamanho = pagina.qtdRegistros
+        if not pagina.folha:
+            for filho in pagina.paginas[: pagina.qtdRegistros + 1]:
+                pagina.tamanho += filho.tamanho
+
+    def _tocar(self, *paginas: Pagina) -> None:
+        """
+        Registra páginas modificadas pela operação corrente (modo incremental).
+
+        Args:
+            *paginas (Pagina): Páginas alteradas.
+        """
+        if self._tocadas is not None:
+            self._tocadas.update(paginas)
+
+    def _contar(self, evento: str, quantidade: int = 1) -> None:
+        """
+        Registra um evento estrutural, se a instrumentação estiver ligada.
+
+        Args:
+            evento (str): Nome do evento (ver Instrumentacao).
+            quantidade (int): Ocorrências.
+        """
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar(evento, quantidade)
+
+    def _descartar(self, pagina: Pagina) -> None:
+        """
+        Remove do registro de páginas tocadas, e libera do armazenamento,
+        uma página que deixou de fazer parte da árvore.
+
+        Args:
+            pagina (Pagina): Página descartada por fusão ou colapso da raiz.
+        """
+        if self._tocadas is not None:
+            self._tocadas.discard(pagina)
+        if self._armazenamento is not None:
+            self._armazenamento.liberar(pagina)
+        self._ajustar_estatisticas(paginas=-1)
+
+    def _ajustar_estatisticas(self, chaves: int = 0, paginas: int = 0) -> None:
+        """
+        Soma variações às contagens de chaves e de páginas, se já conhecidas.
+
+        Args:
+            chaves (int): Variação do número de chaves.
+            paginas (int): Variação do número de páginas.
+        """
+        if self._quantidade is None:
+            return
+        if self._trava_estatisticas is None:
+            self._quantidade += chaves
+            self._paginas += paginas
+            return
+        with self._trava_estatisticas:
+            self._quantidade += chaves
+            self._paginas += paginas
+
+    def _substituir_raiz(self, pagina: Optional[Pagina], variacao: int = 0) -> None:
+        """
+        Troca a raiz dentro de uma operação, ajustando a altura mantida.
+
+        Args:
+            pagina (Optional[Pagina]): Nova raiz.
+            variacao (int): Variação da altura, ex.: +1 na divisão da raiz
+                e -1 no recolhimento.
+        """
+        self.raiz = pagina
+        self._raiz_estatisticas = pagina
+        if pagina is None:
+            self._altura = 0
+        elif self._altura is not None:
+            self._altura += variacao
+
+    def _conferir_raiz(self) -> None:
+        """
+        Descarta a altura e as contagens mantidas se a raiz foi trocada fora
+        das operações (árvore aberta com abrir() ou montada à mão); elas
+        passam a ser recalculadas sob demanda, e o filtro, se houver, é
+        reconstruído. No modo concorrente a raiz
+        só muda dentro das operações, e a conferência é dispensada.
+        """
+        if self._trava_arvore is None and self.raiz is not self._raiz_estatisticas:
+            self._raiz_estatisticas = self.raiz
+            self._altura = self._quantidade = self._paginas = None
+            if self.filtro is not None:
+                self._reconstruir_filtro()
+
+    def _altura_atual(self) -> int:
+        """
+        Retorna a altura mantida, calculando-a uma vez se for desconhecida.
+
+        Returns:
+            int: Altura atual.
+        """
+        self._conferir_raiz()
+        if self._altura is None:
+            self._altura = self._altura_interna()
+        return self._altura
+
+    def _carregar_estatisticas(self) -> None:
+        """
+        Conta chaves e páginas percorrendo a árvore, quando as contagens são
+        desconhecidas. Depois disso, elas são mantidas a cada operação.
+        """
+        self._conferir_raiz()
+        if self._quantidade is None:
+            paginas = self._todos_nos()
+            self._paginas = len(paginas)
+            self._quantidade = sum(pagina.qtdRegistros for pagina in paginas)
+
+    def _estatisticas_ok(self) -> bool:
+        """
+        Confere a altura, a quantidade de chaves e a de páginas mantidas
+        pela árvore, quando conhecidas, com as obtidas percorrendo todas as
+        páginas.
+
+        Returns:
+            bool: True se as estatísticas mantidas estão corretas.
+        """
+        self._conferir_raiz()
+        if self._altura is not None and self._altura != self._altura_interna():
+            return False
+        if self._quantidade is None:
+            return True
+        paginas = self._todos_nos()
+        return (self._paginas == len(paginas)
+                and self._quantidade == sum(pagina.qtdRegistros for pagina in paginas))
+
+    def _contem(self, chave: int) -> bool:
+        """
+        Indica se a chave está na árvore, consultando antes o filtro, se
+        houver, para dispensar a descida quando ela certamente não está.
+
+        Args:
+            chave (int): Valor procurado.
+
+        Returns:
+            bool: True se a chave está na árvore.
+        """
+        if self.filtro is not None:
+            self._conferir_raiz()
+            if chave not in self.filtro:
+                return False
+        return self._buscar_em_pagina(self.raiz, chave) is not None
+
+    def _adicionar_ao_filtro(self, chaves: Iterable[int]) -> None:
+        """
+        Marca chaves inseridas no filtro, reconstruindo-o se saturar.
+
+        Args:
+            chaves (Iterable[int]): Chaves inseridas pela operação.
+        """
+        for chave in chaves:
+            self.filtro.adicionar(chave)
+        if self.filtro.saturado():
+            self._reconstruir_filtro()
+
+    def _reconstruir_filtro(self) -> None:
+        """
+        Refaz o filtro com as chaves atuais, descartando as removidas, com
+        capacidade para ao menos o dobro delas.
+        """
+        self._carregar_estatisticas()
+        self.filtro.limpar(max(self.filtro.capacidade, 2 * self._quantidade))
+        for chave in self._percorrer_intervalo(None, None):
+            self.filtro.adicionar(chave)
+
+    def reconstruir_filtro(self) -> None:
+        """
+        Reconstrói o filtro de Bloom a partir das chaves da árvore, o que
+        elimina os falsos positivos deixados por chaves removidas. É feito
+        automaticamente quando o filtro satura; sem filtro, não faz nada.
+        """
+        if self.filtro is not None:
+            self._reconstruir_filtro()
+
+    def _iniciar_registro_tocadas(self) -> None:
+        """
+        Reinicia o registro de páginas tocadas, se o modo incremental estiver ativo.
+        """
+        self._tocadas = set() if self.contratos.incremental else None
 
     def _altura_interna(self) -> int:
         """
-        Calcula recursivamente a altura da árvore.
+        Calcula a altura da árvore descendo pelo primeiro filho.
 
         Returns:
             int: Altura total (níveis) da árvore.
         """
-        def _h(node: Optional[Pagina]) -> int:
-            if node is None:
-                return 0
-            if node.folha:
-                return 1
-            return 1 + _h(node.paginas[0])
-        return _h(self.raiz)
+        altura = 0
+        node = self.raiz
+        while node is not None:
+            altura += 1
+            node = None if node.folha else node.paginas[0]
+        return altura
 
     def _todos_nos(self) -> List[Pagina]:
         """
@@ -63,14 +661,14 @@ class ArvoreB:
             List[Pagina]: Lista de todas as páginas.
         """
         resultado: List[Pagina] = []
-        def _coletar(node: Optional[Pagina]) -> None:
+        pilha: List[Optional[Pagina]] = [self.raiz]
+        while pilha:
+            node = pilha.pop()
             if node is None:
-                return
+                continue
             resultado.append(node)
             if not node.folha:
-                for filho in node.paginas[: node.qtdRegistros + 1]:
-                    _coletar(filho)
-        _coletar(self.raiz)
+                pilha.extend(reversed(node.paginas[: node.qtdRegistros + 1]))
         return resultado
 
     def _folhas_mesmo_nivel(self) -> bool:
@@ -82,16 +680,16 @@ class ArvoreB:
         """
         if self.raiz is None:
             return True
-        niveis: List[int] = []
-        def _percorrer(node: Pagina, profundidade: int) -> None:
+        niveis: Set[int] = set()
+        pilha: List[Tuple[Pagina, int]] = [(self.raiz, 1)]
+        while pilha:
+            node, profundidade = pilha.pop()
             if node.folha:
-                niveis.append(profundidade)
+                niveis.add(profundidade)
             else:
-                for filho in node.paginas[: node.qtdRegistros + 1]:
-                    if filho:
-                        _percorrer(filho, profundidade + 1)
-        _percorrer(self.raiz, 1)
-        return len(set(niveis)) == 1
+                pilha.extend((filho, profundidade + 1)
+                             for filho in node.paginas[: node.qtdRegistros + 1] if filho)
+        return len(niveis) == 1
 
     def _limites_chaves_ok(self) -> bool:
         """
@@ -132,15 +730,325 @@ class ArvoreB:
                     return False
         return True
 
+    def _tamanhos_ok(self) -> bool:
+        """
+        Verifica se o tamanho de cada subárvore corresponde às suas chaves.
+
+        Returns:
+            bool: True se os tamanhos estiverem corretos ou não forem mantidos.
+        """
+        if not self.tamanhos_subarvore:
+            return True
+        for no in self._todos_nos():
+            esperado = no.qtdRegistros
+            if not no.folha:
+                esperado += sum(f.tamanho for f in no.paginas[: no.qtdRegistros + 1])
+            if no.tamanho != esperado:
+                return False
+        return True
+
+    def _paginas_tocadas_ok(self) -> bool:
+        """
+        Verifica ordem e limites apenas nas páginas tocadas pela última operação:
+
+          - chaves em ordem estritamente crescente;
+          - limites de chaves (raiz e demais páginas);
+          - limites de filhos e nível homogêneo dos filhos, para internas;
+          - chaves separadoras do pai coerentes com os extremos de cada filho.
+
+        Returns:
+            bool: True se todas as páginas tocadas estiverem consistentes.
+        """
+        for no in self._tocadas or ():
+            n = no.qtdRegistros
+            registros = no.registros
+            if len(registros) != n:
+                return False
+            if any(registros[i] >= registros[i + 1] for i in range(n - 1)):
+                return False
+            minimo, maximo = ((1, self.max_chaves) if no is self.raiz
+                              else (self.min_chaves, self.max_chaves))
+            if not (minimo <= n <= maximo):
+                return False
+            if no.folha:
+                if self.tamanhos_subarvore and no.tamanho != n:
+                    return False
+                continue
+            filhos = no.paginas[: n + 1]
+            minimo = 2 if no is self.raiz else self.t
+            if len(filhos) < minimo or any(f is None for f in filhos):
+                return False
+            folha = filhos[0].folha
+            for i, filho in enumerate(filhos):
+                if filho.folha != folha or filho.qtdRegistros == 0:
+                    return False
+                if i > 0 and filho.registros[0] <= registros[i - 1]:
+                    return False
+                if i < n and filho.registros[filho.qtdRegistros - 1] >= registros[i]:
+                    return False
+            if self.tamanhos_subarvore and no.tamanho != n + sum(f.tamanho for f in filhos):
+                return False
+        return True
+
+    @classmethod
+    def de_ordenados(cls, chaves: Iterable[int], m: int,
+                     fator_preenchimento: float = 1.0, **opcoes: Any) -> "ArvoreB":
+        """
+        Constrói uma árvore de baixo para cima a partir de chaves ordenadas.
+
+        As páginas são preenchidas nível a nível em uma única passada, sem
+        buscas nem divisões, em O(n) e com memória extra O(altura). Ao final,
+        a borda direita é ajustada para respeitar o mínimo de chaves.
+
+        Args:
+            chaves (Iterable[int]): Chaves em ordem estritamente crescente.
+            m (int): Grau mínimo da árvore.
+            fator_preenchimento (float): Fração de max_chaves ocupada em cada
+                página completa, limitada ao intervalo [min_chaves, max_chaves].
+            **opcoes (Any): Demais argumentos repassados ao construtor.
+
+        Returns:
+            ArvoreB: Árvore contendo todas as chaves.
+
+        Raises:
+            ValueError: Se as chaves não estiverem em ordem estritamente crescente.
+        """
+        arvore = cls(m, **opcoes)
+        arvore._carregar_ordenados(chaves, fator_preenchimento)
+        return arvore
+
+    def _carregar_ordenados(self, chaves: Iterable[int], fator_preenchimento: float) -> None:
+        """
+        Preenche a árvore vazia com chaves ordenadas, nível a nível.
+
+        Args:
+            chaves (Iterable[int]): Chaves em ordem estritamente crescente.
+            fator_preenchimento (float): Fração de max_chaves por página.
+        """
+        alvo = round(fator_preenchimento * self.max_chaves)
+        alvo = max(self.min_chaves, 1, min(self.max_chaves, alvo))
+        niveis: List[Pagina] = [self._nova_pagina(True)]
+        anterior: Any = None
+        quantidade = 0
+        for chave in chaves:
+            if quantidade and not anterior < chave:
+                raise ValueError("As chaves devem estar em ordem estritamente crescente")
+            anterior = chave
+            quantidade += 1
+            folha = niveis[0]
+            if folha.qtdRegistros < alvo:
+                folha.registros.append(chave)
+                folha.qtdRegistros += 1
+            else:
+                self._recalcular_tamanho(folha)
+                self._promover_carga(niveis, 1, folha, chave, alvo)
+                niveis[0] = self._nova_pagina(True)
+
+        filho = niveis[0]
+        self._recalcular_tamanho(filho)
+        for pagina in niveis[1:]:
+            pagina.paginas.append(filho)
+            self._recalcular_tamanho(pagina)
+            filho = pagina
+        self._substituir_raiz(filho, len(niveis))
+        self._ajustar_estatisticas(chaves=quantidade)
+        self._ajustar_borda_direita()
+        if self.filtro is not None:
+            self._reconstruir_filtro()
+
+    def _promover_carga(self, niveis: List[Pagina], nivel: int, filho: Pagina,
+                        separador: int, alvo: int) -> None:
+        """
+        Anexa uma página completa e a chave seguinte ao nível de cima.
+
+        Args:
+            niveis (List[Pagina]): Página em construção de cada nível.
+            nivel (int): Nível que recebe o filho.
+            filho (Pagina): Página completa do nível de baixo.
+            separador (int): Chave que separa o filho da próxima página.
+            alvo (int): Quantidade de chaves de uma página completa.
+        """
+        if nivel == len(niveis):
+            niveis.append(self._nova_pagina(False))
+            niveis[nivel].paginas = []
+        pagina = niveis[nivel]
+        pagina.paginas.append(filho)
+        if pagina.qtdRegistros < alvo:
+            pagina.registros.append(separador)
+            pagina.qtdRegistros += 1
+            return
+        self._recalcular_tamanho(pagina)
+        self._promover_carga(niveis, nivel + 1, pagina, separador, alvo)
+        niveis[nivel] = self._nova_pagina(False)
+        niveis[nivel].paginas = []
+
+    def _ajustar_borda_direita(self) -> None:
+        """
+        Corrige as páginas incompletas da borda direita após a carga em lote.
+
+        Desce pela borda garantindo t chaves em cada filho interno (e o mínimo
+        nas folhas), por empréstimo do irmão anterior ou por fusão com ele,
+        de modo que uma fusão abaixo nunca deixe o pai abaixo do mínimo.
+        """
+        self._recolher_raiz()
+        pagina = self.raiz
+        while pagina is not None and not pagina.folha:
+            idx = pagina.qtdRegistros
+            filho = pagina.paginas[idx]
+            necessario = self.min_chaves if filho.folha else self.t
+            if filho.qtdRegistros < necessario:
+                irmao = pagina.paginas[idx - 1]
+                if irmao.qtdRegistros + 1 + filho.qtdRegistros <= self.max_chaves:
+                    self._fundir_paginas(pagina, idx - 1)
+                    filho = irmao
+                    self._recolher_raiz()
+                else:
+                    for _ in range(necessario - filho.qtdRegistros):
+                        self._emprestar_de_anterior(pagina, idx)
+            pagina = filho
+
+    @_exclusiva
+    def salvar(self, caminho: str) -> None:
+        """
+        Grava uma imagem binária compacta de todas as páginas da árvore.
+
+        Args:
+            caminho (str): Arquivo de destino.
+        """
+        folhas = bytearray()
+        quantidades = array("I")
+        chaves: List[Any] = []
+        fila: List[Pagina] = [] if self.raiz is None else [self.raiz]
+        for pagina in fila:
+            folhas.append(1 if pagina.folha else 0)
+            quantidades.append(pagina.qtdRegistros)
+            chaves.extend(pagina.registros[: pagina.qtdRegistros])
+            if not pagina.folha:
+                fila.extend(pagina.paginas[: pagina.qtdRegistros + 1])
+        gravar_imagem(caminho, self.t, bytes(folhas), quantidades, chaves)
+
+    @_exclusiva
+    def congelar(self) -> ArvoreBCongelada:
+        """
+        Compila a árvore em uma cópia somente leitura em vetores contíguos,
+        sem um objeto por página, para árvores construídas uma vez e depois
+        apenas consultadas. A cópia oferece buscar, intervalo e rank e pode
+        ser gravada com salvar() e mapeada de volta com
+        ArvoreBCongelada.abrir(), sem cópia. Alterações posteriores nesta
+        árvore não se refletem na cópia.
+
+        Returns:
+            ArvoreBCongelada: Cópia congelada da árvore.
+
+        Raises:
+            ValueError: Se alguma chave não for um inteiro de 64 bits.
+        """
+        return ArvoreBCongelada.compilar(self.raiz, self.t)
+
+    @classmethod
+    def carregar(cls, caminho: str, **opcoes: Any) -> "ArvoreB":
+        """
+        Reconstrói uma árvore a partir de uma imagem gravada por salvar().
+
+        As páginas são recriadas em uma única passada em ordem de nível,
+        copiando as chaves de cada página de uma fatia do buffer lido, sem
+        buscas, divisões nem laço por chave.
+
+        Args:
+            caminho (str): Arquivo de origem.
+            **opcoes (Any): Demais argumentos do construtor (o grau vem da imagem).
+
+        Returns:
+            ArvoreB: Árvore com as mesmas páginas da árvore salva.
+
+        Raises:
+            ValueError: Se o arquivo não for uma imagem válida.
+        """
+        t, folhas, quantidades, chaves = ler_imagem(caminho)
+        arvore = cls(t, **opcoes)
+        arvore._montar_imagem(folhas, quantidades, chaves)
+        return arvore
+
+    def _montar_imagem(self, folhas: bytes, quantidades: array, chaves: Any) -> None:
+        """
+        Cria as páginas descritas por uma imagem e as liga em ordem de nível.
+
+        Args:
+            folhas (bytes): Indicador de folha por página.
+            quantidades (array): Quantidade de chaves por página.
+            chaves (Any): Chaves concatenadas (array('q') ou lista).
+
+        Raises:
+            ValueError: Se a imagem não descrever uma árvore consistente.
+        """
+        paginas: List[Pagina] = []
+        posicao = 0
+        for folha, quantidade in zip(folhas, quantidades):
+            pagina = self._nova_pagina(bool(folha))
+            if isinstance(chaves, array) and not isinstance(pagina.registros, array):
+                chaves = chaves.tolist()
+            pagina.registros = self._como_registros(pagina, chaves[posicao:posicao + quantidade])
+            pagina.qtdRegistros = quantidade
+            posicao += quantidade
+            paginas.append(pagina)
+        proximo = 1
+        for pagina in paginas:
+            if not pagina.folha:
+                pagina.paginas = paginas[proximo:proximo + pagina.qtdRegistros + 1]
+                proximo += pagina.qtdRegistros + 1
+        if posicao != len(chaves) or (paginas and proximo != len(paginas)):
+            raise ValueError("A imagem não descreve uma Árvore B consistente")
+        for pagina in reversed(paginas):
+            self._recalcular_tamanho(pagina)
+        self._substituir_raiz(paginas[0] if paginas else None)
+        self._altura = self._altura_interna()
+        self._ajustar_estatisticas(chaves=posicao)
+        if self.filtro is not None:
+            self._reconstruir_filtro()
+
     def altura(self) -> int:
         """
-        Retorna a altura da árvore.
+        Retorna a altura da árvore, mantida a cada divisão ou recolhimento
+        da raiz, em O(1).
 
         Returns:
             int: Altura atual.
         """
-        return self._altura_interna()
+        return self._altura_atual()
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de chaves da árvore, mantido a cada operação, em O(1).
+
+        Returns:
+            int: Quantidade de chaves.
+        """
+        self._carregar_estatisticas()
+        return self._quantidade
 
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna, em O(1), as estatísticas mantidas pela árvore, para
+        consultas frequentes como as de painéis de monitoramento.
+
+        Em árvores abertas com abrir(), a primeira chamada (ou a primeira
+        de len()) percorre o arquivo para contar chaves e páginas.
+
+        Returns:
+            Dict[str, Any]: "chaves", "altura", "paginas" e
+            "preenchimento_medio", a fração média de max_chaves ocupada
+            em cada página (0.0 na árvore vazia).
+        """
+        self._carregar_estatisticas()
+        chaves, paginas = self._quantidade, self._paginas
+        return {
+            "chaves": chaves,
+            "altura": self._altura_atual(),
+            "paginas": paginas,
+            "preenchimento_medio": chaves / (paginas * self.max_chaves) if paginas else 0.0,
+        }
+
+    @_medir_algoritmo
     def buscar(self, chave: int) -> Optional[int]:
         """
         Busca uma chave na árvore B.
@@ -151,48 +1059,431 @@ class ArvoreB:
         Returns:
             Optional[int]: A chave se encontrada, ou None caso contrário.
         """
-        return self._buscar_em_pagina(self.raiz, chave)
+        if self._trava_arvore is not None:
+            return self._buscar_concorrente(chave)
+        self.contratos.registrar_operacao()
+        if self.filtro is not None:
+            self._conferir_raiz()
+            if chave not in self.filtro:
+                self.filtro.negativas += 1
+                self._concluir_operacao()
+                return None
+        if self.instrumentacao is None:
+            resultado = self._buscar_em_pagina(self.raiz, chave)
+        else:
+            resultado = self._buscar_contando(chave)
+        if self.filtro is not None and resultado is None:
+            self.filtro.falsos_positivos += 1
+        self._concluir_operacao()
+        return resultado
+
+    def _buscar_contando(self, chave: int) -> Optional[int]:
+        """
+        Busca como _buscar_em_pagina, registrando na instrumentação as
+        páginas visitadas e as comparações feitas.
+
+        Args:
+            chave (int): Valor buscado.
+
+        Returns:
+            Optional[int]: A chave se encontrada, ou None.
+        """
+        visitadas = comparacoes = 0
+        resultado = None
+        pagina = self.raiz
+        while pagina is not None:
+            visitadas += 1
+            n = pagina.qtdRegistros
+            i = bisect_left(pagina.registros, chave, 0, n)
+            comparacoes += n.bit_length()
+            if i < n:
+                comparacoes += 1
+                if chave == pagina.registros[i]:
+                    resultado = pagina.registros[i]
+                    break
+            pagina = None if pagina.folha else pagina.paginas[i]
+        self.instrumentacao.registrar("buscas")
+        self.instrumentacao.registrar("paginas_visitadas", visitadas)
+        self.instrumentacao.registrar("comparacoes", comparacoes)
+        return resultado
 
     def _buscar_em_pagina(self, pagina: Optional[Pagina], chave: int) -> Optional[int]:
         """
-        Busca recursivamente em uma página.
+        Busca a partir de uma página, descendo em laço até a folha.
 
         Args:
-            pagina (Optional[Pagina]): Página atual de busca.
+            pagina (Optional[Pagina]): Página onde a busca começa.
             chave (int): Valor buscado.
 
         Returns:
             Optional[int]: A chave se encontrada, ou None.
         """
-        if pagina is None:
-            return None
-        i = 0
-        while i < pagina.qtdRegistros and chave > pagina.registros[i]:
-            i += 1
-        if i < pagina.qtdRegistros and chave == pagina.registros[i]:
-            return pagina.registros[i]
-        if pagina.folha:
-            return None
-        return self._buscar_em_pagina(pagina.paginas[i], chave)
+        while pagina is not None:
+            i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+            if i < pagina.qtdRegistros and chave == pagina.registros[i]:
+                return pagina.registros[i]
+            if pagina.folha:
+                return None
+            pagina = pagina.paginas[i]
+        return None
+
+    def buscar_lote(self, chaves: Any, posicoes: bool = False) -> Any:
+        """
+        Busca um vetor de chaves de uma vez, com NumPy.
+
+        As consultas são ordenadas uma única vez e descem juntas, nível a
+        nível: em cada página, np.searchsorted localiza as chaves da página
+        entre as consultas, marcando as encontradas e repartindo as demais
+        em fatias contíguas, uma por filho. O custo em Python é por página
+        visitada, e não por consulta. Requer NumPy.
+
+        Args:
+            chaves (Any): Vetor (np.ndarray ou sequência) de chaves, em
+                qualquer ordem e com repetições.
+            posicoes (bool): Se True, retorna a posição de cada chave na
+                ordem crescente (como rank), ou -1 se ausente. Exige
+                tamanhos_subarvore.
+
+        Returns:
+            np.ndarray: Máscara booleana, na ordem das consultas, indicando
+            as chaves presentes; ou, com posicoes, um vetor int64.
+
+        Raises:
+            ValueError: Se posicoes for pedido sem tamanhos de subárvore.
+        """
+        import numpy as np
+
+        if posicoes:
+            self._exigir_tamanhos()
+        self.contratos.registrar_operacao()
+        consultas = np.asarray(chaves).ravel()
+        ordem = np.argsort(consultas, kind="stable")
+        ordenadas = consultas[ordem]
+        if posicoes:
+            resultado = np.full(len(consultas), -1, dtype=np.int64)
+        else:
+            resultado = np.zeros(len(consultas), dtype=bool)
+        arvore = self._leitura_estavel()
+        pilha: List[Tuple[Pagina, int, int, int]] = []
+        if arvore.raiz is not None and len(consultas):
+            pilha.append((arvore.raiz, 0, len(consultas), 0))
+        while pilha:
+            pagina, inicio, fim, base = pilha.pop()
+            n = pagina.qtdRegistros
+            if isinstance(pagina.registros, array):
+                registros = np.frombuffer(pagina.registros, dtype=np.int64, count=n)
+            else:
+                registros = np.array(pagina.registros[:n])
+            fatia = ordenadas[inicio:fim]
+            esquerda = np.searchsorted(fatia, registros, "left") + inicio
+            direita = np.searchsorted(fatia, registros, "right") + inicio
+            if posicoes:
+                deslocamentos = base + np.arange(n)
+                if not pagina.folha:
+                    deslocamentos += np.cumsum([f.tamanho for f in pagina.paginas[:n]])
+            for i in np.flatnonzero(direita > esquerda):
+                resultado[ordem[esquerda[i]:direita[i]]] = deslocamentos[i] if posicoes else True
+            if pagina.folha:
+                continue
+            limites = [inicio, *direita.tolist()]
+            finais = [*esquerda.tolist(), fim]
+            base_filho = base
+            for i, filho in enumerate(pagina.paginas[:n + 1]):
+                if finais[i] > limites[i]:
+                    pilha.append((filho, limites[i], finais[i], base_filho))
+                if posicoes:
+                    base_filho += filho.tamanho + 1
+        self._concluir_operacao()
+        return resultado
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Percorre todas as chaves em ordem crescente.
+
+        Returns:
+            Iterator[int]: Gerador das chaves.
+        """
+        return self._leitura_estavel()._percorrer_intervalo(None, None)
+
+    def __reversed__(self) -> Iterator[int]:
+        """
+        Percorre todas as chaves em ordem decrescente.
+
+        Returns:
+            Iterator[int]: Gerador das chaves.
+        """
+        return self._leitura_estavel()._percorrer_intervalo_reverso(None, None)
+
+    def intervalo(self, inicio: Optional[int] = None,
+                  fim: Optional[int] = None) -> Iterator[int]:
+        """
+        Percorre em ordem crescente as chaves em [inicio, fim].
+
+        O posicionamento no limite inferior custa O(log n); as chaves seguintes
+        são produzidas sob demanda, com memória extra proporcional à altura.
+        A árvore não deve ser modificada enquanto o gerador estiver em uso.
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo (None: sem limite).
+            fim (Optional[int]): Limite superior inclusivo (None: sem limite).
+
+        Returns:
+            Iterator[int]: Gerador das chaves no intervalo.
+        """
+        return self._leitura_estavel()._percorrer_intervalo(inicio, fim)
+
+    def intervalo_reverso(self, inicio: Optional[int] = None,
+                          fim: Optional[int] = None) -> Iterator[int]:
+        """
+        Percorre em ordem decrescente as chaves em [inicio, fim].
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo (None: sem limite).
+            fim (Optional[int]): Limite superior inclusivo (None: sem limite).
+
+        Returns:
+            Iterator[int]: Gerador das chaves no intervalo, da maior para a menor.
+        """
+        return self._leitura_estavel()._percorrer_intervalo_reverso(inicio, fim)
+
+    def _leitura_estavel(self) -> "ArvoreB":
+        """
+        Retorna a árvore a ser percorrida por uma leitura longa: no modo
+        concorrente, um instantâneo, para que a varredura não bloqueie nem
+        seja afetada pelos escritores.
+
+        Returns:
+            ArvoreB: A própria árvore ou um instantâneo dela.
+        """
+        if self._trava_arvore is not None:
+            return self.snapshot()
+        return self
+
+    def _percorrer_intervalo(self, inicio: Optional[int],
+                             fim: Optional[int]) -> Iterator[int]:
+        """
+        Gera as chaves em ordem crescente usando uma pilha explícita
+        de (página, próximo índice), uma entrada por nível.
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo.
+            fim (Optional[int]): Limite superior inclusivo.
+
+        Yields:
+            int: Próxima chave do intervalo.
+        """
+        pilha: List[List[Any]] = []
+        pagina = self.raiz
+        while pagina is not None:
+            i = 0 if inicio is None else bisect_left(pagina.registros, inicio,
+                                                     0, pagina.qtdRegistros)
+            pilha.append([pagina, i])
+            pagina = None if pagina.folha else pagina.paginas[i]
+
+        while pilha:
+            topo = pilha[-1]
+            pagina, i = topo
+            if pagina.folha:
+                pilha.pop()
+                for chave in pagina.registros[i:pagina.qtdRegistros]:
+                    if fim is not None and chave > fim:
+                        return
+                    yield chave
+                continue
+            if i == pagina.qtdRegistros:
+                pilha.pop()
+                continue
+            chave = pagina.registros[i]
+            if fim is not None and chave > fim:
+                return
+            yield chave
+            topo[1] = i + 1
+            filho = pagina.paginas[i + 1]
+            while filho is not None:
+                pilha.append([filho, 0])
+                filho = None if filho.folha else filho.paginas[0]
+
+    def _percorrer_intervalo_reverso(self, inicio: Optional[int],
+                                     fim: Optional[int]) -> Iterator[int]:
+        """
+        Gera as chaves em ordem decrescente; cada entrada da pilha guarda
+        a página e o índice do filho que está sendo percorrido.
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo.
+            fim (Optional[int]): Limite superior inclusivo.
+
+        Yields:
+            int: Próxima chave do intervalo, da maior para a menor.
+        """
+        pilha: List[List[Any]] = []
+        pagina = self.raiz
+        while pagina is not None:
+            i = (pagina.qtdRegistros if fim is None
+                 else bisect_right(pagina.registros, fim, 0, pagina.qtdRegistros))
+            pilha.append([pagina, i])
+            pagina = None if pagina.folha else pagina.paginas[i]
+
+        while pilha:
+            topo = pilha[-1]
+            pagina, i = topo
+            if pagina.folha:
+                pilha.pop()
+                for chave in reversed(pagina.registros[:i]):
+                    if inicio is not None and chave < inicio:
+                        return
+                    yield chave
+                continue
+            if i == 0:
+                pilha.pop()
+                continue
+            chave = pagina.registros[i - 1]
+            if inicio is not None and chave < inicio:
+                return
+            yield chave
+            topo[1] = i - 1
+            filho = pagina.paginas[i - 1]
+            while filho is not None:
+                pilha.append([filho, filho.qtdRegistros])
+                filho = None if filho.folha else filho.paginas[filho.qtdRegistros]
+
+    def _exigir_tamanhos(self) -> None:
+        """
+        Garante que a árvore mantém os tamanhos de subárvore.
+
+        Raises:
+            ValueError: Se a árvore foi criada sem tamanhos_subarvore.
+        """
+        if not self.tamanhos_subarvore:
+            raise ValueError("Operação requer ArvoreB(..., tamanhos_subarvore=True)")
+
+    def _exigir_chaves_gravaveis(self, chaves: Iterable[int]) -> None:
+        """
+        Em árvores abertas com abrir(), garante que as chaves cabem no
+        formato das páginas, antes que a operação altere qualquer página.
+
+        Args:
+            chaves (Iterable[int]): Chaves a inserir.
+
+        Raises:
+            ValueError: Se alguma chave não for um inteiro de 64 bits.
+        """
+        if self._armazenamento is None:
+            return
+        try:
+            array("q", chaves)
+        except (TypeError, OverflowError):
+            raise ValueError("A árvore em arquivo aceita apenas chaves inteiras de 64 bits")
+
+    def _contar_menores(self, chave: int, inclusive: bool) -> int:
+        """
+        Conta as chaves menores (ou menores ou iguais) que a chave dada.
+
+        Args:
+            chave (int): Chave de referência.
+            inclusive (bool): Se True, conta também a própria chave.
+
+        Returns:
+            int: Quantidade de chaves na árvore abaixo da referência.
+        """
+        localizar = bisect_right if inclusive else bisect_left
+        total = 0
+        pagina = self.raiz
+        while pagina is not None:
+            i = localizar(pagina.registros, chave, 0, pagina.qtdRegistros)
+            total += i
+            if pagina.folha:
+                break
+            for filho in pagina.paginas[:i]:
+                total += filho.tamanho
+            pagina = pagina.paginas[i]
+        return total
+
+    def rank(self, chave: int) -> int:
+        """
+        Retorna quantas chaves da árvore são menores que a chave dada.
+
+        Custa O(t·log n) usando os tamanhos de subárvore.
+
+        Args:
+            chave (int): Chave de referência (não precisa existir).
+
+        Returns:
+            int: Posição que a chave ocupa (ou ocuparia) na ordem crescente.
+        """
+        self._exigir_tamanhos()
+        return self._contar_menores(chave, False)
+
+    def selecionar(self, k: int) -> int:
+        """
+        Retorna a k-ésima menor chave, contando a partir de zero.
+
+        Args:
+            k (int): Posição na ordem crescente.
+
+        Returns:
+            int: Chave na posição k.
+
+        Raises:
+            IndexError: Se k estiver fora do intervalo [0, quantidade de chaves).
+        """
+        self._exigir_tamanhos()
+        if self.raiz is None or not 0 <= k < self.raiz.tamanho:
+            raise IndexError("Posição fora do intervalo da árvore")
+        pagina = self.raiz
+        while not pagina.folha:
+            for i in range(pagina.qtdRegistros + 1):
+                filho = pagina.paginas[i]
+                if k < filho.tamanho:
+                    break
+                k -= filho.tamanho
+                if k == 0 and i < pagina.qtdRegistros:
+                    return pagina.registros[i]
+                k -= 1
+            pagina = filho
+        return pagina.registros[k]
+
+    def contar_intervalo(self, inicio: int, fim: int) -> int:
+        """
+        Conta as chaves no intervalo fechado [inicio, fim] em O(t·log n).
+
+        Args:
+            inicio (int): Limite inferior inclusivo.
+            fim (int): Limite superior inclusivo.
+
+        Returns:
+            int: Quantidade de chaves no intervalo.
+        """
+        self._exigir_tamanhos()
+        if fim < inicio:
+            return 0
+        return self._contar_menores(fim, True) - self._contar_menores(inicio, False)
 
     @icontract.require(
-        lambda self, chave: self.buscar(chave) is None,
+        lambda self, chave: not self.contratos.local()
+                            or not self._contem(chave),
         "Chave já existe na árvore; duplicatas não são permitidas"
     )
     @icontract.ensure(
-        lambda self: self._limites_chaves_ok(),
+        lambda self: not self.contratos.ativo() or self._limites_chaves_ok(),
         "Após inserção, cada página deve respeitar limites de chaves"
     )
     @icontract.ensure(
-        lambda self: self._limites_filhos_ok(),
+        lambda self: not self.contratos.ativo() or self._limites_filhos_ok(),
         "Após inserção, cada página interna deve respeitar limites de filhos"
     )
-    @icontract.snapshot(lambda self: self._altura_interna(), name="altura_antiga")
     @icontract.ensure(
-        lambda self, OLD: self._altura_interna() == OLD.altura_antiga
-                        or self._altura_interna() == OLD.altura_antiga + 1,
+        lambda self: not self.contratos.incremental or self._paginas_tocadas_ok(),
+        "Após inserção, as páginas modificadas devem manter ordem e limites"
+    )
+    @icontract.snapshot(lambda self: self._altura_atual(), name="altura_antiga")
+    @icontract.ensure(
+        lambda self, OLD: not self.contratos.local()
+                          or self._altura_atual() == OLD.altura_antiga
+                          or self._altura_atual() == OLD.altura_antiga + 1,
         "Após divisão da raiz, a altura deve permanecer igual ou aumentar em 1"
     )
+    @_medir_algoritmo
     def inserir(self, chave: int) -> None:
         """
         Insere uma chave na árvore B.
@@ -200,56 +1491,75 @@ class ArvoreB:
         Args:
             chave (int): Valor a inserir (único).
 
+        Raises:
+            ValueError: Se a árvore foi aberta com abrir() e a chave não
+                for um inteiro de 64 bits.
         """
+        if self._trava_arvore is not None:
+            self._inserir_concorrente(chave)
+            return
+        self._exigir_chaves_gravaveis((chave,))
+        self.contratos.registrar_operacao()
+        self._iniciar_registro_tocadas()
+        self._iniciar_escrita()
         if self.raiz is None:
-            self.raiz = Pagina(self.t, True)
+            self._substituir_raiz(self._nova_pagina(True), 1)
             self.raiz.registros.append(chave)
             self.raiz.qtdRegistros = 1
-            return
-
-        if self.raiz.qtdRegistros == self.max_chaves:
-            nova = Pagina(self.t, False)
-            nova.paginas[0] = self.raiz
-            self._dividir_pagina(nova, 0)
-            self.raiz = nova
-
-        self._inserir_em_pagina_nao_cheia(self.raiz, chave)
+            self._recalcular_tamanho(self.raiz)
+            self._tocar(self.raiz)
+        else:
+            if self.raiz.qtdRegistros == self.max_chaves:
+                nova = self._nova_pagina(False)
+                nova.paginas = [self.raiz]
+                nova.tamanho = self.raiz.tamanho
+                self._dividir_pagina(nova, 0)
+                self._substituir_raiz(nova, 1)
+                self._contar("divisoes_raiz")
+            self._inserir_em_pagina_nao_cheia(self.raiz, chave)
+        self._ajustar_estatisticas(chaves=1)
+        if self.filtro is not None:
+            self._adicionar_ao_filtro((chave,))
+        self._concluir_operacao()
 
     def _inserir_em_pagina_nao_cheia(self, pagina: Pagina, chave: int) -> None:
         """
-        Insere em página que não está cheia.
+        Insere a partir de uma página que não está cheia, descendo em laço
+        até a folha e abrindo espaço em cada filho cheio antes de entrar nele.
 
         Args:
             pagina (Pagina): Página alvo.
             chave (int): Valor a inserir.
         """
-        i = pagina.qtdRegistros - 1
-        if pagina.folha:
-            pagina.registros.append(0)
-            while i >= 0 and chave < pagina.registros[i]:
-                pagina.registros[i + 1] = pagina.registros[i]
-                i -= 1
-            pagina.registros[i + 1] = chave
-            pagina.qtdRegistros += 1
-            return
-
-        while i >= 0 and chave < pagina.registros[i]:
-            i -= 1
-        i += 1
-        filho = pagina.paginas[i]
-
-        if filho.qtdRegistros == self.max_chaves:
-            if i > 0 and pagina.paginas[i - 1].qtdRegistros < self.max_chaves:
-                self._emprestar_de_anterior(pagina, i)
-            elif i < pagina.qtdRegistros and pagina.paginas[i + 1].qtdRegistros < self.max_chaves:
-                self._emprestar_de_posterior(pagina, i)
-            else:
-                self._dividir_pagina(pagina, i)
-                if chave > pagina.registros[i]:
-                    i += 1
-            filho = pagina.paginas[i]
+        while True:
+            self._tocar(pagina)
+            if self.tamanhos_subarvore:
+                pagina.tamanho += 1
+            if pagina.folha:
+                i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+                pagina.registros.insert(i, chave)
+                pagina.qtdRegistros += 1
+                return
 
-        self._inserir_em_pagina_nao_cheia(filho, chave)
+            i = bisect_right(pagina.registros, chave, 0, pagina.qtdRegistros)
+            filho = self._filho(pagina, i)
+
+            if filho.qtdRegistros == self.max_chaves:
+                if i > 0 and pagina.paginas[i - 1].qtdRegistros < self.max_chaves - 1:
+                    self._emprestar_de_posterior(pagina, i - 1)
+                    if chave < pagina.registros[i - 1]:
+                        i -= 1
+                elif i < pagina.qtdRegistros and pagina.paginas[i + 1].qtdRegistros < self.max_chaves - 1:
+                    self._emprestar_de_anterior(pagina, i + 1)
+                    if chave > pagina.registros[i]:
+                        i += 1
+                else:
+                    self._dividir_pagina(pagina, i)
+                    if chave > pagina.registros[i]:
+                        i += 1
+                filho = self._filho(pagina, i)
+
+            pagina = filho
 
     def _dividir_pagina(self, pai: Pagina, indice: int) -> None:
         """
@@ -259,8 +1569,8 @@ class ArvoreB:
             pai (Pagina): Página pai.
             indice (int): Índice da página a dividir.
         """
-        filho = pai.paginas[indice]
-        novo = Pagina(self.t, filho.folha)
+        filho = self._filho(pai, indice)
+        novo = self._nova_pagina(filho.folha)
         meio = self.max_chaves // 2
         chave_meio = filho.registros[meio]
 
@@ -277,25 +1587,215 @@ class ArvoreB:
         pai.qtdRegistros += 1
         pai.paginas.insert(indice + 1, novo)
         pai.paginas = pai.paginas[:2 * self.t]
+        if self.tamanhos_subarvore:
+            self._recalcular_tamanho(novo)
+            filho.tamanho -= novo.tamanho + 1
+        self._tocar(pai, filho, novo)
+        self._contar("divisoes")
+
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_chaves_ok(),
+        "Após inserção em lote, cada página deve respeitar limites de chaves"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_filhos_ok(),
+        "Após inserção em lote, cada página interna deve respeitar limites de filhos"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.incremental or self._paginas_tocadas_ok(),
+        "Após inserção em lote, as páginas modificadas devem manter ordem e limites"
+    )
+    @icontract.snapshot(lambda self: self._altura_atual(), name="altura_antiga")
+    @icontract.ensure(
+        lambda self, OLD: not self.contratos.local()
+                          or self._altura_atual() >= OLD.altura_antiga,
+        "Após inserção em lote, a altura não pode diminuir"
+    )
+    @_exclusiva
+    def inserir_lote(self, chaves: Iterable[int]) -> Dict[int, bool]:
+        """
+        Insere um lote de chaves compartilhando a descida entre elas.
+
+        As chaves são ordenadas e agrupadas pela página de destino; cada
+        página que transborda é dividida uma única vez, em quantas partes
+        forem necessárias.
+
+        Args:
+            chaves (Iterable[int]): Chaves a inserir, em qualquer ordem.
+
+        Returns:
+            Dict[int, bool]: Para cada chave, True se foi inserida ou False
+            se já existia na árvore.
+
+        Raises:
+            ValueError: Se a árvore foi aberta com abrir() e alguma chave
+                não for um inteiro de 64 bits; nenhuma chave é inserida.
+        """
+        self.contratos.registrar_operacao()
+        self._iniciar_registro_tocadas()
+        resultado: Dict[int, bool] = {}
+        unicas = set(chaves)
+        self._exigir_chaves_gravaveis(unicas)
+        ordenadas = sorted(unicas)
+        if not ordenadas:
+            return resultado
+        self._iniciar_escrita()
+        if self.raiz is None:
+            self._substituir_raiz(self._nova_pagina(True), 1)
+        self._inserir_lote_em_pagina(self.raiz, ordenadas, resultado)
+        while self.raiz.qtdRegistros > self.max_chaves:
+            nova = self._nova_pagina(False)
+            nova.paginas = [self.raiz]
+            self._dividir_excesso(nova, 0)
+            self._recalcular_tamanho(nova)
+            self._substituir_raiz(nova, 1)
+            self._contar("divisoes_raiz")
+        self._ajustar_estatisticas(chaves=sum(resultado.values()))
+        if self.filtro is not None:
+            self._adicionar_ao_filtro(chave for chave, nova in resultado.items() if nova)
+        self._concluir_operacao()
+        return resultado
+
+    def _agrupar_por_filho(self, pagina: Pagina, chaves: List[int],
+                           encontradas: List[int]) -> List[Tuple[int, List[int]]]:
+        """
+        Distribui chaves ordenadas entre os filhos de uma página interna.
+
+        Chaves iguais a separadores da página são reportadas em `encontradas`
+        e não descem para os filhos.
+
+        Args:
+            pagina (Pagina): Página interna.
+            chaves (List[int]): Chaves ordenadas dentro do intervalo da página.
+            encontradas (List[int]): Recebe as chaves presentes na página.
+
+        Returns:
+            List[Tuple[int, List[int]]]: Pares (índice do filho, chaves do filho).
+        """
+        grupos: List[Tuple[int, List[int]]] = []
+        inicio = 0
+        for i in range(pagina.qtdRegistros + 1):
+            if inicio == len(chaves):
+                break
+            if i < pagina.qtdRegistros:
+                separador = pagina.registros[i]
+                fim = bisect_left(chaves, separador, inicio)
+            else:
+                fim = len(chaves)
+            if fim > inicio:
+                grupos.append((i, chaves[inicio:fim]))
+            inicio = fim
+            if i < pagina.qtdRegistros and fim < len(chaves) and chaves[fim] == separador:
+                encontradas.append(separador)
+                inicio += 1
+        return grupos
+
+    def _inserir_lote_em_pagina(self, pagina: Pagina, chaves: List[int],
+                                resultado: Dict[int, bool]) -> None:
+        """
+        Insere chaves ordenadas na subárvore, permitindo que a página
+        transborde; o pai é responsável por dividi-la.
+
+        Args:
+            pagina (Pagina): Raiz da subárvore.
+            chaves (List[int]): Chaves ordenadas destinadas à subárvore.
+            resultado (Dict[int, bool]): Resultado parcial do lote.
+        """
+        self._tocar(pagina)
+        if pagina.folha:
+            registros = pagina.registros
+            novas = []
+            for chave in chaves:
+                i = bisect_left(registros, chave, 0, pagina.qtdRegistros)
+                existe = i < pagina.qtdRegistros and registros[i] == chave
+                resultado[chave] = not existe
+                if not existe:
+                    novas.append(chave)
+            if novas:
+                pagina.registros = self._como_registros(
+                    pagina, sorted(list(registros[:pagina.qtdRegistros]) + novas))
+                pagina.qtdRegistros = len(pagina.registros)
+                self._recalcular_tamanho(pagina)
+            return
+
+        existentes: List[int] = []
+        grupos = self._agrupar_por_filho(pagina, chaves, existentes)
+        for chave in existentes:
+            resultado[chave] = False
+        # Da direita para a esquerda: divisões só deslocam índices já tratados.
+        for idx, grupo in reversed(grupos):
+            self._inserir_lote_em_pagina(self._filho(pagina, idx), grupo, resultado)
+            self._dividir_excesso(pagina, idx)
+        self._recalcular_tamanho(pagina)
+
+    def _dividir_excesso(self, pai: Pagina, indice: int) -> None:
+        """
+        Divide um filho que transbordou em quantas páginas forem necessárias,
+        promovendo os separadores para o pai de uma só vez.
+
+        Args:
+            pai (Pagina): Página pai.
+            indice (int): Índice do filho a dividir.
+        """
+        filho = self._filho(pai, indice)
+        qtd = filho.qtdRegistros
+        if qtd <= self.max_chaves:
+            return
+        partes = -(-(qtd + 1) // (self.max_chaves + 1))
+        self._contar("divisoes", partes - 1)
+        base, sobra = divmod(qtd - (partes - 1), partes)
+        registros = filho.registros
+        filhos = None if filho.folha else filho.paginas
+        separadores: List[int] = []
+        novas: List[Pagina] = []
+        pos = pos_filho = 0
+        for parte in range(partes):
+            tamanho = base + (1 if parte < sobra else 0)
+            pagina = filho if parte == 0 else self._nova_pagina(filho.folha)
+            pagina.registros = registros[pos:pos + tamanho]
+            pagina.qtdRegistros = tamanho
+            if filhos is not None:
+                pagina.paginas = filhos[pos_filho:pos_filho + tamanho + 1]
+                pos_filho += tamanho + 1
+            pos += tamanho
+            self._recalcular_tamanho(pagina)
+            if parte < partes - 1:
+                separadores.append(registros[pos])
+                pos += 1
+            if parte > 0:
+                novas.append(pagina)
+
+        pai.registros[indice:indice] = self._como_registros(pai, separadores)
+        pai.qtdRegistros += len(separadores)
+        pai.paginas[indice + 1:indice + 1] = novas
+        del pai.paginas[pai.qtdRegistros + 1:]
+        self._tocar(pai, filho, *novas)
 
     @icontract.require(
-        lambda self, chave: self.buscar(chave) is not None,
+        lambda self, chave: not self.contratos.local()
+                            or self._contem(chave),
         "Chave não existe na árvore"
     )
     @icontract.ensure(
-        lambda self: self._limites_chaves_ok(),
+        lambda self: not self.contratos.ativo() or self._limites_chaves_ok(),
         "Após remoção, cada página deve respeitar limites de chaves"
     )
     @icontract.ensure(
-        lambda self: self._limites_filhos_ok(),
+        lambda self: not self.contratos.ativo() or self._limites_filhos_ok(),
         "Após remoção, cada página interna deve respeitar limites de filhos"
     )
-    @icontract.snapshot(lambda self: self._altura_interna(), name="altura_antiga")
     @icontract.ensure(
-        lambda self, OLD: self._altura_interna() == OLD.altura_antiga
-                        or self._altura_interna() == OLD.altura_antiga - 1,
+        lambda self: not self.contratos.incremental or self._paginas_tocadas_ok(),
+        "Após remoção, as páginas modificadas devem manter ordem e limites"
+    )
+    @icontract.snapshot(lambda self: self._altura_atual(), name="altura_antiga")
+    @icontract.ensure(
+        lambda self, OLD: not self.contratos.local()
+                          or self._altura_atual() == OLD.altura_antiga
+                          or self._altura_atual() == OLD.altura_antiga - 1,
         "Após fusão da raiz, a altura deve permanecer igual ou diminuir em 1"
     )
+    @_medir_algoritmo
     def remover(self, chave: int) -> None:
         """
         Remove uma chave da árvore B.
@@ -303,43 +1803,61 @@ class ArvoreB:
         Args:
             chave (int): Valor a remover.
         """
+        if self._trava_arvore is not None:
+            self._remover_concorrente(chave)
+            return
+        self.contratos.registrar_operacao()
+        self._iniciar_registro_tocadas()
         if self.raiz is None:
             return
+        self._iniciar_escrita()
+        self._removida = False
         self._remover_em_pagina(self.raiz, chave)
-        if self.raiz.qtdRegistros == 0:
-            if self.raiz.folha:
-                self.raiz = None
-            else:
-                self.raiz = self.raiz.paginas[0]
+        if self._removida:
+            self._ajustar_estatisticas(chaves=-1)
+            if self.filtro is not None:
+                self.filtro.registrar_remocao()
+        self._recolher_raiz()
+        self._concluir_operacao()
 
     def _remover_em_pagina(self, pagina: Pagina, chave: int) -> bool:
         """
-        Remove recursivamente em uma página.
+        Remove a partir de uma página, descendo em laço até a folha. As
+        páginas internas do caminho ficam numa pilha explícita, para que
+        tenham o tamanho da subárvore decrementado se a chave for removida.
 
         Args:
-            pagina (Pagina): Página atual.
+            pagina (Pagina): Página onde a remoção começa.
             chave (int): Valor a remover.
 
         Returns:
-            bool: True se ficar abaixo do mínimo de chaves.
+            bool: True se a folha alcançada ficar abaixo do mínimo de chaves.
         """
-        idx = 0
-        while idx < pagina.qtdRegistros and chave > pagina.registros[idx]:
-            idx += 1
-
-        if idx < pagina.qtdRegistros and chave == pagina.registros[idx]:
+        caminho: List[Pagina] = []
+        while True:
+            self._tocar(pagina)
+            idx = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+            achou = idx < pagina.qtdRegistros and chave == pagina.registros[idx]
             if pagina.folha:
-                del pagina.registros[idx]
-                pagina.qtdRegistros -= 1
-                return pagina.qtdRegistros < self.min_chaves
-            return self._remover_chave_em_pagina_interna(pagina, idx)
+                break
+            caminho.append(pagina)
+            if achou:
+                pagina, chave = self._remover_chave_em_pagina_interna(pagina, idx)
+            else:
+                pagina = self._processar_remocao_em_filho(pagina, idx, chave)
 
-        if pagina.folha:
+        if not achou:
             return False
-
-        return self._processar_remocao_em_filho(pagina, idx, chave)
-
-    def _remover_chave_em_pagina_interna(self, pagina: Pagina, idx: int) -> bool:
+        del pagina.registros[idx]
+        pagina.qtdRegistros -= 1
+        self._removida = True
+        if self.tamanhos_subarvore:
+            pagina.tamanho -= 1
+            for anterior in caminho:
+                anterior.tamanho -= 1
+        return pagina.qtdRegistros < self.min_chaves
+
+    def _remover_chave_em_pagina_interna(self, pagina: Pagina, idx: int) -> Tuple[Pagina, int]:
         """
         Remove chave de página interna, usando predecessores/sucessores ou fusão.
 
@@ -348,21 +1866,22 @@ class ArvoreB:
             idx (int): Índice da chave.
 
         Returns:
-            bool: True se abaixo do mínimo após operar.
+            Tuple[Pagina, int]: Filho onde a remoção continua e a chave a
+            remover nele (o predecessor, o sucessor ou a própria chave).
         """
         chave = pagina.registros[idx]
         if pagina.paginas[idx].qtdRegistros > self.min_chaves:
             pred = self._obter_predecessor(pagina, idx)
             pagina.registros[idx] = pred
-            return self._remover_em_pagina(pagina.paginas[idx], pred)
+            return self._filho(pagina, idx), pred
 
         if pagina.paginas[idx + 1].qtdRegistros > self.min_chaves:
             succ = self._obter_sucessor(pagina, idx)
             pagina.registros[idx] = succ
-            return self._remover_em_pagina(pagina.paginas[idx + 1], succ)
+            return self._filho(pagina, idx + 1), succ
 
         self._fundir_paginas(pagina, idx)
-        return self._remover_em_pagina(pagina.paginas[idx], chave)
+        return self._filho(pagina, idx), chave
 
     def _obter_predecessor(self, pagina: Pagina, idx: int) -> int:
         """
@@ -396,9 +1915,9 @@ class ArvoreB:
             atual = atual.paginas[0]
         return atual.registros[0]
 
-    def _processar_remocao_em_filho(self, pai: Pagina, idx: int, chave: int) -> bool:
+    def _processar_remocao_em_filho(self, pai: Pagina, idx: int, chave: int) -> Pagina:
         """
-        Desce para o filho adequado para remoção e ajusta se necessário.
+        Escolhe o filho adequado para a remoção, ajustando-o se necessário.
 
         Args:
             pai (Pagina): Página pai.
@@ -406,15 +1925,15 @@ class ArvoreB:
             chave (int): Valor a remover.
 
         Returns:
-            bool: True se o filho ficou abaixo do mínimo.
+            Pagina: Filho onde a remoção continua.
         """
         vai_direita = (idx == pai.qtdRegistros)
         filho = pai.paginas[idx]
         if filho.qtdRegistros == self.min_chaves:
             self._ajustar_filho(pai, idx)
         if vai_direita and idx > pai.qtdRegistros:
-            return self._remover_em_pagina(pai.paginas[idx - 1], chave)
-        return self._remover_em_pagina(pai.paginas[idx], chave)
+            return self._filho(pai, idx - 1)
+        return self._filho(pai, idx)
 
     def _ajustar_filho(self, pai: Pagina, idx: int) -> None:
         """
@@ -442,14 +1961,21 @@ class ArvoreB:
             pai (Pagina): Página pai.
             idx (int): Índice do filho receptor.
         """
-        filho = pai.paginas[idx]
-        irmao = pai.paginas[idx - 1]
+        filho = self._filho(pai, idx)
+        irmao = self._filho(pai, idx - 1)
         filho.registros.insert(0, pai.registros[idx - 1])
         filho.qtdRegistros += 1
+        movidas = 1
         if not filho.folha:
             filho.paginas.insert(0, irmao.paginas.pop())
+            movidas += filho.paginas[0].tamanho
         pai.registros[idx - 1] = irmao.registros.pop()
         irmao.qtdRegistros -= 1
+        if self.tamanhos_subarvore:
+            filho.tamanho += movidas
+            irmao.tamanho -= movidas
+        self._tocar(pai, filho, irmao)
+        self._contar("emprestimos_anterior")
 
     def _emprestar_de_posterior(self, pai: Pagina, idx: int) -> None:
         """
@@ -459,14 +1985,21 @@ class ArvoreB:
             pai (Pagina): Página pai.
             idx (int): Índice do filho receptor.
         """
-        filho = pai.paginas[idx]
-        irmao = pai.paginas[idx + 1]
+        filho = self._filho(pai, idx)
+        irmao = self._filho(pai, idx + 1)
         filho.registros.append(pai.registros[idx])
         filho.qtdRegistros += 1
+        movidas = 1
         if not filho.folha:
             filho.paginas.append(irmao.paginas.pop(0))
+            movidas += filho.paginas[-1].tamanho
         pai.registros[idx] = irmao.registros.pop(0)
         irmao.qtdRegistros -= 1
+        if self.tamanhos_subarvore:
+            filho.tamanho += movidas
+            irmao.tamanho -= movidas
+        self._tocar(pai, filho, irmao)
+        self._contar("emprestimos_posterior")
 
     def _fundir_paginas(self, pai: Pagina, idx: int) -> None:
         """
@@ -476,7 +2009,7 @@ class ArvoreB:
             pai (Pagina): Página pai.
             idx (int): Índice da página à esquerda da fusão.
         """
-        filho = pai.paginas[idx]
+        filho = self._filho(pai, idx)
         irmao = pai.paginas[idx + 1]
         filho.registros.append(pai.registros.pop(idx))
         filho.qtdRegistros += 1
@@ -484,5 +2017,432 @@ class ArvoreB:
         filho.qtdRegistros += irmao.qtdRegistros
         if not filho.folha:
             filho.paginas.extend(irmao.paginas)
+        if self.tamanhos_subarvore:
+            filho.tamanho += 1 + irmao.tamanho
         pai.paginas.pop(idx + 1)
         pai.qtdRegistros -= 1
+        self._tocar(pai, filho)
+        self._descartar(irmao)
+        self._contar("fusoes")
+
+    def _redistribuir(self, pai: Pagina, idx: int) -> None:
+        """
+        Reparte igualmente as chaves de dois irmãos adjacentes e do separador.
+
+        Args:
+            pai (Pagina): Página pai.
+            idx (int): Índice da página à esquerda do par.
+        """
+        esquerda = self._filho(pai, idx)
+        direita = self._filho(pai, idx + 1)
+        chaves = (list(esquerda.registros[:esquerda.qtdRegistros])
+                  + [pai.registros[idx]]
+                  + list(direita.registros[:direita.qtdRegistros]))
+        metade = (len(chaves) - 1) // 2
+        if not esquerda.folha:
+            filhos = (esquerda.paginas[:esquerda.qtdRegistros + 1]
+                      + direita.paginas[:direita.qtdRegistros + 1])
+            esquerda.paginas = filhos[:metade + 1]
+            direita.paginas = filhos[metade + 1:]
+        esquerda.registros = self._como_registros(esquerda, chaves[:metade])
+        esquerda.qtdRegistros = metade
+        pai.registros[idx] = chaves[metade]
+        direita.registros = self._como_registros(direita, chaves[metade + 1:])
+        direita.qtdRegistros = len(chaves) - metade - 1
+        self._recalcular_tamanho(esquerda)
+        self._recalcular_tamanho(direita)
+        self._tocar(pai, esquerda, direita)
+        self._contar("redistribuicoes")
+
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_chaves_ok(),
+        "Após remoção em lote, cada página deve respeitar limites de chaves"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_filhos_ok(),
+        "Após remoção em lote, cada página interna deve respeitar limites de filhos"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.incremental or self._paginas_tocadas_ok(),
+        "Após remoção em lote, as páginas modificadas devem manter ordem e limites"
+    )
+    @icontract.snapshot(lambda self: self._altura_atual(), name="altura_antiga")
+    @icontract.ensure(
+        lambda self, OLD: not self.contratos.local()
+                          or self._altura_atual() <= OLD.altura_antiga,
+        "Após remoção em lote, a altura não pode aumentar"
+    )
+    @_exclusiva
+    def remover_lote(self, chaves: Iterable[int]) -> Dict[int, bool]:
+        """
+        Remove um lote de chaves compartilhando a descida entre elas.
+
+        As chaves que estão em folhas são removidas de uma vez por folha e
+        os filhos que ficam abaixo do mínimo são corrigidos uma única vez,
+        por fusão ou redistribuição com um irmão. Chaves encontradas em
+        páginas internas são removidas em seguida pelo caminho usual.
+
+        Args:
+            chaves (Iterable[int]): Chaves a remover, em qualquer ordem.
+
+        Returns:
+            Dict[int, bool]: Para cada chave, True se foi removida ou False
+            se não existia na árvore.
+        """
+        self.contratos.registrar_operacao()
+        self._iniciar_registro_tocadas()
+        resultado: Dict[int, bool] = {chave: False for chave in chaves}
+        if self.raiz is None or not resultado:
+            return resultado
+        self._iniciar_escrita()
+        internas: List[int] = []
+        self._remover_lote_em_pagina(self.raiz, sorted(resultado), resultado, internas)
+        self._recolher_raiz()
+        for chave in internas:
+            self._removida = False
+            self._remover_em_pagina(self.raiz, chave)
+            self._recolher_raiz()
+            resultado[chave] = True
+        removidas = sum(resultado.values())
+        self._ajustar_estatisticas(chaves=-removidas)
+        if self.filtro is not None:
+            self.filtro.registrar_remocao(removidas)
+        self._concluir_operacao()
+        return resultado
+
+    def _recolher_raiz(self) -> None:
+        """
+        Remove raízes vazias, reduzindo a altura quando a raiz tem um só filho.
+        """
+        while self.raiz is not None and self.raiz.qtdRegistros == 0:
+            self._descartar(self.raiz)
+            self._contar("recolhimentos_raiz")
+            if self.raiz.folha:
+                self._substituir_raiz(None)
+            else:
+                self._substituir_raiz(self._gravavel(self.raiz.paginas[0]), -1)
+                self._tocar(self.raiz)
+
+    def _remover_lote_em_pagina(self, pagina: Pagina, chaves: List[int],
+                                resultado: Dict[int, bool],
+                                internas: List[int]) -> None:
+        """
+        Remove das folhas da subárvore as chaves ordenadas do lote e corrige
+        os filhos que ficaram abaixo do mínimo.
+
+        Args:
+            pagina (Pagina): Raiz da subárvore.
+            chaves (List[int]): Chaves ordenadas destinadas à subárvore.
+            resultado (Dict[int, bool]): Resultado parcial do lote.
+            internas (List[int]): Recebe chaves encontradas em páginas internas.
+        """
+        self._tocar(pagina)
+        if pagina.folha:
+            registros = pagina.registros
+            removidas = set()
+            for chave in chaves:
+                i = bisect_left(registros, chave, 0, pagina.qtdRegistros)
+                if i < pagina.qtdRegistros and registros[i] == chave:
+                    removidas.add(chave)
+                    resultado[chave] = True
+            if removidas:
+                pagina.registros = self._como_registros(
+                    pagina, [r for r in registros[:pagina.qtdRegistros] if r not in removidas])
+                pagina.qtdRegistros = len(pagina.registros)
+                self._recalcular_tamanho(pagina)
+            return
+
+        grupos = self._agrupar_por_filho(pagina, chaves, internas)
+        for idx, grupo in grupos:
+            self._remover_lote_em_pagina(self._filho(pagina, idx), grupo, resultado, internas)
+        self._reparar_filhos(pagina)
+        self._recalcular_tamanho(pagina)
+
+    def _reparar_filhos(self, pai: Pagina) -> None:
+        """
+        Corrige, da esquerda para a direita, os filhos abaixo do mínimo de
+        chaves, fundindo-os ao irmão ou redistribuindo as chaves do par.
+
+        Args:
+            pai (Pagina): Página cujos filhos serão corrigidos.
+        """
+        i = 0
+        while i <= pai.qtdRegistros:
+            if pai.qtdRegistros == 0 or pai.paginas[i].qtdRegistros >= self.min_chaves:
+                i += 1
+                continue
+            j = i if i < pai.qtdRegistros else i - 1
+            esquerda, direita = pai.paginas[j], pai.paginas[j + 1]
+            if esquerda.qtdRegistros + 1 + direita.qtdRegistros <= self.max_chaves:
+                self._fundir_paginas(pai, j)
+            else:
+                self._redistribuir(pai, j)
+            i = j
+
+    def _travar(self, pagina: Pagina, presas: List[Pagina]) -> None:
+        """
+        Adquire a trava de escrita da página e a registra como presa.
+
+        Args:
+            pagina (Pagina): Página a travar.
+            presas (List[Pagina]): Páginas travadas pela operação.
+        """
+        pagina.trava.adquirir_escrita()
+        presas.append(pagina)
+
+    def _soltar(self, pagina: Pagina, presas: List[Pagina]) -> None:
+        """
+        Libera a trava de escrita de uma página presa.
+
+        Args:
+            pagina (Pagina): Página a liberar.
+            presas (List[Pagina]): Páginas travadas pela operação.
+        """
+        presas.remove(pagina)
+        pagina.trava.liberar_escrita()
+
+    def _buscar_concorrente(self, chave: int) -> Optional[int]:
+        """
+        Busca acoplando travas de leitura: a trava do filho é adquirida
+        antes de liberar a do pai.
+
+        Args:
+            chave (int): Valor buscado.
+
+        Returns:
+            Optional[int]: A chave se encontrada, ou None.
+        """
+        with self._trava_arvore.leitura():
+            with self._trava_raiz:
+                pagina = self.raiz
+                if pagina is None:
+                    return None
+                pagina.trava.adquirir_leitura()
+            try:
+                while True:
+                    i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+                    if i < pagina.qtdRegistros and chave == pagina.registros[i]:
+                        return pagina.registros[i]
+                    if pagina.folha:
+                        return None
+                    filho = pagina.paginas[i]
+                    filho.trava.adquirir_leitura()
+                    pagina.trava.liberar_leitura()
+                    pagina = filho
+            finally:
+                pagina.trava.liberar_leitura()
+
+    def _inserir_concorrente(self, chave: int) -> None:
+        """
+        Insere descendo com travas de escrita acopladas. Como todo filho
+        cheio é dividido antes da descida, nenhuma divisão sobe pela árvore
+        e o pai pode ser liberado assim que o filho está preparado. Para não
+        travar irmãos, o filho cheio é sempre dividido, sem redistribuição.
+
+        Args:
+            chave (int): Valor a inserir.
+        """
+        presas: List[Pagina] = []
+        with self._trava_arvore.leitura():
+            try:
+                with self._trava_raiz:
+                    self._iniciar_escrita()
+                    if self.raiz is None:
+                        self._substituir_raiz(self._nova_pagina(True), 1)
+                        self.raiz.registros.append(chave)
+                        self.raiz.qtdRegistros = 1
+                        self._ajustar_estatisticas(chaves=1)
+                        return
+                    pagina = self.raiz
+                    self._travar(pagina, presas)
+                    if pagina.qtdRegistros == self.max_chaves:
+                        nova = self._nova_pagina(False)
+                        nova.paginas = [pagina]
+                        self._travar(nova, presas)
+                        self._dividir_pagina(nova, 0)
+                        self._substituir_raiz(nova, 1)
+                        self._contar("divisoes_raiz")
+                        self._soltar(pagina, presas)
+                        pagina = nova
+                while not pagina.folha:
+                    i = bisect_right(pagina.registros, chave, 0, pagina.qtdRegistros)
+                    filho = self._filho(pagina, i)
+                    self._travar(filho, presas)
+                    if filho.qtdRegistros == self.max_chaves:
+                        self._dividir_pagina(pagina, i)
+                        if chave > pagina.registros[i]:
+                            self._travar(pagina.paginas[i + 1], presas)
+                            self._soltar(filho, presas)
+                            filho = pagina.paginas[i + 1]
+                    self._soltar(pagina, presas)
+                    pagina = filho
+                i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+                pagina.registros.insert(i, chave)
+                pagina.qtdRegistros += 1
+                self._ajustar_estatisticas(chaves=1)
+            finally:
+                for pagina in presas:
+                    pagina.trava.liberar_escrita()
+
+    def _preparar_filho(self, pai: Pagina, idx: int, presas: List[Pagina]) -> Pagina:
+        """
+        Trava o filho pelo qual a remoção vai descer e, se ele tiver o
+        mínimo de chaves, trava os irmãos e faz empréstimo ou fusão. O pai
+        já deve estar travado.
+
+        Args:
+            pai (Pagina): Página pai, travada.
+            idx (int): Índice do filho.
+            presas (List[Pagina]): Páginas travadas pela operação.
+
+        Returns:
+            Pagina: Página, travada, pela qual a descida continua.
+        """
+        filho = self._filho(pai, idx)
+        self._travar(filho, presas)
+        if filho.qtdRegistros > self.min_chaves:
+            return filho
+        envolvidas = [filho]
+        if idx > 0:
+            envolvidas.append(self._filho(pai, idx - 1))
+            self._travar(envolvidas[-1], presas)
+        if idx < pai.qtdRegistros:
+            envolvidas.append(self._filho(pai, idx + 1))
+            self._travar(envolvidas[-1], presas)
+        vai_direita = idx == pai.qtdRegistros
+        self._ajustar_filho(pai, idx)
+        if vai_direita and idx > pai.qtdRegistros:
+            idx -= 1
+        proxima = pai.paginas[idx]
+        for pagina in envolvidas:
+            if pagina is not proxima:
+                self._soltar(pagina, presas)
+        return proxima
+
+    def _remover_extremo(self, pagina: Pagina, maior: bool, presas: List[Pagina]) -> int:
+        """
+        Remove e retorna a maior (ou menor) chave da subárvore, descendo com
+        travas acopladas. A página deve estar travada e ter mais que o
+        mínimo de chaves; ela é liberada durante a descida.
+
+        Args:
+            pagina (Pagina): Raiz da subárvore, travada.
+            maior (bool): True para a maior chave, False para a menor.
+            presas (List[Pagina]): Páginas travadas pela operação.
+
+        Returns:
+            int: Chave removida.
+        """
+        while not pagina.folha:
+            proxima = self._preparar_filho(pagina, pagina.qtdRegistros if maior else 0, presas)
+            self._soltar(pagina, presas)
+            pagina = proxima
+        chave = pagina.registros.pop() if maior else pagina.registros.pop(0)
+        pagina.qtdRegistros -= 1
+        self._ajustar_estatisticas(chaves=-1)
+        self._soltar(pagina, presas)
+        return chave
+
+    def _remover_concorrente(self, chave: int) -> None:
+        """
+        Remove descendo com travas de escrita acopladas. Cada filho é
+        preparado (empréstimo ou fusão) antes da descida, de modo que a
+        remoção não sobe pela árvore e o pai pode ser liberado. A trava da
+        raiz é mantida só enquanto a raiz pode ser esvaziada.
+
+        Args:
+            chave (int): Valor a remover.
+        """
+        presas: List[Pagina] = []
+        raiz_presa = True
+        self._trava_arvore.adquirir_leitura()
+        self._trava_raiz.acquire()
+        try:
+            self._iniciar_escrita()
+            pagina = self.raiz
+            if pagina is None:
+                return
+            self._travar(pagina, presas)
+            while True:
+                idx = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+                achou = idx < pagina.qtdRegistros and pagina.registros[idx] == chave
+                if pagina.folha:
+                    if achou:
+                        del pagina.registros[idx]
+                        pagina.qtdRegistros -= 1
+                        self._ajustar_estatisticas(chaves=-1)
+                        if raiz_presa and pagina.qtdRegistros == 0:
+                            self._descartar(pagina)
+                            self._substituir_raiz(None)
+                            self._contar("recolhimentos_raiz")
+                    return
+                if achou:
+                    esquerda = self._filho(pagina, idx)
+                    self._travar(esquerda, presas)
+                    if esquerda.qtdRegistros > self.min_chaves:
+                        pagina.registros[idx] = self._remover_extremo(esquerda, True, presas)
+                        return
+                    direita = self._filho(pagina, idx + 1)
+                    self._travar(direita, presas)
+                    if direita.qtdRegistros > self.min_chaves:
+                        self._soltar(esquerda, presas)
+                        pagina.registros[idx] = self._remover_extremo(direita, False, presas)
+                        return
+                    self._fundir_paginas(pagina, idx)
+                    self._soltar(direita, presas)
+                    proxima = esquerda
+                else:
+                    proxima = self._preparar_filho(pagina, idx, presas)
+                if raiz_presa:
+                    if pagina.qtdRegistros == 0:
+                        self._descartar(pagina)
+                        self._substituir_raiz(proxima, -1)
+                        self._contar("recolhimentos_raiz")
+                    self._trava_raiz.release()
+                    raiz_presa = False
+                self._soltar(pagina, presas)
+                pagina = proxima
+        finally:
+            for pagina in presas:
+                pagina.trava.liberar_escrita()
+            if raiz_presa:
+                self._trava_raiz.release()
+            self._trava_arvore.liberar_leitura()
+
+
+class InstantaneoArvoreB(ArvoreB):
+    def __init__(self, arvore: ArvoreB):
+        """
+        Visão somente leitura de uma ArvoreB em um instante, criada por
+        ArvoreB.snapshot(). Compartilha as páginas da árvore de origem, que
+        passa a copiá-las antes de alterá-las. Oferece todas as operações de
+        leitura; as de escrita lançam TypeError. Os contratos ficam
+        desligados, pois as páginas já foram verificadas pela árvore de origem.
+
+        Args:
+            arvore (ArvoreB): Árvore de origem.
+
+        Attributes:
+            versao (int): Versão da árvore de origem capturada pelo instantâneo.
+        """
+        super().__init__(arvore.t, contratos=DESLIGADO, tipo_pagina=arvore.tipo_pagina,
+                         tamanhos_subarvore=arvore.tamanhos_subarvore)
+        self.versao: int = arvore._versao
+        arvore._conferir_raiz()
+        self._substituir_raiz(arvore.raiz)
+        self._altura = arvore._altura
+        self._quantidade, self._paginas = arvore._quantidade, arvore._paginas
+
+    def _somente_leitura(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Instantâneos da Árvore B são somente leitura")
+
+    inserir = remover = inserir_lote = remover_lote = _somente_leitura
+
+    def snapshot(self) -> "InstantaneoArvoreB":
+        """
+        Um instantâneo já é imutável; retorna ele mesmo.
+
+        Returns:
+            InstantaneoArvoreB: Este instantâneo.
+        """
+        return self
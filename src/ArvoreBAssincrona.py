@@ -0,0 +1,218 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .ArvoreB import ArvoreB
+
+TAMANHO_BLOCO_PADRAO = 256
+
+
+class ArvoreBAssincrona:
+    def __init__(self, arvore: ArvoreB, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+        """
+        Fachada asyncio para uma Árvore B, em especial uma aberta com
+        ArvoreB.abrir(), cujas operações podem bloquear lendo páginas.
+
+        Todas as operações sobre a árvore rodam em um executor de uma única
+        thread, de modo que o laço de eventos nunca espera por E/S e a
+        árvore nunca é acessada por duas threads ao mesmo tempo. As buscas
+        são agrupadas: as que chegam enquanto o executor está ocupado
+        esperam juntas e seguem em um único lote, em ordem crescente de
+        chave, para que descidas vizinhas reaproveitem as páginas já
+        carregadas no pool; buscas pela mesma chave compartilham o mesmo
+        resultado. Uma escrita despacha antes as buscas pendentes, e buscas
+        iniciadas depois dela nunca reaproveitam resultados anteriores.
+
+        Args:
+            arvore (ArvoreB): Árvore a ser usada exclusivamente por esta fachada.
+            tamanho_bloco (int): Chaves lidas por vez em intervalo().
+
+        Attributes:
+            lotes_busca (int): Lotes de busca enviados ao executor.
+            buscas_coalescidas (int): Buscas atendidas por um resultado compartilhado.
+
+        Raises:
+            ValueError: Se o tamanho do bloco não for positivo.
+        """
+        if tamanho_bloco < 1:
+            raise ValueError("O tamanho do bloco deve ser um inteiro positivo")
+        self.arvore: ArvoreB = arvore
+        self.tamanho_bloco: int = tamanho_bloco
+        self.lotes_busca: int = 0
+        self.buscas_coalescidas: int = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arvoreb")
+        self._pendentes: Dict[int, asyncio.Future] = {}
+        self._compartilhadas: Dict[int, asyncio.Future] = {}
+        self._lotes_em_voo: int = 0
+
+    @classmethod
+    async def abrir(cls, caminho: str, m: Optional[int] = None,
+                    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                    **opcoes: Any) -> "ArvoreBAssincrona":
+        """
+        Abre (ou cria) uma árvore em arquivo sem bloquear o laço de eventos.
+
+        Args:
+            caminho (str): Arquivo de páginas.
+            m (Optional[int]): Grau mínimo; obrigatório apenas na criação.
+            tamanho_bloco (int): Chaves lidas por vez em intervalo().
+            **opcoes (Any): Demais argumentos de ArvoreB.abrir().
+
+        Returns:
+            ArvoreBAssincrona: Fachada sobre a árvore aberta.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            arvore = await loop.run_in_executor(
+                executor, lambda: ArvoreB.abrir(caminho, m, **opcoes))
+        finally:
+            executor.shutdown(wait=False)
+        return cls(arvore, tamanho_bloco)
+
+    async def __aenter__(self) -> "ArvoreBAssincrona":
+        return self
+
+    async def __aexit__(self, *excecao: Any) -> None:
+        await self.fechar()
+
+    async def _executar(self, funcao, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, funcao, *args)
+
+    async def buscar(self, chave: int) -> Optional[int]:
+        """
+        Busca uma chave, agrupando-a com as demais buscas simultâneas.
+
+        Args:
+            chave (int): Valor a ser buscado.
+
+        Returns:
+            Optional[int]: A chave se encontrada, ou None caso contrário.
+        """
+        futuro = self._compartilhadas.get(chave)
+        if futuro is not None:
+            self.buscas_coalescidas += 1
+        else:
+            futuro = asyncio.get_running_loop().create_future()
+            self._compartilhadas[chave] = futuro
+            self._pendentes[chave] = futuro
+            if not self._lotes_em_voo:
+                self._despachar()
+        return await asyncio.shield(futuro)
+
+    def _despachar(self) -> None:
+        """
+        Envia ao executor, como um único lote, as buscas pendentes.
+
+        Normalmente há um só lote em voo, e as buscas que chegam durante ele
+        esperam o seu fim. Uma escrita despacha as pendentes mesmo com um
+        lote em voo, para que sejam executadas antes dela; por isso os lotes
+        em voo são contados, e as pendentes só seguem quando o último deles
+        termina.
+        """
+        if not self._pendentes:
+            return
+        lote, self._pendentes = self._pendentes, {}
+        compartilhadas = self._compartilhadas
+        chaves = sorted(lote)
+        self.lotes_busca += 1
+        self._lotes_em_voo += 1
+        tarefa = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._buscar_lote, chaves)
+
+        def entregar(concluida: asyncio.Future) -> None:
+            self._lotes_em_voo -= 1
+            erro = None if concluida.cancelled() else concluida.exception()
+            for indice, chave in enumerate(chaves):
+                futuro = lote[chave]
+                if compartilhadas.get(chave) is futuro:
+                    del compartilhadas[chave]
+                if futuro.done():
+                    continue
+                if concluida.cancelled():
+                    futuro.cancel()
+                elif erro is not None:
+                    futuro.set_exception(erro)
+                else:
+                    futuro.set_result(concluida.result()[indice])
+            if not self._lotes_em_voo:
+                self._despachar()
+
+        tarefa.add_done_callback(entregar)
+
+    def _buscar_lote(self, chaves: List[int]) -> List[Optional[int]]:
+        buscar = self.arvore.buscar
+        return [buscar(chave) for chave in chaves]
+
+    def _antes_de_escrever(self) -> None:
+        """
+        Ordena a escrita depois das buscas já pedidas e impede que buscas
+        posteriores a ela compartilhem resultados anteriores.
+        """
+        self._despachar()
+        self._compartilhadas = {}
+
+    async def inserir(self, chave: int) -> None:
+        """
+        Insere uma chave na árvore.
+
+        Args:
+            chave (int): Valor a inserir (único).
+        """
+        self._antes_de_escrever()
+        await self._executar(self.arvore.inserir, chave)
+
+    async def remover(self, chave: int) -> None:
+        """
+        Remove uma chave da árvore.
+
+        Args:
+            chave (int): Valor a remover.
+        """
+        self._antes_de_escrever()
+        await self._executar(self.arvore.remover, chave)
+
+    async def intervalo(self, inicio: Optional[int] = None,
+                        fim: Optional[int] = None) -> AsyncIterator[int]:
+        """
+        Percorre em ordem crescente as chaves em [inicio, fim], lendo blocos
+        de tamanho_bloco chaves no executor.
+
+        Cada bloco é uma varredura consistente que recomeça logo após a última
+        chave entregue, de modo que escritas podem ocorrer entre blocos: as
+        chaves saem sempre em ordem crescente e sem repetição, e chaves
+        inseridas ou removidas adiante do cursor aparecem ou não conforme o
+        momento da leitura do seu bloco.
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo (None: sem limite).
+            fim (Optional[int]): Limite superior inclusivo (None: sem limite).
+
+        Returns:
+            AsyncIterator[int]: Gerador assíncrono das chaves no intervalo.
+        """
+        ultima = None
+        while True:
+            bloco = await self._executar(self._ler_bloco, inicio, fim, ultima)
+            for chave in bloco:
+                yield chave
+            if len(bloco) < self.tamanho_bloco:
+                return
+            inicio = ultima = bloco[-1]
+
+    def _ler_bloco(self, inicio: Optional[int], fim: Optional[int],
+                   ultima: Optional[int]) -> List[int]:
+        chaves = self.arvore.intervalo(inicio, fim)
+        if ultima is not None:
+            chaves = (chave for chave in chaves if chave != ultima)
+        return list(islice(chaves, self.tamanho_bloco))
+
+    async def fechar(self) -> None:
+        """
+        Espera as operações pendentes, fecha a árvore (se aberta com abrir())
+        e encerra o executor.
+        """
+        self._despachar()
+        await self._executar(self.arvore.fechar)
+        self._executor.shutdown()
@@ -0,0 +1,310 @@
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator, List, Optional
+
+from .Pagina import Pagina
+
+ASSINATURA_CONGELADA = b"ARVOREBC"
+CABECALHO_CONGELADA = struct.Struct("<8sIIqq")
+TAMANHO_CABECALHO_CONGELADA = 64
+
+
+class ArvoreBCongelada:
+    def __init__(self, t: int, altura: int, inicios: Any, filhos: Any,
+                 posicoes: Any, chaves: Any, mapa: Optional[mmap.mmap] = None):
+        """
+        Árvore B somente leitura compilada em vetores contíguos de int64,
+        criada por ArvoreB.congelar() ou por ArvoreBCongelada.abrir().
+
+        As páginas ficam em ordem de nível, de modo que os filhos de cada
+        página são consecutivos e basta guardar o índice do primeiro. As
+        chaves de todas as páginas ficam em um único buffer, e cada página
+        é a fatia chaves[inicios[p]:inicios[p + 1]]. Não há objetos por
+        página: a busca é uma sequência de bisect em fatias do buffer.
+
+        Args:
+            t (int): Grau mínimo da árvore de origem.
+            altura (int): Altura da árvore.
+            inicios (Any): Início de cada página no buffer de chaves, mais
+                o total de chaves ao fim (array('q') ou memoryview).
+            filhos (Any): Índice do primeiro filho de cada página, ou -1
+                nas folhas.
+            posicoes (Any): Posição, na ordem crescente, da menor chave da
+                subárvore de cada página.
+            chaves (Any): Chaves de todas as páginas, em ordem de nível.
+            mapa (Optional[mmap.mmap]): Arquivo mapeado do qual os vetores
+                são vistas, quando aberta com abrir().
+        """
+        self.t: int = t
+        self._altura: int = altura
+        self._inicios = inicios
+        self._filhos = filhos
+        self._posicoes = posicoes
+        self._chaves = chaves
+        self._mapa: Optional[mmap.mmap] = mapa
+
+    @classmethod
+    def compilar(cls, raiz: Optional[Pagina], t: int) -> "ArvoreBCongelada":
+        """
+        Compila as páginas de uma árvore em vetores: uma passada em ordem
+        de nível copia as chaves, outra em ordem inversa soma os tamanhos
+        das subárvores e a última deriva deles as posições.
+
+        Args:
+            raiz (Optional[Pagina]): Raiz da árvore de origem.
+            t (int): Grau mínimo da árvore de origem.
+
+        Returns:
+            ArvoreBCongelada: Cópia somente leitura da árvore.
+
+        Raises:
+            ValueError: Se alguma chave não for um inteiro de 64 bits.
+        """
+        fila: List[Pagina] = [] if raiz is None else [raiz]
+        inicios, filhos, chaves = array("q", [0]), array("q"), array("q")
+        try:
+            for pagina in fila:
+                chaves.extend(pagina.registros[:pagina.qtdRegistros])
+                inicios.append(len(chaves))
+                if pagina.folha:
+                    filhos.append(-1)
+                else:
+                    filhos.append(len(fila))
+                    fila.extend(pagina.paginas[:pagina.qtdRegistros + 1])
+        except (TypeError, OverflowError):
+            raise ValueError("A árvore congelada aceita apenas chaves inteiras de 64 bits")
+        altura = 0
+        indice = 0 if fila else -1
+        while indice >= 0:
+            altura += 1
+            indice = filhos[indice]
+
+        tamanhos = [0] * len(fila)
+        for indice in range(len(fila) - 1, -1, -1):
+            tamanhos[indice] = inicios[indice + 1] - inicios[indice]
+            if filhos[indice] >= 0:
+                quantidade = tamanhos[indice] + 1
+                tamanhos[indice] += sum(tamanhos[filhos[indice]:filhos[indice] + quantidade])
+        posicoes = array("q", [0] * len(fila))
+        for indice in range(len(fila)):
+            primeiro = filhos[indice]
+            if primeiro < 0:
+                continue
+            posicao = posicoes[indice]
+            for filho in range(primeiro, primeiro + inicios[indice + 1] - inicios[indice] + 1):
+                posicoes[filho] = posicao
+                posicao += tamanhos[filho] + 1
+        return cls(t, altura, inicios, filhos, posicoes, chaves)
+
+    def salvar(self, caminho: str) -> None:
+        """
+        Grava os vetores em um arquivo que abrir() mapeia sem cópia.
+
+        O arquivo tem um cabeçalho de 64 bytes (assinatura, grau, altura,
+        quantidade de páginas e de chaves) seguido dos vetores de início,
+        primeiro filho, posição e chaves, todos int64 na ordem de bytes
+        da máquina.
+
+        Args:
+            caminho (str): Arquivo de destino.
+        """
+        cabecalho = CABECALHO_CONGELADA.pack(ASSINATURA_CONGELADA, self.t, self._altura,
+                                             len(self._filhos), len(self._chaves))
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(cabecalho.ljust(TAMANHO_CABECALHO_CONGELADA, b"\0"))
+            for vetor in (self._inicios, self._filhos, self._posicoes, self._chaves):
+                arquivo.write(memoryview(vetor).cast("B"))
+
+    @classmethod
+    def abrir(cls, caminho: str) -> "ArvoreBCongelada":
+        """
+        Mapeia em memória um arquivo gravado por salvar(). Os vetores são
+        vistas do mapeamento, sem leitura nem cópia: a abertura custa O(1)
+        e as páginas do arquivo são carregadas pelo sistema sob demanda.
+        Deve ser encerrada com fechar().
+
+        Args:
+            caminho (str): Arquivo de origem.
+
+        Returns:
+            ArvoreBCongelada: Árvore ligada ao arquivo mapeado.
+
+        Raises:
+            ValueError: Se o arquivo não for uma árvore congelada válida.
+        """
+        with open(caminho, "rb") as arquivo:
+            tamanho = arquivo.seek(0, 2)
+            if tamanho < TAMANHO_CABECALHO_CONGELADA:
+                raise ValueError(f"{caminho} não é uma Árvore B congelada")
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        assinatura, t, altura, n_paginas, n_chaves = CABECALHO_CONGELADA.unpack_from(mapa, 0)
+        if assinatura != ASSINATURA_CONGELADA:
+            mapa.close()
+            raise ValueError(f"{caminho} não é uma Árvore B congelada")
+        if tamanho != TAMANHO_CABECALHO_CONGELADA + 8 * (3 * n_paginas + 1 + n_chaves):
+            mapa.close()
+            raise ValueError(f"Árvore congelada truncada: {caminho}")
+        return cls(t, altura, *_vistas(mapa, n_paginas, n_chaves), mapa=mapa)
+
+    def fechar(self) -> None:
+        """
+        Libera o mapeamento de uma árvore aberta com abrir(). A árvore fica
+        vazia, e iteradores ainda abertos sobre ela passam a lançar
+        ValueError ao avançar.
+
+        Raises:
+            BufferError: Se alguma vista do mapeamento ainda estiver em uso;
+                nesse caso a árvore continua aberta e utilizável.
+        """
+        if self._mapa is None:
+            return
+        try:
+            for vetor in (self._inicios, self._filhos, self._posicoes, self._chaves):
+                vetor.release()
+            self._mapa.close()
+        except BufferError:
+            _, _, _, n_paginas, n_chaves = CABECALHO_CONGELADA.unpack_from(self._mapa, 0)
+            self._inicios, self._filhos, self._posicoes, self._chaves = \
+                _vistas(self._mapa, n_paginas, n_chaves)
+            raise
+        self._mapa = None
+        self._altura = 0
+        self._inicios, self._filhos = array("q", [0]), array("q")
+        self._posicoes, self._chaves = array("q"), array("q")
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de chaves.
+
+        Returns:
+            int: Quantidade de chaves.
+        """
+        return len(self._chaves)
+
+    def altura(self) -> int:
+        """
+        Retorna a altura da árvore.
+
+        Returns:
+            int: Altura.
+        """
+        return self._altura
+
+    def buscar(self, chave: int) -> Optional[int]:
+        """
+        Busca uma chave descendo pelas fatias do buffer de chaves.
+
+        Args:
+            chave (int): Valor buscado.
+
+        Returns:
+            Optional[int]: A chave se encontrada, ou None.
+        """
+        chaves, inicios, filhos = self._chaves, self._inicios, self._filhos
+        pagina = 0 if len(filhos) else -1
+        while pagina >= 0:
+            inicio, fim = inicios[pagina], inicios[pagina + 1]
+            i = bisect_left(chaves, chave, inicio, fim)
+            if i < fim and chaves[i] == chave:
+                return chave
+            primeiro = filhos[pagina]
+            pagina = primeiro + i - inicio if primeiro >= 0 else -1
+        return None
+
+    def rank(self, chave: int) -> int:
+        """
+        Retorna quantas chaves são menores que a chave dada, em O(log n),
+        usando a posição guardada para cada subárvore.
+
+        Args:
+            chave (int): Chave de referência (não precisa existir).
+
+        Returns:
+            int: Posição que a chave ocupa (ou ocuparia) na ordem crescente.
+        """
+        chaves, inicios, filhos = self._chaves, self._inicios, self._filhos
+        if not len(filhos):
+            return 0
+        pagina = 0
+        while True:
+            inicio, fim = inicios[pagina], inicios[pagina + 1]
+            i = bisect_left(chaves, chave, inicio, fim)
+            primeiro = filhos[pagina]
+            if primeiro < 0:
+                return self._posicoes[pagina] + i - inicio
+            if i < fim and chaves[i] == chave:
+                return self._posicoes[primeiro + i - inicio + 1] - 1
+            pagina = primeiro + i - inicio
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Percorre todas as chaves em ordem crescente.
+
+        Returns:
+            Iterator[int]: Gerador das chaves.
+        """
+        return self.intervalo()
+
+    def intervalo(self, inicio: Optional[int] = None,
+                  fim: Optional[int] = None) -> Iterator[int]:
+        """
+        Percorre em ordem crescente as chaves em [inicio, fim], com uma
+        pilha explícita de (página, próximo índice no buffer).
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo (None: sem limite).
+            fim (Optional[int]): Limite superior inclusivo (None: sem limite).
+
+        Yields:
+            int: Próxima chave do intervalo.
+        """
+        chaves, inicios, filhos = self._chaves, self._inicios, self._filhos
+        pilha: List[List[int]] = []
+        pagina = 0 if len(filhos) else -1
+        while pagina >= 0:
+            i = inicios[pagina] if inicio is None else \
+                bisect_left(chaves, inicio, inicios[pagina], inicios[pagina + 1])
+            pilha.append([pagina, i])
+            primeiro = filhos[pagina]
+            pagina = primeiro + i - inicios[pagina] if primeiro >= 0 else -1
+
+        while pilha:
+            topo = pilha[-1]
+            pagina, i = topo
+            limite = inicios[pagina + 1]
+            primeiro = filhos[pagina]
+            if primeiro < 0:
+                pilha.pop()
+                corte = limite if fim is None else bisect_right(chaves, fim, i, limite)
+                for indice in range(i, corte):
+                    yield chaves[indice]
+                if corte < limite:
+                    return
+                continue
+            if i == limite:
+                pilha.pop()
+                continue
+            chave = chaves[i]
+            if fim is not None and chave > fim:
+                return
+            yield chave
+            topo[1] = i + 1
+            filho = primeiro + i - inicios[pagina] + 1
+            while filho >= 0:
+                pilha.append([filho, inicios[filho]])
+                filho = filhos[filho]
+
+
+def _vistas(mapa: mmap.mmap, n_paginas: int, n_chaves: int) -> List[memoryview]:
+    """
+    Cria as vistas int64 dos vetores de início, primeiro filho, posição e
+    chaves de um arquivo mapeado.
+    """
+    vetores = []
+    posicao = TAMANHO_CABECALHO_CONGELADA
+    for quantidade in (n_paginas + 1, n_paginas, n_paginas, n_chaves):
+        vetores.append(memoryview(mapa)[posicao:posicao + 8 * quantidade].cast("q"))
+        posicao += 8 * quantidade
+    return vetores
@@ -0,0 +1,716 @@
+import icontract
+from bisect import bisect_left, bisect_right
+from typing import Optional, List, Callable, Iterator, Set, Tuple, Any
+from .Pagina import Pagina
+from .PaginaBMais import FOLHAS_ENCADEADAS
+from .ModoContratos import ModoContratos
+
+
+@icontract.invariant(
+    lambda self: not self.contratos.ativo() or self._folhas_mesmo_nivel(),
+    "Nem todas as folhas estão no mesmo nível da árvore"
+)
+@icontract.invariant(
+    lambda self: not self.contratos.ativo() or self._separadores_ok(),
+    "Existe uma chave fora da faixa definida pelos separadores do pai"
+)
+@icontract.invariant(
+    lambda self: not self.contratos.ativo() or self._encadeamento_ok(),
+    "O encadeamento das folhas não corresponde à ordem da árvore"
+)
+class ArvoreBMais:
+    def __init__(self, m: int, contratos: Optional[str] = None,
+                 amostragem: Optional[int] = None,
+                 tipo_pagina: Callable[[int, bool], Pagina] = Pagina):
+        """
+        Inicializa uma nova Árvore B+.
+
+        Todas as chaves ficam nas folhas; as páginas internas guardam apenas
+        cópias separadoras usadas para rotear a descida (o filho i contém as
+        chaves em [registros[i-1], registros[i])). Cada folha aponta para a
+        anterior e a próxima, de modo que intervalos e iterações descem uma
+        única vez e depois percorrem as folhas em sequência. Remoções não
+        alteram os separadores, que continuam válidos como rotas.
+
+        Args:
+            m (int): Grau mínimo da árvore (t), define limites de chaves por página.
+            contratos (Optional[str]): Nível de verificação dos contratos
+                ("completo", "amostrado", "desligado" ou "incremental").
+                Padrão: variável de ambiente ARVOREB_CONTRATOS ou "completo".
+            amostragem (Optional[int]): No modo amostrado, verifica os contratos
+                a cada N operações. Padrão: ARVOREB_AMOSTRAGEM ou 100.
+            tipo_pagina (Callable[[int, bool], Pagina]): Representação das
+                páginas: Pagina, PaginaCompacta ou PaginaCompactaInt. As
+                folhas usam a subclasse encadeada correspondente (ver
+                PaginaBMais), que acrescenta os ponteiros entre folhas.
+
+        Raises:
+            ValueError: Se a representação não tiver folha encadeada.
+
+        Attributes:
+            raiz (Optional[Pagina]): Página raiz da árvore.
+            t (int): Grau mínimo.
+            min_chaves (int): Número mínimo de chaves (t - 1).
+            max_chaves (int): Número máximo de chaves (2*t - 1).
+            contratos (ModoContratos): Controle do nível de verificação.
+        """
+        self.contratos: ModoContratos = ModoContratos(contratos, amostragem)
+        self.raiz: Optional[Pagina] = None
+        self.t: int = m
+        self.min_chaves: int = m - 1
+        self.max_chaves: int = 2 * m - 1
+        if tipo_pagina not in FOLHAS_ENCADEADAS:
+            raise ValueError("A Árvore B+ aceita apenas Pagina, PaginaCompacta "
+                             "ou PaginaCompactaInt")
+        self.tipo_pagina: Callable[[int, bool], Pagina] = tipo_pagina
+        self.tipo_folha: Callable[[int, bool], Pagina] = FOLHAS_ENCADEADAS[tipo_pagina]
+        self._tocadas: Optional[Set[Pagina]] = None
+
+    def _nova_pagina(self, folha: bool) -> Pagina:
+        """
+        Cria uma página vazia na representação escolhida para a árvore;
+        folhas usam a variante encadeada. A página é registrada como tocada.
+
+        Args:
+            folha (bool): Indica se a página é folha.
+
+        Returns:
+            Pagina: Nova página sem chaves.
+        """
+        pagina = (self.tipo_folha if folha else self.tipo_pagina)(self.t, folha)
+        self._tocar(pagina)
+        return pagina
+
+    def _tocar(self, *paginas: Pagina) -> None:
+        """
+        Registra páginas modificadas pela operação corrente (modo incremental).
+
+        Args:
+            *paginas (Pagina): Páginas alteradas.
+        """
+        if self._tocadas is not None:
+            self._tocadas.update(paginas)
+
+    def _descartar(self, pagina: Pagina) -> None:
+        """
+        Remove do registro de páginas tocadas uma página que deixou de fazer
+        parte da árvore.
+
+        Args:
+            pagina (Pagina): Página descartada por fusão ou colapso da raiz.
+        """
+        if self._tocadas is not None:
+            self._tocadas.discard(pagina)
+
+    def _iniciar_registro_tocadas(self) -> None:
+        """
+        Reinicia o registro de páginas tocadas, se o modo incremental estiver ativo.
+        """
+        self._tocadas = set() if self.contratos.incremental else None
+
+    def _altura_interna(self) -> int:
+        """
+        Calcula a altura da árvore descendo pelo primeiro filho.
+
+        Returns:
+            int: Altura total (níveis) da árvore.
+        """
+        altura = 0
+        pagina = self.raiz
+        while pagina is not None:
+            altura += 1
+            pagina = None if pagina.folha else pagina.paginas[0]
+        return altura
+
+    def _todos_nos(self) -> List[Pagina]:
+        """
+        Coleta todas as páginas da árvore em pré-ordem.
+
+        Returns:
+            List[Pagina]: Lista de todas as páginas.
+        """
+        resultado: List[Pagina] = []
+        pilha: List[Optional[Pagina]] = [self.raiz]
+        while pilha:
+            node = pilha.pop()
+            if node is None:
+                continue
+            resultado.append(node)
+            if not node.folha:
+                pilha.extend(reversed(node.paginas[: node.qtdRegistros + 1]))
+        return resultado
+
+    def _folhas_mesmo_nivel(self) -> bool:
+        """
+        Verifica se todas as folhas estão no mesmo nível de profundidade.
+
+        Returns:
+            bool: True se todas as folhas têm a mesma profundidade.
+        """
+        if self.raiz is None:
+            return True
+        niveis: Set[int] = set()
+        pilha: List[Tuple[Pagina, int]] = [(self.raiz, 1)]
+        while pilha:
+            node, profundidade = pilha.pop()
+            if node.folha:
+                niveis.add(profundidade)
+            else:
+                pilha.extend((filho, profundidade + 1)
+                             for filho in node.paginas[: node.qtdRegistros + 1])
+        return len(niveis) == 1
+
+    def _separadores_ok(self) -> bool:
+        """
+        Verifica se as chaves de cada página estão em ordem estritamente
+        crescente e dentro da faixa [inferior, superior) que os separadores
+        dos ancestrais atribuem à página.
+
+        Returns:
+            bool: True se todas as páginas respeitarem suas faixas.
+        """
+        pilha: List[Tuple[Pagina, Any, Any]] = [] if self.raiz is None else [(self.raiz, None, None)]
+        while pilha:
+            node, inferior, superior = pilha.pop()
+            chaves = list(node.registros[:node.qtdRegistros])
+            if len(node.registros) != node.qtdRegistros:
+                return False
+            if any(a >= b for a, b in zip(chaves, chaves[1:])):
+                return False
+            if chaves and inferior is not None and chaves[0] < inferior:
+                return False
+            if chaves and superior is not None and chaves[-1] >= superior:
+                return False
+            if not node.folha:
+                limites = [inferior] + chaves + [superior]
+                pilha.extend((node.paginas[i], limites[i], limites[i + 1])
+                             for i in range(node.qtdRegistros + 1))
+        return True
+
+    def _encadeamento_ok(self) -> bool:
+        """
+        Verifica se a lista encadeada de folhas, a partir da primeira, passa
+        pelas mesmas folhas e na mesma ordem que o percurso da árvore, com
+        os ponteiros para a anterior coerentes.
+
+        Returns:
+            bool: True se o encadeamento estiver correto.
+        """
+        folhas = [node for node in self._todos_nos() if node.folha]
+        anterior = None
+        folha = folhas[0] if folhas else None
+        encadeadas = []
+        while folha is not None and len(encadeadas) <= len(folhas):
+            if folha.anterior is not anterior:
+                return False
+            encadeadas.append(folha)
+            anterior, folha = folha, folha.proxima
+        return len(encadeadas) == len(folhas) and all(
+            a is b for a, b in zip(encadeadas, folhas))
+
+    def _limites_chaves_ok(self) -> bool:
+        """
+        Verifica se cada página respeita os limites de chaves:
+
+          - Raiz: 1 <= qtdRegistros <= max_chaves
+          - Demais: min_chaves <= qtdRegistros <= max_chaves
+
+        Returns:
+            bool: True se todos estiverem dentro dos limites.
+        """
+        for no in self._todos_nos():
+            minimo, maximo = ((1, self.max_chaves) if no is self.raiz
+                              else (self.min_chaves, self.max_chaves))
+            if not (minimo <= no.qtdRegistros <= maximo):
+                return False
+        return True
+
+    def _limites_filhos_ok(self) -> bool:
+        """
+        Verifica se cada página interna tem um filho a mais que chaves e
+        número de filhos dentro dos limites:
+
+          - Raiz: 2 <= filhos <= 2*t
+          - Demais internos: t <= filhos <= 2*t
+
+        Returns:
+            bool: True se todos os internos satisfazem a condição.
+        """
+        for no in self._todos_nos():
+            if not no.folha:
+                contagem = len(no.paginas)
+                minimo, maximo = ((2, 2 * self.t) if no is self.raiz
+                                  else (self.t, 2 * self.t))
+                if contagem != no.qtdRegistros + 1 or not (minimo <= contagem <= maximo):
+                    return False
+        return True
+
+    def _paginas_tocadas_ok(self) -> bool:
+        """
+        Verifica ordem e limites apenas nas páginas tocadas pela última operação:
+
+          - chaves em ordem estritamente crescente;
+          - limites de chaves (raiz e demais páginas);
+          - limites de filhos e nível homogêneo dos filhos, para internas;
+          - extremos de cada filho dentro da faixa dada pelos separadores;
+          - ponteiros das folhas recíprocos e em ordem com as vizinhas.
+
+        Returns:
+            bool: True se todas as páginas tocadas estiverem consistentes.
+        """
+        for no in self._tocadas or ():
+            n = no.qtdRegistros
+            registros = no.registros
+            if len(registros) != n:
+                return False
+            if any(registros[i] >= registros[i + 1] for i in range(n - 1)):
+                return False
+            minimo, maximo = ((1, self.max_chaves) if no is self.raiz
+                              else (self.min_chaves, self.max_chaves))
+            if not (minimo <= n <= maximo):
+                return False
+            if no.folha:
+                anterior, proxima = no.anterior, no.proxima
+                if anterior is not None and (anterior.proxima is not no
+                                             or anterior.registros[-1] >= registros[0]):
+                    return False
+                if proxima is not None and (proxima.anterior is not no
+                                            or proxima.registros[0] <= registros[-1]):
+                    return False
+                continue
+            filhos = no.paginas
+            minimo = 2 if no is self.raiz else self.t
+            if len(filhos) != n + 1 or len(filhos) < minimo:
+                return False
+            folha = filhos[0].folha
+            for i, filho in enumerate(filhos):
+                if filho.folha != folha or filho.qtdRegistros == 0:
+                    return False
+                if i > 0 and filho.registros[0] < registros[i - 1]:
+                    return False
+                if i < n and filho.registros[filho.qtdRegistros - 1] >= registros[i]:
+                    return False
+        return True
+
+    def altura(self) -> int:
+        """
+        Retorna a altura da árvore.
+
+        Returns:
+            int: Altura atual.
+        """
+        return self._altura_interna()
+
+    def _folha_de(self, chave: int) -> Optional[Pagina]:
+        """
+        Desce da raiz até a folha cuja faixa contém a chave.
+
+        Args:
+            chave (int): Chave procurada.
+
+        Returns:
+            Optional[Pagina]: Folha responsável pela chave, ou None se a
+            árvore estiver vazia.
+        """
+        pagina = self.raiz
+        while pagina is not None and not pagina.folha:
+            pagina = pagina.paginas[bisect_right(pagina.registros, chave, 0, pagina.qtdRegistros)]
+        return pagina
+
+    def _folha_extrema(self, ultima: bool) -> Optional[Pagina]:
+        """
+        Desce pela borda esquerda ou direita até a primeira ou última folha.
+
+        Args:
+            ultima (bool): True para a última folha, False para a primeira.
+
+        Returns:
+            Optional[Pagina]: A folha, ou None se a árvore estiver vazia.
+        """
+        pagina = self.raiz
+        while pagina is not None and not pagina.folha:
+            pagina = pagina.paginas[pagina.qtdRegistros if ultima else 0]
+        return pagina
+
+    def _buscar_em_folha(self, chave: int) -> Optional[int]:
+        """
+        Busca a chave na folha responsável por ela.
+
+        Args:
+            chave (int): Valor buscado.
+
+        Returns:
+            Optional[int]: A chave se encontrada, ou None.
+        """
+        folha = self._folha_de(chave)
+        if folha is None:
+            return None
+        i = bisect_left(folha.registros, chave, 0, folha.qtdRegistros)
+        if i < folha.qtdRegistros and folha.registros[i] == chave:
+            return folha.registros[i]
+        return None
+
+    def buscar(self, chave: int) -> Optional[int]:
+        """
+        Busca uma chave na árvore B+. Toda busca termina em uma folha.
+
+        Args:
+            chave (int): Valor a ser buscado.
+
+        Returns:
+            Optional[int]: A chave se encontrada, ou None caso contrário.
+        """
+        self.contratos.registrar_operacao()
+        return self._buscar_em_folha(chave)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Percorre todas as chaves em ordem crescente.
+
+        Returns:
+            Iterator[int]: Gerador das chaves.
+        """
+        return self._percorrer_intervalo(None, None)
+
+    def __reversed__(self) -> Iterator[int]:
+        """
+        Percorre todas as chaves em ordem decrescente.
+
+        Returns:
+            Iterator[int]: Gerador das chaves.
+        """
+        return self._percorrer_intervalo_reverso(None, None)
+
+    def intervalo(self, inicio: Optional[int] = None,
+                  fim: Optional[int] = None) -> Iterator[int]:
+        """
+        Percorre em ordem crescente as chaves em [inicio, fim].
+
+        O posicionamento no limite inferior custa O(log n); depois disso as
+        folhas são visitadas em sequência pelo encadeamento, sem voltar às
+        páginas internas. A árvore não deve ser modificada enquanto o gerador
+        estiver em uso.
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo (None: sem limite).
+            fim (Optional[int]): Limite superior inclusivo (None: sem limite).
+
+        Returns:
+            Iterator[int]: Gerador das chaves no intervalo.
+        """
+        return self._percorrer_intervalo(inicio, fim)
+
+    def intervalo_reverso(self, inicio: Optional[int] = None,
+                          fim: Optional[int] = None) -> Iterator[int]:
+        """
+        Percorre em ordem decrescente as chaves em [inicio, fim].
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo (None: sem limite).
+            fim (Optional[int]): Limite superior inclusivo (None: sem limite).
+
+        Returns:
+            Iterator[int]: Gerador das chaves no intervalo, da maior para a menor.
+        """
+        return self._percorrer_intervalo_reverso(inicio, fim)
+
+    def _percorrer_intervalo(self, inicio: Optional[int],
+                             fim: Optional[int]) -> Iterator[int]:
+        """
+        Gera as chaves em ordem crescente a partir da folha de `inicio`,
+        seguindo os ponteiros para a próxima folha.
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo.
+            fim (Optional[int]): Limite superior inclusivo.
+
+        Yields:
+            int: Próxima chave do intervalo.
+        """
+        if inicio is None:
+            folha, i = self._folha_extrema(False), 0
+        else:
+            folha = self._folha_de(inicio)
+            i = 0 if folha is None else bisect_left(folha.registros, inicio, 0, folha.qtdRegistros)
+        while folha is not None:
+            for chave in folha.registros[i:folha.qtdRegistros]:
+                if fim is not None and chave > fim:
+                    return
+                yield chave
+            folha, i = folha.proxima, 0
+
+    def _percorrer_intervalo_reverso(self, inicio: Optional[int],
+                                     fim: Optional[int]) -> Iterator[int]:
+        """
+        Gera as chaves em ordem decrescente a partir da folha de `fim`,
+        seguindo os ponteiros para a folha anterior.
+
+        Args:
+            inicio (Optional[int]): Limite inferior inclusivo.
+            fim (Optional[int]): Limite superior inclusivo.
+
+        Yields:
+            int: Próxima chave do intervalo, da maior para a menor.
+        """
+        if fim is None:
+            folha = self._folha_extrema(True)
+            j = None if folha is None else folha.qtdRegistros
+        else:
+            folha = self._folha_de(fim)
+            j = None if folha is None else bisect_right(folha.registros, fim, 0, folha.qtdRegistros)
+        while folha is not None:
+            for chave in reversed(folha.registros[:j]):
+                if inicio is not None and chave < inicio:
+                    return
+                yield chave
+            folha = folha.anterior
+            j = None if folha is None else folha.qtdRegistros
+
+    @icontract.require(
+        lambda self, chave: not self.contratos.local()
+                            or self._buscar_em_folha(chave) is None,
+        "Chave já existe na árvore; duplicatas não são permitidas"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_chaves_ok(),
+        "Após inserção, cada página deve respeitar limites de chaves"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_filhos_ok(),
+        "Após inserção, cada página interna deve respeitar limites de filhos"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.incremental or self._paginas_tocadas_ok(),
+        "Após inserção, as páginas modificadas devem manter ordem e limites"
+    )
+    @icontract.snapshot(lambda self: self._altura_interna(), name="altura_antiga")
+    @icontract.ensure(
+        lambda self, OLD: not self.contratos.local()
+                          or self._altura_interna() == OLD.altura_antiga
+                          or self._altura_interna() == OLD.altura_antiga + 1,
+        "Após divisão da raiz, a altura deve permanecer igual ou aumentar em 1"
+    )
+    def inserir(self, chave: int) -> None:
+        """
+        Insere uma chave na folha responsável por ela, dividindo na descida
+        as páginas cheias do caminho.
+
+        Args:
+            chave (int): Valor a inserir (único).
+        """
+        self.contratos.registrar_operacao()
+        self._iniciar_registro_tocadas()
+        if self.raiz is None:
+            self.raiz = self._nova_pagina(True)
+            self.raiz.registros.append(chave)
+            self.raiz.qtdRegistros = 1
+            return
+        if self.raiz.qtdRegistros == self.max_chaves:
+            nova = self._nova_pagina(False)
+            nova.paginas = [self.raiz]
+            self._dividir_pagina(nova, 0)
+            self.raiz = nova
+        pagina = self.raiz
+        while not pagina.folha:
+            i = bisect_right(pagina.registros, chave, 0, pagina.qtdRegistros)
+            if pagina.paginas[i].qtdRegistros == self.max_chaves:
+                self._dividir_pagina(pagina, i)
+                if chave >= pagina.registros[i]:
+                    i += 1
+            pagina = pagina.paginas[i]
+        i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+        self._tocar(pagina)
+        pagina.registros.insert(i, chave)
+        pagina.qtdRegistros += 1
+
+    def _dividir_pagina(self, pai: Pagina, indice: int) -> None:
+        """
+        Divide um filho cheio. Uma folha mantém t chaves, passa as demais
+        para a nova folha e sobe uma cópia da primeira delas como separador;
+        uma página interna promove a chave do meio, como na Árvore B.
+
+        Args:
+            pai (Pagina): Página pai.
+            indice (int): Índice da página a dividir.
+        """
+        filho = pai.paginas[indice]
+        novo = self._nova_pagina(filho.folha)
+        self._tocar(pai, filho)
+        if filho.folha:
+            novo.registros = filho.registros[self.t:]
+            filho.registros = filho.registros[:self.t]
+            separador = novo.registros[0]
+            novo.anterior, novo.proxima = filho, filho.proxima
+            if filho.proxima is not None:
+                self._tocar(filho.proxima)
+                filho.proxima.anterior = novo
+            filho.proxima = novo
+        else:
+            meio = self.max_chaves // 2
+            separador = filho.registros[meio]
+            novo.registros = filho.registros[meio + 1:]
+            novo.paginas = filho.paginas[meio + 1:]
+            filho.registros = filho.registros[:meio]
+            filho.paginas = filho.paginas[:meio + 1]
+        novo.qtdRegistros = len(novo.registros)
+        filho.qtdRegistros = len(filho.registros)
+        pai.registros.insert(indice, separador)
+        pai.qtdRegistros += 1
+        pai.paginas.insert(indice + 1, novo)
+
+    @icontract.require(
+        lambda self, chave: not self.contratos.local()
+                            or self._buscar_em_folha(chave) is not None,
+        "Chave não existe na árvore"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_chaves_ok(),
+        "Após remoção, cada página deve respeitar limites de chaves"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.ativo() or self._limites_filhos_ok(),
+        "Após remoção, cada página interna deve respeitar limites de filhos"
+    )
+    @icontract.ensure(
+        lambda self: not self.contratos.incremental or self._paginas_tocadas_ok(),
+        "Após remoção, as páginas modificadas devem manter ordem e limites"
+    )
+    @icontract.snapshot(lambda self: self._altura_interna(), name="altura_antiga")
+    @icontract.ensure(
+        lambda self, OLD: not self.contratos.local()
+                          or self._altura_interna() == OLD.altura_antiga
+                          or self._altura_interna() == OLD.altura_antiga - 1,
+        "Após fusão da raiz, a altura deve permanecer igual ou diminuir em 1"
+    )
+    def remover(self, chave: int) -> None:
+        """
+        Remove uma chave da folha responsável por ela. Na descida, cada filho
+        com o mínimo de chaves recebe uma chave de um irmão ou é fundido com
+        ele, de modo que a folha sempre pode perder uma chave. Os separadores
+        das páginas internas não precisam ser trocados.
+
+        Args:
+            chave (int): Valor a remover.
+        """
+        self.contratos.registrar_operacao()
+        self._iniciar_registro_tocadas()
+        if self.raiz is None:
+            return
+        pagina = self.raiz
+        while not pagina.folha:
+            i = bisect_right(pagina.registros, chave, 0, pagina.qtdRegistros)
+            if pagina.paginas[i].qtdRegistros == self.min_chaves:
+                i = self._ajustar_filho(pagina, i)
+            pagina = pagina.paginas[i]
+        i = bisect_left(pagina.registros, chave, 0, pagina.qtdRegistros)
+        if i < pagina.qtdRegistros and pagina.registros[i] == chave:
+            self._tocar(pagina)
+            del pagina.registros[i]
+            pagina.qtdRegistros -= 1
+        self._recolher_raiz()
+
+    def _ajustar_filho(self, pai: Pagina, idx: int) -> int:
+        """
+        Garante que o filho tenha chaves suficientes, fazendo empréstimo ou fusão.
+
+        Args:
+            pai (Pagina): Página pai.
+            idx (int): Índice do filho a ajustar.
+
+        Returns:
+            int: Índice do filho que agora cobre a faixa do filho original.
+        """
+        if idx > 0 and pai.paginas[idx - 1].qtdRegistros > self.min_chaves:
+            self._emprestar_de_anterior(pai, idx)
+        elif idx < pai.qtdRegistros and pai.paginas[idx + 1].qtdRegistros > self.min_chaves:
+            self._emprestar_de_posterior(pai, idx)
+        elif idx < pai.qtdRegistros:
+            self._fundir_paginas(pai, idx)
+        else:
+            self._fundir_paginas(pai, idx - 1)
+            return idx - 1
+        return idx
+
+    def _emprestar_de_anterior(self, pai: Pagina, idx: int) -> None:
+        """
+        Move a última chave do irmão anterior para o filho. Entre folhas, o
+        separador passa a ser a nova primeira chave do filho; entre páginas
+        internas, a chave gira pelo pai.
+
+        Args:
+            pai (Pagina): Página pai.
+            idx (int): Índice do filho receptor.
+        """
+        filho = pai.paginas[idx]
+        irmao = pai.paginas[idx - 1]
+        self._tocar(pai, filho, irmao)
+        if filho.folha:
+            filho.registros.insert(0, irmao.registros.pop())
+            pai.registros[idx - 1] = filho.registros[0]
+        else:
+            filho.registros.insert(0, pai.registros[idx - 1])
+            filho.paginas.insert(0, irmao.paginas.pop())
+            pai.registros[idx - 1] = irmao.registros.pop()
+        filho.qtdRegistros += 1
+        irmao.qtdRegistros -= 1
+
+    def _emprestar_de_posterior(self, pai: Pagina, idx: int) -> None:
+        """
+        Move a primeira chave do irmão posterior para o filho. Entre folhas,
+        o separador passa a ser a nova primeira chave do irmão; entre
+        páginas internas, a chave gira pelo pai.
+
+        Args:
+            pai (Pagina): Página pai.
+            idx (int): Índice do filho receptor.
+        """
+        filho = pai.paginas[idx]
+        irmao = pai.paginas[idx + 1]
+        self._tocar(pai, filho, irmao)
+        if filho.folha:
+            filho.registros.append(irmao.registros.pop(0))
+            pai.registros[idx] = irmao.registros[0]
+        else:
+            filho.registros.append(pai.registros[idx])
+            filho.paginas.append(irmao.paginas.pop(0))
+            pai.registros[idx] = irmao.registros.pop(0)
+        filho.qtdRegistros += 1
+        irmao.qtdRegistros -= 1
+
+    def _fundir_paginas(self, pai: Pagina, idx: int) -> None:
+        """
+        Funde o filho com o irmão posterior. O separador do pai é descartado
+        entre folhas (é apenas uma cópia) e desce entre páginas internas.
+
+        Args:
+            pai (Pagina): Página pai.
+            idx (int): Índice da página à esquerda da fusão.
+        """
+        filho = pai.paginas[idx]
+        irmao = pai.paginas.pop(idx + 1)
+        separador = pai.registros.pop(idx)
+        pai.qtdRegistros -= 1
+        self._tocar(pai, filho)
+        self._descartar(irmao)
+        if filho.folha:
+            filho.proxima = irmao.proxima
+            if irmao.proxima is not None:
+                self._tocar(irmao.proxima)
+                irmao.proxima.anterior = filho
+        else:
+            filho.registros.append(separador)
+            filho.paginas.extend(irmao.paginas)
+        filho.registros.extend(irmao.registros)
+        filho.qtdRegistros = len(filho.registros)
+
+    def _recolher_raiz(self) -> None:
+        """
+        Remove a raiz que ficou sem chaves: a árvore fica vazia se ela era
+        folha, ou perde um nível se era interna.
+        """
+        if self.raiz is not None and self.raiz.qtdRegistros == 0:
+            antiga = self.raiz
+            self.raiz = None if antiga.folha else antiga.paginas[0]
+            self._descartar(antiga)
+            if self.raiz is not None:
+                self._tocar(self.raiz)
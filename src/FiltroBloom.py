@@ -0,0 +1,146 @@
+import math
+from typing import Any
+
+_MASCARA_64 = (1 << 64) - 1
+
+
+class FiltroBloom:
+    def __init__(self, capacidade: int = 1024, taxa_erro: float = 0.01):
+        """
+        Filtro de Bloom que responde, sem descer pela árvore, se uma chave
+        certamente não está nela. Ligado ao passá-lo em
+        ArvoreB(..., filtro=...), que o mantém a cada inserção.
+
+        Um filtro de Bloom não remove chaves: as removidas continuam
+        marcadas e só aumentam os falsos positivos, sem nunca gerar falsos
+        negativos. Quando as chaves adicionadas passam da capacidade, o
+        filtro fica saturado e a árvore o reconstrói a partir das chaves
+        atuais (ver ArvoreB.reconstruir_filtro()).
+
+        Args:
+            capacidade (int): Chaves previstas; define o tamanho do vetor.
+            taxa_erro (float): Taxa de falsos positivos desejada na capacidade.
+
+        Raises:
+            ValueError: Se a capacidade não for positiva ou a taxa não
+                estiver entre 0 e 1.
+
+        Attributes:
+            capacidade (int): Chaves previstas.
+            taxa_erro (float): Taxa de falsos positivos desejada.
+            bits (int): Tamanho do vetor de bits.
+            funcoes (int): Quantidade de posições marcadas por chave.
+            adicionadas (int): Chaves adicionadas desde a última limpeza.
+            removidas (int): Remoções registradas desde a última limpeza.
+            negativas (int): Consultas descartadas pelo filtro.
+            falsos_positivos (int): Consultas aprovadas pelo filtro, mas
+                ausentes da árvore.
+        """
+        if capacidade < 1:
+            raise ValueError("A capacidade do filtro deve ser um inteiro positivo")
+        if not 0 < taxa_erro < 1:
+            raise ValueError("A taxa de erro deve estar entre 0 e 1")
+        self.taxa_erro: float = taxa_erro
+        self.limpar(capacidade)
+
+    def limpar(self, capacidade: int) -> None:
+        """
+        Esvazia o filtro e o redimensiona para uma nova capacidade.
+
+        Args:
+            capacidade (int): Chaves previstas.
+        """
+        self.capacidade: int = max(1, capacidade)
+        self.bits: int = max(8, math.ceil(-self.capacidade * math.log(self.taxa_erro)
+                                          / math.log(2) ** 2))
+        self.funcoes: int = max(1, round(self.bits / self.capacidade * math.log(2)))
+        self._vetor = bytearray((self.bits + 7) // 8)
+        self.adicionadas: int = 0
+        self.removidas: int = 0
+        self.negativas: int = 0
+        self.falsos_positivos: int = 0
+
+    def _posicoes(self, chave: Any) -> range:
+        """
+        Calcula as posições da chave por hash duplo: h1 + i·h2, i < funcoes.
+
+        Args:
+            chave (Any): Chave hashable.
+
+        Returns:
+            range: Posições (antes do módulo) da progressão aritmética.
+        """
+        x = hash(chave) & _MASCARA_64
+        h1 = (x * 0x9E3779B97F4A7C15) & _MASCARA_64
+        h2 = (((x ^ (x >> 31)) * 0xBF58476D1CE4E5B9) & _MASCARA_64) | 1
+        return range(h1, h1 + self.funcoes * h2, h2)
+
+    def adicionar(self, chave: Any) -> None:
+        """
+        Marca as posições da chave.
+
+        Args:
+            chave (Any): Chave inserida na árvore.
+        """
+        vetor, bits = self._vetor, self.bits
+        for h in self._posicoes(chave):
+            p = h % bits
+            vetor[p >> 3] |= 1 << (p & 7)
+        self.adicionadas += 1
+
+    def __contains__(self, chave: Any) -> bool:
+        """
+        Indica se a chave pode estar na árvore. False é definitivo.
+
+        Args:
+            chave (Any): Chave consultada.
+
+        Returns:
+            bool: False se a chave certamente não foi adicionada.
+        """
+        vetor, bits = self._vetor, self.bits
+        for h in self._posicoes(chave):
+            p = h % bits
+            if not vetor[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+    def registrar_remocao(self, quantidade: int = 1) -> None:
+        """
+        Contabiliza chaves removidas da árvore, que continuam marcadas.
+
+        Args:
+            quantidade (int): Chaves removidas.
+        """
+        self.removidas += quantidade
+
+    def saturado(self) -> bool:
+        """
+        Indica se as chaves adicionadas (inclusive as já removidas da
+        árvore) passaram da capacidade, o que eleva a taxa de falsos
+        positivos acima da desejada.
+
+        Returns:
+            bool: True se o filtro deve ser reconstruído.
+        """
+        return self.adicionadas > self.capacidade
+
+    def taxa_estimada(self) -> float:
+        """
+        Taxa de falsos positivos esperada para as chaves adicionadas:
+        (1 - e^(-k·n/m))^k.
+
+        Returns:
+            float: Probabilidade de uma chave ausente passar pelo filtro.
+        """
+        return (1 - math.exp(-self.funcoes * self.adicionadas / self.bits)) ** self.funcoes
+
+    def taxa_observada(self) -> float:
+        """
+        Fração das consultas a chaves ausentes que passaram pelo filtro.
+
+        Returns:
+            float: Taxa medida, ou 0.0 se nenhuma chave ausente foi consultada.
+        """
+        ausentes = self.negativas + self.falsos_positivos
+        return self.falsos_positivos / ausentes if ausentes else 0.0
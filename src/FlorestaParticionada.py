@@ -0,0 +1,498 @@
+import multiprocessing
+import os
+import pickle
+from bisect import bisect_right
+from itertools import islice, takewhile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .ArvoreB import ArvoreB
+from .ModoContratos import VARIAVEL_NIVEL, DESLIGADO
+
+TAMANHO_BLOCO_PADRAO = 1024
+
+
+def _extrair(arvore: ArvoreB, faixa: Tuple[Any, Any]) -> List[Any]:
+    inicio, fim = faixa
+    chaves = list(takewhile(lambda chave: fim is None or chave < fim,
+                            arvore.intervalo(inicio, None)))
+    arvore.remover_lote(chaves)
+    return chaves
+
+
+def _bloco(arvore: ArvoreB, pedido: Tuple[Any, Any, Any, int]) -> List[Any]:
+    inicio, fim, ultima, limite = pedido
+    chaves = arvore.intervalo(inicio, fim)
+    if ultima is not None:
+        chaves = (chave for chave in chaves if chave != ultima)
+    return list(islice(chaves, limite))
+
+
+def _inserir(arvore: ArvoreB, chave: Any) -> None:
+    """
+    Insere uma chave, recusando duplicatas mesmo quando os contratos do
+    processo, que fariam essa verificação, estão desligados.
+    """
+    if not arvore.contratos.local() and arvore.buscar(chave) is not None:
+        raise ValueError("Chave já existe na árvore; duplicatas não são permitidas")
+    arvore.inserir(chave)
+
+
+def _remover(arvore: ArvoreB, chave: Any) -> None:
+    """
+    Remove uma chave, recusando chaves ausentes mesmo quando os contratos
+    do processo, que fariam essa verificação, estão desligados.
+    """
+    if not arvore.contratos.local() and arvore.buscar(chave) is None:
+        raise ValueError("Chave não existe na árvore")
+    arvore.remover(chave)
+
+
+def _selecionar(arvore: ArvoreB, posicao: int) -> Any:
+    try:
+        return arvore.selecionar(posicao)
+    except ValueError:
+        return next(islice(arvore, posicao, None))
+
+
+_OPERACOES: Dict[str, Callable[[ArvoreB, Any], Any]] = {
+    "buscar": lambda arvore, chaves: [arvore.buscar(chave) for chave in chaves],
+    "inserir": _inserir,
+    "remover": _remover,
+    "inserir_lote": ArvoreB.inserir_lote,
+    "remover_lote": ArvoreB.remover_lote,
+    "intervalo": _bloco,
+    "extrair": _extrair,
+    "quantidade": lambda arvore, _: len(arvore),
+    "selecionar": _selecionar,
+}
+
+
+def _transportavel(erro: Exception) -> Exception:
+    """
+    Retorna a exceção, se puder ser enviada a outro processo, ou um
+    RuntimeError com a sua descrição.
+    """
+    try:
+        pickle.dumps(erro)
+        return erro
+    except Exception:
+        return RuntimeError(f"{type(erro).__name__}: {erro}")
+
+
+def _trabalhador(conexao, m: int, opcoes: Dict[str, Any]) -> None:
+    """
+    Laço de um processo da floresta: mantém uma ArvoreB e executa, em ordem,
+    cada lista de comandos recebida, respondendo com uma lista de pares
+    (sucesso, valor ou exceção).
+    """
+    arvore = ArvoreB(m, **opcoes)
+    while True:
+        comandos = conexao.recv()
+        if comandos is None:
+            break
+        respostas = []
+        for operacao, argumento in comandos:
+            try:
+                respostas.append((True, _OPERACOES[operacao](arvore, argumento)))
+            except Exception as erro:
+                respostas.append((False, _transportavel(erro)))
+        conexao.send(respostas)
+    conexao.close()
+
+
+class FlorestaParticionada:
+    def __init__(self, m: int, limites: Sequence[Any],
+                 tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                 contexto: Optional[str] = None, **opcoes: Any):
+        """
+        Conjunto de Árvores B particionado por faixas de chaves, cada uma em
+        um processo próprio, para usar mais de um núcleo.
+
+        Com limites [l0, l1, ..., lk-1], a partição 0 guarda as chaves
+        menores que l0, a partição i guarda [li-1, li) e a última guarda as
+        chaves a partir de lk-1. Cada processo recebe listas de comandos por
+        um Pipe e responde a todas de uma vez; as operações em lote agrupam
+        as chaves por partição e enviam um único pedido a cada uma antes de
+        esperar qualquer resposta, de modo que as partições trabalham em
+        paralelo e o custo de ida e volta é diluído no lote. Por percorrerem
+        cada partição inteira, os contratos ficam desligados por padrão.
+
+        Args:
+            m (int): Grau mínimo das árvores.
+            limites (Sequence[Any]): Chaves que separam as partições, em ordem
+                estritamente crescente; len(limites) + 1 processos são criados.
+            tamanho_bloco (int): Chaves trazidas por pedido em intervalo().
+            contexto (Optional[str]): Método de início do multiprocessing
+                ("fork", "spawn", "forkserver"); None usa o padrão da plataforma.
+            **opcoes (Any): Demais argumentos do construtor de cada ArvoreB.
+
+        Raises:
+            ValueError: Se os limites não forem estritamente crescentes ou o
+                tamanho do bloco não for positivo.
+        """
+        limites = list(limites)
+        if any(a >= b for a, b in zip(limites, limites[1:])):
+            raise ValueError("Os limites devem estar em ordem estritamente crescente")
+        if tamanho_bloco < 1:
+            raise ValueError("O tamanho do bloco deve ser um inteiro positivo")
+        opcoes.setdefault("contratos", os.environ.get(VARIAVEL_NIVEL, DESLIGADO))
+        self.m: int = m
+        self.limites: List[Any] = limites
+        self.tamanho_bloco: int = tamanho_bloco
+        ctx = multiprocessing.get_context(contexto)
+        self._conexoes = []
+        self._processos = []
+        for _ in range(len(limites) + 1):
+            local, remota = ctx.Pipe()
+            processo = ctx.Process(target=_trabalhador, args=(remota, m, opcoes), daemon=True)
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+
+    def __enter__(self) -> "FlorestaParticionada":
+        return self
+
+    def __exit__(self, *excecao: Any) -> None:
+        self.fechar()
+
+    @property
+    def particoes(self) -> int:
+        """
+        Quantidade de partições (e de processos).
+
+        Returns:
+            int: len(limites) + 1.
+        """
+        return len(self._conexoes)
+
+    def particao(self, chave: Any) -> int:
+        """
+        Indica a partição responsável por uma chave.
+
+        Args:
+            chave (Any): Chave qualquer.
+
+        Returns:
+            int: Índice da partição.
+        """
+        return bisect_right(self.limites, chave)
+
+    def _executar(self, pedidos: Dict[int, List[Tuple[str, Any]]]) -> Dict[int, List[Any]]:
+        """
+        Envia uma lista de comandos a cada partição indicada e só então
+        recolhe as respostas, para que as partições trabalhem em paralelo.
+
+        Args:
+            pedidos (Dict[int, List[Tuple[str, Any]]]): Comandos por partição.
+
+        Returns:
+            Dict[int, List[Any]]: Resultados por partição, na ordem dos comandos.
+
+        Raises:
+            Exception: A primeira exceção levantada por um comando, depois
+                de recebidas todas as respostas.
+        """
+        for indice, comandos in pedidos.items():
+            self._conexoes[indice].send(comandos)
+        resultados: Dict[int, List[Any]] = {}
+        erro = None
+        for indice in pedidos:
+            valores = []
+            for sucesso, valor in self._conexoes[indice].recv():
+                if not sucesso and erro is None:
+                    erro = valor
+                valores.append(valor)
+            resultados[indice] = valores
+        if erro is not None:
+            raise erro
+        return resultados
+
+    def _comando(self, indice: int, operacao: str, argumento: Any) -> Any:
+        return self._executar({indice: [(operacao, argumento)]})[indice][0]
+
+    def _agrupar(self, chaves: Iterable[Any]) -> Dict[int, List[Any]]:
+        grupos: Dict[int, List[Any]] = {}
+        for chave in chaves:
+            grupos.setdefault(self.particao(chave), []).append(chave)
+        return grupos
+
+    def buscar(self, chave: Any) -> Optional[Any]:
+        """
+        Busca uma chave na partição responsável por ela.
+
+        Args:
+            chave (Any): Valor a ser buscado.
+
+        Returns:
+            Optional[Any]: A chave se encontrada, ou None caso contrário.
+        """
+        return self._comando(self.particao(chave), "buscar", [chave])[0]
+
+    def inserir(self, chave: Any) -> None:
+        """
+        Insere uma chave na partição responsável por ela.
+
+        Args:
+            chave (Any): Valor a inserir (único).
+
+        Raises:
+            ValueError: Se a chave já existir e os contratos estiverem
+                desligados (com eles ligados, a violação é repassada).
+        """
+        self._comando(self.particao(chave), "inserir", chave)
+
+    def remover(self, chave: Any) -> None:
+        """
+        Remove uma chave da partição responsável por ela.
+
+        Args:
+            chave (Any): Valor a remover.
+
+        Raises:
+            ValueError: Se a chave não existir e os contratos estiverem
+                desligados (com eles ligados, a violação é repassada).
+        """
+        self._comando(self.particao(chave), "remover", chave)
+
+    def buscar_lote(self, chaves: Iterable[Any]) -> List[Optional[Any]]:
+        """
+        Busca várias chaves com um único pedido por partição.
+
+        Args:
+            chaves (Iterable[Any]): Chaves a buscar.
+
+        Returns:
+            List[Optional[Any]]: Resultado de cada busca, na ordem das chaves.
+        """
+        chaves = list(chaves)
+        grupos = self._agrupar(chaves)
+        resultados = self._executar({i: [("buscar", grupo)] for i, grupo in grupos.items()})
+        encontradas = {}
+        for indice, grupo in grupos.items():
+            encontradas.update(zip(grupo, resultados[indice][0]))
+        return [encontradas[chave] for chave in chaves]
+
+    def inserir_lote(self, chaves: Iterable[Any]) -> Dict[Any, bool]:
+        """
+        Insere várias chaves com um único pedido por partição.
+
+        Args:
+            chaves (Iterable[Any]): Chaves a inserir, em qualquer ordem.
+
+        Returns:
+            Dict[Any, bool]: Para cada chave, True se foi inserida ou False
+            se já existia.
+        """
+        return self._lote("inserir_lote", chaves)
+
+    def remover_lote(self, chaves: Iterable[Any]) -> Dict[Any, bool]:
+        """
+        Remove várias chaves com um único pedido por partição.
+
+        Args:
+            chaves (Iterable[Any]): Chaves a remover, em qualquer ordem.
+
+        Returns:
+            Dict[Any, bool]: Para cada chave, True se foi removida ou False
+            se não existia.
+        """
+        return self._lote("remover_lote", chaves)
+
+    def _lote(self, operacao: str, chaves: Iterable[Any]) -> Dict[Any, bool]:
+        grupos = self._agrupar(chaves)
+        resultados = self._executar({i: [(operacao, grupo)] for i, grupo in grupos.items()})
+        resultado: Dict[Any, bool] = {}
+        for valores in resultados.values():
+            resultado.update(valores[0])
+        return resultado
+
+    def intervalo(self, inicio: Optional[Any] = None,
+                  fim: Optional[Any] = None) -> Iterator[Any]:
+        """
+        Percorre em ordem crescente as chaves em [inicio, fim].
+
+        O primeiro bloco de cada partição envolvida é pedido a todas de uma
+        vez; os blocos seguintes são pedidos sob demanda, recomeçando após a
+        última chave entregue. Escritas entre blocos não causam repetições
+        nem saem de ordem.
+
+        Args:
+            inicio (Optional[Any]): Limite inferior inclusivo (None: sem limite).
+            fim (Optional[Any]): Limite superior inclusivo (None: sem limite).
+
+        Returns:
+            Iterator[Any]: Gerador das chaves no intervalo.
+        """
+        primeira = 0 if inicio is None else self.particao(inicio)
+        ultima_particao = len(self.limites) if fim is None else self.particao(fim)
+        envolvidas = range(primeira, ultima_particao + 1)
+        pedido = (inicio, fim, None, self.tamanho_bloco)
+        blocos = self._executar({i: [("intervalo", pedido)] for i in envolvidas})
+        for indice in envolvidas:
+            bloco = blocos[indice][0]
+            while True:
+                yield from bloco
+                if len(bloco) < self.tamanho_bloco:
+                    break
+                pedido = (bloco[-1], fim, bloco[-1], self.tamanho_bloco)
+                bloco = self._comando(indice, "intervalo", pedido)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.intervalo()
+
+    def __len__(self) -> int:
+        return sum(self.quantidades())
+
+    def quantidades(self) -> List[int]:
+        """
+        Conta as chaves de cada partição, em paralelo.
+
+        Returns:
+            List[int]: Quantidade de chaves por partição.
+        """
+        resultados = self._executar({i: [("quantidade", None)] for i in range(self.particoes)})
+        return [resultados[i][0] for i in range(self.particoes)]
+
+    def mover_limite(self, indice: int, novo: Any) -> int:
+        """
+        Desloca o limite entre as partições indice e indice + 1, movendo as
+        chaves da faixa entre o limite antigo e o novo de uma para a outra.
+        As chaves saem da origem com remover_lote() e entram no destino com
+        inserir_lote().
+
+        Args:
+            indice (int): Índice do limite em self.limites.
+            novo (Any): Novo limite, estritamente entre os limites vizinhos.
+
+        Returns:
+            int: Quantidade de chaves movidas.
+
+        Raises:
+            ValueError: Se o novo limite não ficar entre os vizinhos.
+        """
+        limites = list(self.limites)
+        limites[indice] = novo
+        if any(a >= b for a, b in zip(limites, limites[1:])):
+            raise ValueError("O novo limite deve ficar entre os limites vizinhos")
+        return self._reparticionar(limites)
+
+    def rebalancear(self) -> int:
+        """
+        Redefine os limites para que as partições fiquem com quantidades de
+        chaves iguais (a menos de uma) e move as chaves necessárias.
+
+        Returns:
+            int: Quantidade de chaves movidas.
+        """
+        quantidades = self.quantidades()
+        total = sum(quantidades)
+        if total < self.particoes:
+            return 0
+        pedidos: Dict[int, List[Tuple[str, Any]]] = {}
+        acumulado, indice = 0, 0
+        for parte in range(1, self.particoes):
+            posicao = total * parte // self.particoes
+            while posicao >= acumulado + quantidades[indice]:
+                acumulado += quantidades[indice]
+                indice += 1
+            pedidos.setdefault(indice, []).append(("selecionar", posicao - acumulado))
+        resultados = self._executar(pedidos)
+        limites = [chave for indice in sorted(resultados) for chave in resultados[indice]]
+        return self._reparticionar(limites)
+
+    def _reparticionar(self, limites: List[Any]) -> int:
+        """
+        Aplica novos limites: cada partição extrai as faixas que deixou de
+        possuir e as envia, em um único lote, às novas donas. Os limites só
+        são trocados depois que todas as chaves chegaram ao destino. Se a
+        entrega falhar, as chaves entregues são retiradas dos destinos e
+        todas as extraídas voltam às partições de origem, de modo que a
+        floresta continua com as mesmas chaves, roteadas pelos limites
+        antigos.
+
+        Args:
+            limites (List[Any]): Novos limites, estritamente crescentes.
+
+        Returns:
+            int: Quantidade de chaves movidas.
+        """
+        antigos = self.limites
+        pedidos: Dict[int, List[Tuple[str, Any]]] = {}
+        destinos: Dict[int, List[int]] = {}
+        for origem in range(self.particoes):
+            inicio, fim = _faixa(antigos, origem)
+            for destino in range(self.particoes):
+                if destino == origem:
+                    continue
+                novo_inicio, novo_fim = _faixa(limites, destino)
+                corte_inicio = _maior(inicio, novo_inicio)
+                corte_fim = _menor(fim, novo_fim)
+                if corte_inicio is not None and corte_fim is not None and corte_inicio >= corte_fim:
+                    continue
+                pedidos.setdefault(origem, []).append(("extrair", (corte_inicio, corte_fim)))
+                destinos.setdefault(origem, []).append(destino)
+        extraidas = self._executar(pedidos)
+        chegadas: Dict[int, List[Any]] = {}
+        for origem, faixas in extraidas.items():
+            for destino, chaves in zip(destinos[origem], faixas):
+                chegadas.setdefault(destino, []).extend(chaves)
+        chegadas = {destino: chaves for destino, chaves in chegadas.items() if chaves}
+        try:
+            self._executar({i: [("inserir_lote", chaves)] for i, chaves in chegadas.items()})
+        except Exception:
+            desfazer: Dict[int, List[Tuple[str, Any]]] = {}
+            for destino, chaves in chegadas.items():
+                desfazer.setdefault(destino, []).append(("remover_lote", chaves))
+            for origem, faixas in extraidas.items():
+                chaves = [chave for faixa in faixas for chave in faixa]
+                if chaves:
+                    desfazer.setdefault(origem, []).append(("inserir_lote", chaves))
+            self._executar(desfazer)
+            raise
+        self.limites = limites
+        return sum(len(chaves) for chaves in chegadas.values())
+
+    def fechar(self) -> None:
+        """
+        Encerra os processos das partições; as chaves são descartadas.
+        """
+        for conexao in self._conexoes:
+            conexao.send(None)
+            conexao.close()
+        for processo in self._processos:
+            processo.join()
+        self._conexoes = []
+        self._processos = []
+
+
+def _faixa(limites: List[Any], indice: int) -> Tuple[Any, Any]:
+    """
+    Faixa [inicio, fim) da partição indice sob os limites dados; None
+    significa sem limite.
+    """
+    inicio = limites[indice - 1] if indice > 0 else None
+    fim = limites[indice] if indice < len(limites) else None
+    return inicio, fim
+
+
+def _maior(a: Any, b: Any) -> Any:
+    """
+    Maior de dois limites inferiores, em que None significa sem limite.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+
+def _menor(a: Any, b: Any) -> Any:
+    """
+    Menor de dois limites superiores, em que None significa sem limite.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
@@ -0,0 +1,81 @@
+import pickle
+import struct
+from array import array
+from typing import Any, List, Sequence, Tuple
+
+ASSINATURA_IMAGEM = b"ARVOREBI"
+CABECALHO_IMAGEM = struct.Struct("<8sIBxxxqq")
+CHAVES_INT64 = 0
+CHAVES_PICKLE = 1
+
+
+def gravar_imagem(caminho: str, t: int, folhas: bytes, quantidades: array,
+                  chaves: List[Any]) -> None:
+    """
+    Grava a imagem binária das páginas de uma árvore, em ordem de nível.
+
+    O arquivo tem um cabeçalho (assinatura, grau, formato das chaves,
+    quantidade de páginas e de chaves) seguido de três blocos contíguos: a
+    quantidade de chaves de cada página (uint32), o indicador de folha de
+    cada página (um byte) e todas as chaves concatenadas. Chaves que cabem
+    em int64 são gravadas como um único buffer array('q'); as demais são
+    serializadas com pickle.
+
+    Args:
+        caminho (str): Arquivo de destino.
+        t (int): Grau mínimo da árvore.
+        folhas (bytes): 1 para folha e 0 para página interna, por página.
+        quantidades (array): array('I') com a quantidade de chaves por página.
+        chaves (List[Any]): Chaves de todas as páginas, na mesma ordem.
+    """
+    try:
+        bloco = array("q", chaves).tobytes()
+        formato = CHAVES_INT64
+    except (TypeError, OverflowError):
+        bloco = pickle.dumps(chaves, protocol=pickle.HIGHEST_PROTOCOL)
+        formato = CHAVES_PICKLE
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(CABECALHO_IMAGEM.pack(ASSINATURA_IMAGEM, t, formato,
+                                            len(folhas), len(chaves)))
+        arquivo.write(quantidades.tobytes())
+        arquivo.write(folhas)
+        arquivo.write(bloco)
+
+
+def ler_imagem(caminho: str) -> Tuple[int, bytes, array, Sequence[Any]]:
+    """
+    Lê uma imagem gravada por gravar_imagem(). Imagens com chaves em
+    pickle só devem ser lidas de fontes confiáveis.
+
+    Args:
+        caminho (str): Arquivo de origem.
+
+    Returns:
+        Tuple[int, bytes, array, Sequence[Any]]: Grau mínimo, indicadores de
+        folha, quantidades de chaves por página e chaves (array('q') para
+        chaves inteiras, lista caso contrário).
+
+    Raises:
+        ValueError: Se o arquivo não for uma imagem válida.
+    """
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+    if len(dados) < CABECALHO_IMAGEM.size:
+        raise ValueError(f"{caminho} não é uma imagem da Árvore B")
+    assinatura, t, formato, n_paginas, n_chaves = CABECALHO_IMAGEM.unpack_from(dados, 0)
+    if assinatura != ASSINATURA_IMAGEM or formato not in (CHAVES_INT64, CHAVES_PICKLE):
+        raise ValueError(f"{caminho} não é uma imagem da Árvore B")
+    posicao = CABECALHO_IMAGEM.size
+    quantidades = array("I")
+    fim = posicao + n_paginas * quantidades.itemsize
+    quantidades.frombytes(dados[posicao:fim])
+    folhas = dados[fim:fim + n_paginas]
+    posicao = fim + n_paginas
+    if formato == CHAVES_INT64:
+        chaves: Sequence[Any] = array("q")
+        chaves.frombytes(dados[posicao:posicao + 8 * n_chaves])
+    else:
+        chaves = pickle.loads(dados[posicao:])
+    if len(quantidades) != n_paginas or len(folhas) != n_paginas or len(chaves) != n_chaves:
+        raise ValueError(f"Imagem truncada: {caminho}")
+    return t, folhas, quantidades, chaves
@@ -0,0 +1,103 @@
+import threading
+from typing import Callable, Dict, List
+
+EVENTOS = (
+    "buscas",
+    "paginas_visitadas",
+    "comparacoes",
+    "divisoes",
+    "fusoes",
+    "emprestimos_anterior",
+    "emprestimos_posterior",
+    "redistribuicoes",
+    "divisoes_raiz",
+    "recolhimentos_raiz",
+)
+
+
+class Instrumentacao:
+    def __init__(self):
+        """
+        Contadores de eventos estruturais de uma ArvoreB, ligados ao passá-la
+        em ArvoreB(..., instrumentacao=...). Sem ela, a árvore apenas testa
+        um atributo nulo nos pontos de contagem e a busca segue pelo caminho
+        sem contagem.
+
+        Eventos contados:
+          - buscas, paginas_visitadas e comparacoes: por chamada de buscar();
+            as comparações de cada página são o limite da busca binária,
+            ceil(log2(n + 1)), mais o teste de igualdade;
+          - divisoes: páginas criadas por divisão (inclusive em lote);
+          - fusoes, emprestimos_anterior, emprestimos_posterior e
+            redistribuicoes;
+          - divisoes_raiz e recolhimentos_raiz: variações da altura.
+
+        Attributes:
+            contadores (Dict[str, int]): Valor atual de cada evento.
+        """
+        self.contadores: Dict[str, int] = dict.fromkeys(EVENTOS, 0)
+        self._ganchos: List[Callable[[str, int], None]] = []
+        self._trava = threading.Lock()
+
+    def registrar(self, evento: str, quantidade: int = 1) -> None:
+        """
+        Soma ocorrências a um evento e avisa os ganchos.
+
+        Args:
+            evento (str): Um dos EVENTOS.
+            quantidade (int): Ocorrências a somar.
+        """
+        with self._trava:
+            self.contadores[evento] += quantidade
+        for gancho in self._ganchos:
+            gancho(evento, quantidade)
+
+    def adicionar_gancho(self, gancho: Callable[[str, int], None]) -> None:
+        """
+        Passa a chamar gancho(evento, quantidade) a cada registro, por
+        exemplo para repassar os eventos a um sistema de métricas.
+
+        Args:
+            gancho (Callable[[str, int], None]): Função chamada na thread que
+                executou a operação da árvore.
+        """
+        self._ganchos.append(gancho)
+
+    def remover_gancho(self, gancho: Callable[[str, int], None]) -> None:
+        """
+        Deixa de chamar um gancho adicionado com adicionar_gancho().
+
+        Args:
+            gancho (Callable[[str, int], None]): Gancho a remover.
+
+        Raises:
+            ValueError: Se o gancho não tiver sido adicionado.
+        """
+        self._ganchos.remove(gancho)
+
+    def instantaneo(self) -> Dict[str, int]:
+        """
+        Retorna uma cópia dos contadores, para exportação periódica.
+
+        Returns:
+            Dict[str, int]: Valor de cada evento.
+        """
+        with self._trava:
+            return dict(self.contadores)
+
+    def paginas_por_busca(self) -> float:
+        """
+        Média de páginas visitadas por busca, próxima da altura da árvore.
+
+        Returns:
+            float: Média, ou 0.0 se nenhuma busca foi feita.
+        """
+        buscas = self.contadores["buscas"]
+        return self.contadores["paginas_visitadas"] / buscas if buscas else 0.0
+
+    def zerar(self) -> None:
+        """
+        Zera todos os contadores.
+        """
+        with self._trava:
+            self.contadores = dict.fromkeys(EVENTOS, 0)
@@ -0,0 +1,85 @@
+import os
+from typing import Optional
+
+COMPLETO = "completo"
+AMOSTRADO = "amostrado"
+DESLIGADO = "desligado"
+INCREMENTAL = "incremental"
+
+NIVEIS = (COMPLETO, AMOSTRADO, DESLIGADO, INCREMENTAL)
+
+VARIAVEL_NIVEL = "ARVOREB_CONTRATOS"
+VARIAVEL_AMOSTRAGEM = "ARVOREB_AMOSTRAGEM"
+AMOSTRAGEM_PADRAO = 100
+
+
+class ModoContratos:
+    def __init__(self, nivel: Optional[str] = None, amostragem: Optional[int] = None):
+        """
+        Define com que intensidade os contratos da árvore são verificados.
+
+        Args:
+            nivel (Optional[str]): "completo", "amostrado", "desligado" ou
+                "incremental". Quando omitido, é lido de ARVOREB_CONTRATOS
+                (padrão: "completo").
+            amostragem (Optional[int]): No modo amostrado, verifica os contratos
+                a cada N operações. Quando omitido, é lido de ARVOREB_AMOSTRAGEM.
+
+        Raises:
+            ValueError: Se o nível for desconhecido ou a amostragem não for positiva.
+        """
+        if nivel is None:
+            nivel = os.environ.get(VARIAVEL_NIVEL, COMPLETO)
+        if amostragem is None:
+            amostragem = int(os.environ.get(VARIAVEL_AMOSTRAGEM, AMOSTRAGEM_PADRAO))
+        if nivel not in NIVEIS:
+            raise ValueError(f"Nível de contratos desconhecido: {nivel!r}")
+        if amostragem < 1:
+            raise ValueError("A amostragem deve ser um inteiro positivo")
+        self.nivel: str = nivel
+        self.amostragem: int = amostragem
+        self.operacoes: int = 0
+
+    @property
+    def incremental(self) -> bool:
+        """
+        Indica se apenas as páginas tocadas por cada operação são verificadas.
+
+        Returns:
+            bool: True no modo incremental.
+        """
+        return self.nivel == INCREMENTAL
+
+    def registrar_operacao(self) -> None:
+        """
+        Contabiliza uma operação pública da árvore.
+        """
+        self.operacoes += 1
+
+    def ativo(self) -> bool:
+        """
+        Indica se os contratos devem ser avaliados neste momento.
+
+        No modo amostrado, o estado deixado pela N-ésima operação é verificado
+        pelas pós-condições dela e pelas pré-condições da operação seguinte.
+
+        Returns:
+            bool: True se os contratos devem ser verificados.
+        """
+        if self.nivel == COMPLETO:
+            return True
+        if self.nivel in (DESLIGADO, INCREMENTAL):
+            return False
+        return self.operacoes % self.amostragem == 0
+
+    def local(self) -> bool:
+        """
+        Indica se os contratos de custo O(log n) devem ser avaliados.
+
+        Pré-condições e a variação de altura continuam valendo no modo
+        incremental, que dispensa apenas os percursos pela árvore inteira.
+
+        Returns:
+            bool: True se as verificações locais devem ser feitas.
+        """
+        return self.nivel == INCREMENTAL or self.ativo()
@@ -5,3 +5,6 @@ class Pagina:
         self.registros = []
         self.paginas = [None] * (2 * t)
         self.qtdRegistros = 0
+        self.tamanho = 0
+        self.versao = 0
+        self.trava = None
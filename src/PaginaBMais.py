@@ -0,0 +1,45 @@
+from typing import Dict
+
+from .Pagina import Pagina
+from .PaginaCompacta import PaginaCompacta, PaginaCompactaInt
+
+
+class FolhaEncadeada:
+    """
+    Acrescenta a uma representação de página os ponteiros para a folha
+    anterior e a próxima, usados apenas pelas folhas da Árvore B+.
+    """
+    __slots__ = ()
+
+    def __init__(self, t: int, folha: bool = True):
+        super().__init__(t, folha)
+        self.anterior = None
+        self.proxima = None
+
+
+class PaginaBMais(FolhaEncadeada, Pagina):
+    """
+    Folha da Árvore B+ na representação Pagina.
+    """
+    __slots__ = ("anterior", "proxima")
+
+
+class PaginaCompactaBMais(FolhaEncadeada, PaginaCompacta):
+    """
+    Folha da Árvore B+ na representação PaginaCompacta.
+    """
+    __slots__ = ("anterior", "proxima")
+
+
+class PaginaCompactaIntBMais(FolhaEncadeada, PaginaCompactaInt):
+    """
+    Folha da Árvore B+ na representação PaginaCompactaInt.
+    """
+    __slots__ = ("anterior", "proxima")
+
+
+FOLHAS_ENCADEADAS: Dict[type, type] = {
+    Pagina: PaginaBMais,
+    PaginaCompacta: PaginaCompactaBMais,
+    PaginaCompactaInt: PaginaCompactaIntBMais,
+}
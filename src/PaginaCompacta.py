@@ -0,0 +1,35 @@
+from array import array
+
+
+class PaginaCompacta:
+    """
+    Página sem __dict__: folhas não alocam vetor de filhos e as internas
+    guardam apenas os filhos existentes.
+    """
+    __slots__ = ("folha", "registros", "paginas", "qtdRegistros", "tamanho", "versao",
+                 "trava")
+
+    def __init__(self, t: int, folha: bool = False):
+        self.folha = folha
+        self.registros = self._novos_registros()
+        self.paginas = None if folha else []
+        self.qtdRegistros = 0
+        self.tamanho = 0
+        self.versao = 0
+        self.trava = None
+
+    @staticmethod
+    def _novos_registros():
+        return []
+
+
+class PaginaCompactaInt(PaginaCompacta):
+    """
+    Página compacta cujas chaves inteiras ficam em um buffer array('q')
+    de 8 bytes por chave. Aceita apenas inteiros de 64 bits com sinal.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def _novos_registros():
+        return array('q')
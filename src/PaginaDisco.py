@@ -0,0 +1,436 @@
+import struct
+import threading
+import weakref
+from typing import List, Optional
+from .ArquivoPaginas import ArquivoPaginas, SEM_PAGINA
+from .PoolBuffers import PoolBuffers
+from .RegistroEscrita import RegistroEscrita
+
+ENTRADA = struct.Struct("<qqqII")
+IDENTIFICADOR = struct.Struct("<q")
+LIVRE = struct.Struct("<qq")
+LIMITE_REGISTRO_PADRAO = 64 * 1024 * 1024
+
+
+class PaginaDisco:
+    """
+    Página guardada em um ArquivoPaginas e decodificada sob demanda.
+
+    Expõe os mesmos atributos de Pagina como propriedades: o primeiro acesso
+    em cada operação passa pelo pool de buffers, que lê o slot do arquivo se
+    a página não estiver em cache. Os filhos são referências ainda não
+    carregadas. Durante operações de escrita, acessar as chaves ou os filhos
+    marca a página como suja, pois a árvore os altera no próprio objeto.
+    """
+    __slots__ = ("id", "_gerenciador", "_carregada", "_suja", "_liberada",
+                 "_folha", "_registros", "_paginas", "_qtd", "_tamanho",
+                 "_epoca", "_referenciada", "_fixacoes", "_quadro", "__weakref__")
+
+    def __init__(self, gerenciador: "GerenciadorPaginas", pid: int):
+        self.id = pid
+        self._gerenciador = gerenciador
+        self._carregada = False
+        self._suja = False
+        self._liberada = False
+        self._folha = False
+        self._registros = None
+        self._paginas = None
+        self._qtd = 0
+        self._tamanho = 0
+        self._epoca = -1
+        self._referenciada = False
+        self._fixacoes = 0
+        self._quadro = None
+
+    def _preencher(self, folha: bool, registros: List[int],
+                   paginas: Optional[List["PaginaDisco"]], tamanho: int) -> None:
+        self._folha = folha
+        self._registros = registros
+        self._paginas = paginas
+        self._qtd = len(registros)
+        self._tamanho = tamanho
+        self._carregada = True
+
+    def _descarregar(self) -> None:
+        self._registros = None
+        self._paginas = None
+        self._carregada = False
+        self._suja = False
+        self._epoca = -1
+
+    def _alterar(self) -> None:
+        if self._epoca != self._gerenciador.epoca:
+            self._gerenciador.visitar(self)
+        self._suja = True
+
+    @property
+    def folha(self) -> bool:
+        if self._epoca != self._gerenciador.epoca:
+            self._gerenciador.visitar(self)
+        return self._folha
+
+    @folha.setter
+    def folha(self, valor: bool) -> None:
+        self._alterar()
+        self._folha = valor
+
+    @property
+    def qtdRegistros(self) -> int:
+        if self._epoca != self._gerenciador.epoca:
+            self._gerenciador.visitar(self)
+        return self._qtd
+
+    @qtdRegistros.setter
+    def qtdRegistros(self, valor: int) -> None:
+        self._alterar()
+        self._qtd = valor
+
+    @property
+    def tamanho(self) -> int:
+        if self._epoca != self._gerenciador.epoca:
+            self._gerenciador.visitar(self)
+        return self._tamanho
+
+    @tamanho.setter
+    def tamanho(self, valor: int) -> None:
+        self._alterar()
+        self._tamanho = valor
+
+    @property
+    def registros(self) -> List[int]:
+        if self._epoca != self._gerenciador.epoca:
+            self._gerenciador.visitar(self)
+        if self._gerenciador.escrita:
+            self._suja = True
+        return self._registros
+
+    @registros.setter
+    def registros(self, valor: List[int]) -> None:
+        self._alterar()
+        self._registros = valor
+
+    @property
+    def paginas(self) -> Optional[List["PaginaDisco"]]:
+        if self._epoca != self._gerenciador.epoca:
+            self._gerenciador.visitar(self)
+        if self._gerenciador.escrita:
+            self._suja = True
+        return self._paginas
+
+    @paginas.setter
+    def paginas(self, valor: Optional[List["PaginaDisco"]]) -> None:
+        self._alterar()
+        self._paginas = valor
+
+
+class GerenciadorPaginas:
+    def __init__(self, arquivo: ArquivoPaginas, capacidade_paginas: Optional[int] = None,
+                 capacidade_bytes: Optional[int] = None,
+                 registro: Optional[RegistroEscrita] = None,
+                 confirmacao_sincrona: bool = True):
+        """
+        Faz a ponte entre a árvore e o arquivo: cria, carrega, grava e
+        libera páginas, mantendo as decodificadas em um PoolBuffers.
+
+        Cada operação pública é uma época. A primeira visita a uma página
+        na época conta como acerto ou falta no pool; em operações de escrita
+        a página também fica fixada até o fim da operação, para que pai e
+        filhos manipulados por divisões e fusões não sejam despejados no
+        meio do caminho. Páginas sujas só são gravadas ao serem despejadas,
+        em gravar_sujas() ou ao fechar. As operações de várias threads são
+        serializadas pela árvore com `trava`.
+
+        Com um registro de escrita antecipada, cada operação de escrita
+        anexa ao registro as imagens das páginas que sujou, o novo cabeçalho
+        e os slots liberados; o cabeçalho do arquivo só é regravado nos
+        pontos de controle. Antes de gravar uma página no lugar, o registro
+        é sincronizado. Ao abrir, as entradas do registro são reaplicadas.
+        Com confirmação síncrona, concluir() não espera o fsync: deixa o LSN
+        da operação em `pendente`, para que a árvore o confirme depois de
+        soltar a trava, enquanto as operações seguintes já executam e entram
+        no mesmo commit em grupo.
+
+        Args:
+            arquivo (ArquivoPaginas): Arquivo de páginas aberto.
+            capacidade_paginas (Optional[int]): Capacidade do pool em páginas.
+            capacidade_bytes (Optional[int]): Capacidade do pool em bytes,
+                contando cada página pelo tamanho do seu slot.
+            registro (Optional[RegistroEscrita]): Registro de escrita antecipada.
+            confirmacao_sincrona (bool): Se True, cada operação só termina
+                após o fsync do registro (compartilhado em grupo); se False, o
+                fsync fica para o próximo despejo ou ponto de controle.
+
+        Attributes:
+            escrita (bool): Indica se a operação corrente altera a árvore.
+            epoca (int): Número da operação corrente.
+            leituras (int): Total de páginas lidas do arquivo.
+            gravacoes (int): Total de páginas gravadas no arquivo.
+            pool (PoolBuffers): Cache de páginas decodificadas.
+            recuperadas (int): Entradas do registro reaplicadas ao abrir.
+            limite_registro (int): Tamanho do registro, em bytes, a partir
+                do qual um ponto de controle é feito ao fim da operação.
+            trava (threading.Lock): Serializa as operações sobre as páginas.
+            pendente (int): LSN que a operação corrente deve ver confirmado
+                antes de retornar, ou 0.
+        """
+        self.arquivo: ArquivoPaginas = arquivo
+        self.escrita: bool = False
+        self.epoca: int = 0
+        self.leituras: int = 0
+        self.gravacoes: int = 0
+        self.pool: PoolBuffers = PoolBuffers(self._despejar, capacidade_paginas,
+                                             capacidade_bytes, arquivo.tamanho_slot)
+        self._referencias: "weakref.WeakValueDictionary[int, PaginaDisco]" = \
+            weakref.WeakValueDictionary()
+        self._fixadas: List[PaginaDisco] = []
+        self._liberadas: List[int] = []
+        self.registro: Optional[RegistroEscrita] = registro
+        self.confirmacao_sincrona: bool = confirmacao_sincrona
+        self.limite_registro: int = LIMITE_REGISTRO_PADRAO
+        self.recuperadas: int = 0
+        self.trava: threading.Lock = threading.Lock()
+        self.pendente: int = 0
+        if registro is not None:
+            self._refazer()
+
+    def _refazer(self) -> None:
+        """
+        Reaplica ao arquivo as entradas do registro e faz um ponto de controle.
+        """
+        arquivo = self.arquivo
+        for conteudo in self.registro.entradas():
+            raiz, total, livre, n_paginas, n_livres = ENTRADA.unpack_from(conteudo, 0)
+            posicao = ENTRADA.size
+            for _ in range(n_paginas):
+                pid, = IDENTIFICADOR.unpack_from(conteudo, posicao)
+                posicao += IDENTIFICADOR.size
+                arquivo.escrever_slot(pid, conteudo[posicao:posicao + arquivo.tamanho_slot])
+                posicao += arquivo.tamanho_slot
+            for _ in range(n_livres):
+                arquivo.gravar_livre(*LIVRE.unpack_from(conteudo, posicao))
+                posicao += LIVRE.size
+            arquivo.raiz, arquivo.total, arquivo.livre = raiz, total, livre
+            self.recuperadas += 1
+        if self.recuperadas:
+            arquivo.gravar_cabecalho()
+            arquivo.sincronizar()
+            self.registro.truncar()
+
+    def referencia(self, pid: int) -> PaginaDisco:
+        """
+        Retorna o único objeto que representa a página `pid`, criando-o
+        (sem carregar) se necessário.
+
+        Args:
+            pid (int): Identificador da página.
+
+        Returns:
+            PaginaDisco: Referência à página.
+        """
+        pagina = self._referencias.get(pid)
+        if pagina is None:
+            pagina = PaginaDisco(self, pid)
+            self._referencias[pid] = pagina
+        return pagina
+
+    def raiz(self) -> Optional[PaginaDisco]:
+        """
+        Retorna uma referência à raiz gravada no arquivo.
+
+        Returns:
+            Optional[PaginaDisco]: Raiz, ou None se a árvore estiver vazia.
+        """
+        if self.arquivo.raiz == SEM_PAGINA:
+            return None
+        return self.referencia(self.arquivo.raiz)
+
+    def nova_pagina(self, t: int, folha: bool) -> PaginaDisco:
+        """
+        Aloca um slot e cria uma página vazia já carregada (fábrica de páginas).
+
+        Args:
+            t (int): Grau mínimo (definido pelo arquivo).
+            folha (bool): Indica se a página é folha.
+
+        Returns:
+            PaginaDisco: Página nova, marcada como suja.
+        """
+        pagina = PaginaDisco(self, self.arquivo.alocar())
+        self._referencias[pagina.id] = pagina
+        pagina._preencher(folha, [], None if folha else [], 0)
+        pagina._suja = True
+        self.pool.admitir(pagina, falta=False)
+        self._marcar_visita(pagina)
+        return pagina
+
+    def visitar(self, pagina: PaginaDisco) -> None:
+        """
+        Primeiro acesso à página na operação corrente: consulta o pool e,
+        em caso de falta, decodifica a página a partir do arquivo.
+
+        Args:
+            pagina (PaginaDisco): Página acessada.
+        """
+        if pagina._carregada:
+            self.pool.acessar(pagina)
+        else:
+            folha, registros, filhos, tamanho = self.arquivo.ler(pagina.id)
+            paginas = None if folha else [self.referencia(pid) for pid in filhos]
+            pagina._preencher(folha, registros, paginas, tamanho)
+            self.leituras += 1
+            self.pool.admitir(pagina)
+        self._marcar_visita(pagina)
+
+    def _marcar_visita(self, pagina: PaginaDisco) -> None:
+        pagina._epoca = self.epoca
+        if self.escrita:
+            self.pool.fixar(pagina)
+            self._fixadas.append(pagina)
+
+    def _despejar(self, pagina: PaginaDisco) -> None:
+        if pagina._suja and not pagina._liberada:
+            self._gravar(pagina)
+        pagina._descarregar()
+
+    def liberar(self, pagina: PaginaDisco) -> None:
+        """
+        Devolve ao arquivo o slot de uma página removida da árvore.
+
+        Args:
+            pagina (PaginaDisco): Página descartada.
+        """
+        if not pagina._liberada:
+            pagina._liberada = True
+            self.pool.remover(pagina)
+            self.arquivo.liberar(pagina.id)
+            self._liberadas.append(pagina.id)
+
+    def iniciar_escrita(self) -> None:
+        """
+        Marca o início de uma operação que altera a árvore. Inicia uma nova
+        época para que toda página acessada a partir daqui seja fixada.
+        """
+        self.escrita = True
+        self.epoca += 1
+
+    def _imagem(self, pagina: PaginaDisco) -> bytes:
+        filhos = [] if pagina._folha else [f.id for f in pagina._paginas[: pagina._qtd + 1]]
+        return self.arquivo.codificar(pagina._folha, pagina._registros[: pagina._qtd],
+                                      filhos, pagina._tamanho)
+
+    def _gravar(self, pagina: PaginaDisco) -> None:
+        if self.registro is not None:
+            self.registro.confirmar_tudo()
+        self.arquivo.escrever_slot(pagina.id, self._imagem(pagina))
+        self.gravacoes += 1
+        pagina._suja = False
+
+    def _registrar(self, raiz_id: int) -> int:
+        """
+        Anexa ao registro as páginas sujas e os slots liberados pela operação.
+
+        Args:
+            raiz_id (int): Identificador da raiz ao fim da operação.
+
+        Returns:
+            int: LSN da entrada.
+        """
+        partes = []
+        n_paginas = 0
+        for pagina in self._fixadas:
+            if pagina._suja and not pagina._liberada:
+                partes.append(IDENTIFICADOR.pack(pagina.id))
+                partes.append(self._imagem(pagina))
+                n_paginas += 1
+        n_livres = 0
+        for pid in self._liberadas:
+            proximo = self.arquivo.livre_pendente(pid)
+            if proximo is not None:
+                partes.append(LIVRE.pack(pid, proximo))
+                n_livres += 1
+        cabecalho = ENTRADA.pack(raiz_id, self.arquivo.total, self.arquivo.livre,
+                                 n_paginas, n_livres)
+        return self.registro.anexar(cabecalho + b"".join(partes))
+
+    def gravar_sujas(self) -> None:
+        """
+        Grava no arquivo todas as páginas sujas presentes no pool.
+        """
+        for pagina in self.pool.paginas():
+            if pagina._suja and not pagina._liberada:
+                self._gravar(pagina)
+
+    def concluir(self, raiz: Optional[PaginaDisco]) -> None:
+        """
+        Encerra a operação: registra as alterações (havendo registro),
+        desafixa as páginas da operação, devolve o pool à capacidade e
+        atualiza a raiz no cabeçalho. Com confirmação síncrona, o LSN da
+        entrada fica em `pendente`, a ser confirmado fora da trava. Mesmo
+        que uma etapa falhe, as páginas são desafixadas e a operação é
+        encerrada, para que as seguintes não herdem o seu estado.
+
+        Args:
+            raiz (Optional[PaginaDisco]): Raiz atual da árvore.
+        """
+        raiz_id = SEM_PAGINA if raiz is None else raiz.id
+        try:
+            try:
+                if self.registro is not None and self.escrita:
+                    lsn = self._registrar(raiz_id)
+                    if self.confirmacao_sincrona:
+                        self.pendente = lsn
+            finally:
+                self._liberadas.clear()
+                for pagina in self._fixadas:
+                    self.pool.desafixar(pagina)
+                self._fixadas.clear()
+            self.pool.reduzir()
+            if self.registro is not None:
+                self.arquivo.raiz = raiz_id
+            elif self.escrita or raiz_id != self.arquivo.raiz:
+                self.arquivo.raiz = raiz_id
+                self.arquivo.gravar_cabecalho()
+        finally:
+            self.escrita = False
+            self.epoca += 1
+        if self.registro is not None and self.registro.tamanho > self.limite_registro:
+            self.ponto_controle()
+
+    def ponto_controle(self) -> None:
+        """
+        Grava no arquivo todas as páginas sujas, a lista de livres e o
+        cabeçalho, sincroniza e descarta o registro. Só pode ser chamado
+        entre operações.
+        """
+        self.gravar_sujas()
+        self.arquivo.gravar_livres()
+        self.arquivo.gravar_cabecalho()
+        self.arquivo.sincronizar()
+        if self.registro is not None:
+            self.registro.truncar()
+        self.pendente = 0
+
+    def sincronizar(self) -> None:
+        """
+        Pede a durabilidade de todas as operações já concluídas. Com
+        registro, marca a última entrada como pendente, para ser confirmada
+        fora da trava; sem ele, faz um ponto de controle.
+        """
+        if self.registro is None:
+            self.ponto_controle()
+        else:
+            self.pendente = max(self.pendente, self.registro.ultimo_lsn)
+
+    def fechar(self, raiz: Optional[PaginaDisco]) -> None:
+        """
+        Conclui a operação pendente, faz um ponto de controle e fecha os
+        arquivos.
+
+        Args:
+            raiz (Optional[PaginaDisco]): Raiz atual da árvore.
+        """
+        self.concluir(raiz)
+        self.ponto_controle()
+        self.arquivo.fechar()
+        if self.registro is not None:
+            self.registro.fechar()
@@ -0,0 +1,286 @@
+import json
+import math
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+PARTES = ("total", "algoritmo", "contratos")
+PERCENTIS = (50.0, 90.0, 99.0, 99.9, 99.99)
+
+
+class HistogramaLatencia:
+    def __init__(self, digitos_significativos: int = 2):
+        """
+        Histograma de latências em nanossegundos no estilo HDR: cada faixa
+        [2^k, 2^(k+1)) é dividida em subfaixas lineares, de modo que todo
+        valor registrado é representado com erro relativo menor que
+        10^-digitos_significativos, com memória proporcional apenas ao
+        número de faixas ocupadas.
+
+        Args:
+            digitos_significativos (int): Precisão, de 1 a 5 dígitos.
+
+        Attributes:
+            contagem (int): Valores registrados.
+            minimo (int): Menor valor registrado.
+            maximo (int): Maior valor registrado.
+            soma (int): Soma exata dos valores registrados.
+
+        Raises:
+            ValueError: Se a precisão estiver fora do intervalo.
+        """
+        if not 1 <= digitos_significativos <= 5:
+            raise ValueError("A precisão deve ter de 1 a 5 dígitos significativos")
+        self.digitos_significativos: int = digitos_significativos
+        self._bits_subfaixa: int = math.ceil(math.log2(2 * 10 ** digitos_significativos))
+        self._meia_subfaixa: int = 1 << (self._bits_subfaixa - 1)
+        self._contagens: Dict[int, int] = {}
+        self.contagem: int = 0
+        self.minimo: int = 0
+        self.maximo: int = 0
+        self.soma: int = 0
+
+    def _indice(self, valor: int) -> int:
+        faixa = max(0, valor.bit_length() - self._bits_subfaixa)
+        return faixa * self._meia_subfaixa + (valor >> faixa)
+
+    def _limites(self, indice: int) -> Tuple[int, int]:
+        """
+        Retorna o menor e o maior valor representados por uma subfaixa.
+        """
+        faixa = max(0, indice // self._meia_subfaixa - 1)
+        inferior = (indice - faixa * self._meia_subfaixa) << faixa
+        return inferior, inferior + (1 << faixa) - 1
+
+    def registrar(self, valor: int, vezes: int = 1) -> None:
+        """
+        Registra uma latência.
+
+        Args:
+            valor (int): Latência em nanossegundos (valores negativos contam como 0).
+            vezes (int): Quantidade de ocorrências do valor.
+        """
+        valor = max(0, int(valor))
+        indice = self._indice(valor)
+        self._contagens[indice] = self._contagens.get(indice, 0) + vezes
+        if self.contagem == 0 or valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+        self.contagem += vezes
+        self.soma += valor * vezes
+
+    def combinar(self, outro: "HistogramaLatencia") -> None:
+        """
+        Soma ao histograma os valores de outro com a mesma precisão.
+
+        Args:
+            outro (HistogramaLatencia): Histograma a incorporar.
+
+        Raises:
+            ValueError: Se as precisões forem diferentes.
+        """
+        if outro.digitos_significativos != self.digitos_significativos:
+            raise ValueError("Só é possível combinar histogramas de mesma precisão")
+        if outro.contagem == 0:
+            return
+        for indice, vezes in outro._contagens.items():
+            self._contagens[indice] = self._contagens.get(indice, 0) + vezes
+        self.minimo = outro.minimo if self.contagem == 0 else min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self.contagem += outro.contagem
+        self.soma += outro.soma
+
+    def media(self) -> float:
+        """
+        Returns:
+            float: Média exata, em nanossegundos (0.0 se vazio).
+        """
+        return self.soma / self.contagem if self.contagem else 0.0
+
+    def percentil(self, percentual: float) -> int:
+        """
+        Retorna o valor abaixo do qual está a fração pedida dos registros,
+        arredondado para o maior valor equivalente da subfaixa.
+
+        Args:
+            percentual (float): Percentil, de 0 a 100.
+
+        Returns:
+            int: Latência em nanossegundos (0 se vazio).
+        """
+        if self.contagem == 0:
+            return 0
+        alvo = max(1, math.ceil(round(percentual * self.contagem / 100, 6)))
+        acumulado = 0
+        for indice in sorted(self._contagens):
+            acumulado += self._contagens[indice]
+            if acumulado >= alvo:
+                return min(self._limites(indice)[1], self.maximo)
+        return self.maximo
+
+    def distribuicao(self) -> List[Tuple[int, int]]:
+        """
+        Retorna os pares (menor valor da subfaixa, contagem) ocupados, em
+        ordem crescente; registrá-los em outro histograma o reconstrói.
+
+        Returns:
+            List[Tuple[int, int]]: Subfaixas ocupadas.
+        """
+        return [(self._limites(indice)[0], self._contagens[indice])
+                for indice in sorted(self._contagens)]
+
+    def como_dict(self) -> Dict[str, Any]:
+        """
+        Resume o histograma para exportação em JSON.
+
+        Returns:
+            Dict[str, Any]: Contagem, mínimo, máximo, média, percentis e
+            distribuição, em nanossegundos.
+        """
+        return {
+            "contagem": self.contagem,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "media": self.media(),
+            "percentis": {str(p): self.percentil(p) for p in PERCENTIS},
+            "distribuicao": self.distribuicao(),
+        }
+
+
+class Perfil:
+    def __init__(self, digitos_significativos: int = 2):
+        """
+        Histogramas de latência por operação da ArvoreB (buscar, inserir e
+        remover), cada um separado em tempo total, tempo do algoritmo (corpo
+        do método) e tempo dos contratos (total menos algoritmo: invariantes,
+        pré e pós-condições). Ligado com ArvoreB(..., perfil=Perfil()) ou
+        durante um bloco com perfilar().
+
+        Args:
+            digitos_significativos (int): Precisão dos histogramas.
+        """
+        self.digitos_significativos: int = digitos_significativos
+        self.histogramas: Dict[str, Dict[str, HistogramaLatencia]] = {}
+        self._trava = threading.Lock()
+        self._local = threading.local()
+
+    def histograma(self, operacao: str, parte: str = "total") -> HistogramaLatencia:
+        """
+        Retorna o histograma de uma operação e parte, criando-o se preciso.
+
+        Args:
+            operacao (str): Nome do método, ex.: "inserir".
+            parte (str): "total", "algoritmo" ou "contratos".
+
+        Returns:
+            HistogramaLatencia: Histograma correspondente.
+        """
+        with self._trava:
+            partes = self.histogramas.get(operacao)
+            if partes is None:
+                partes = self.histogramas[operacao] = {
+                    nome: HistogramaLatencia(self.digitos_significativos) for nome in PARTES}
+            return partes[parte]
+
+    def medir_algoritmo(self, operacao: str, nanossegundos: int) -> None:
+        """
+        Guarda, para a chamada em curso nesta thread, o tempo do corpo do método.
+
+        Args:
+            operacao (str): Nome do método.
+            nanossegundos (int): Duração do corpo.
+        """
+        self._local.algoritmo = nanossegundos
+
+    def medir_chamada(self, operacao: str, nanossegundos: int) -> None:
+        """
+        Registra uma chamada completa, dividindo-a em algoritmo e contratos
+        com o tempo guardado por medir_algoritmo(). Se o corpo não chegou a
+        executar (pré-condição violada), todo o tempo conta como contratos.
+
+        Args:
+            operacao (str): Nome do método.
+            nanossegundos (int): Duração da chamada, com os contratos.
+        """
+        algoritmo = getattr(self._local, "algoritmo", None)
+        self._local.algoritmo = None
+        total = self.histograma(operacao, "total")
+        with self._trava:
+            total.registrar(nanossegundos)
+            if algoritmo is not None:
+                self.histogramas[operacao]["algoritmo"].registrar(algoritmo)
+            self.histogramas[operacao]["contratos"].registrar(
+                nanossegundos - (algoritmo or 0))
+
+    def zerar(self) -> None:
+        """
+        Descarta todos os histogramas.
+        """
+        with self._trava:
+            self.histogramas = {}
+
+    def despejar(self, caminho: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Exporta os histogramas e, se um caminho for dado, grava-os em JSON.
+
+        Args:
+            caminho (Optional[str]): Arquivo JSON de destino.
+
+        Returns:
+            Dict[str, Any]: {operação: {parte: histograma.como_dict()}}.
+        """
+        with self._trava:
+            dados = {operacao: {parte: histograma.como_dict()
+                                for parte, histograma in partes.items()}
+                     for operacao, partes in self.histogramas.items()}
+        if caminho is not None:
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                json.dump(dados, arquivo, indent=2)
+        return dados
+
+    def resumo(self) -> str:
+        """
+        Formata uma tabela com contagem, percentis e máximo de cada
+        operação e parte, em microssegundos, e a fração do tempo total
+        gasta em contratos.
+
+        Returns:
+            str: Tabela em texto.
+        """
+        linhas = [f"{'operacao':>9} | {'parte':>9} | {'n':>8} | {'p50 us':>9} | "
+                  f"{'p90 us':>9} | {'p99 us':>9} | {'p99.9 us':>9} | {'max us':>9} | {'% total':>7}"]
+        with self._trava:
+            for operacao in sorted(self.histogramas):
+                partes = self.histogramas[operacao]
+                soma_total = partes["total"].soma
+                for parte in PARTES:
+                    h = partes[parte]
+                    fracao = 100 * h.soma / soma_total if soma_total else 0.0
+                    linhas.append(
+                        f"{operacao:>9} | {parte:>9} | {h.contagem:>8} | "
+                        + " | ".join(f"{h.percentil(p) / 1000:>9.2f}" for p in (50, 90, 99, 99.9))
+                        + f" | {h.maximo / 1000:>9.2f} | {fracao:>6.1f}%")
+        return "\n".join(linhas)
+
+
+@contextmanager
+def perfilar(arvore: Any, perfil: Optional[Perfil] = None) -> Iterator[Perfil]:
+    """
+    Liga o modo de perfil da árvore durante o bloco with e restaura o
+    anterior ao sair.
+
+    Args:
+        arvore (Any): ArvoreB a perfilar.
+        perfil (Optional[Perfil]): Perfil a alimentar; um novo, se omitido.
+
+    Yields:
+        Perfil: Perfil que recebe as medições do bloco.
+    """
+    perfil = perfil if perfil is not None else Perfil()
+    anterior = arvore.perfil
+    arvore.perfil = perfil
+    try:
+        yield perfil
+    finally:
+        arvore.perfil = anterior
@@ -0,0 +1,188 @@
+from typing import Any, Callable, Dict, List, Optional
+
+CAPACIDADE_PADRAO = 1024
+
+
+class PoolBuffers:
+    def __init__(self, despejar: Callable[[Any], None],
+                 capacidade_paginas: Optional[int] = None,
+                 capacidade_bytes: Optional[int] = None,
+                 tamanho_pagina: int = 1):
+        """
+        Cache limitado de páginas decodificadas com substituição pelo
+        algoritmo do relógio (aproximação de LRU).
+
+        Cada quadro guarda uma página com bit de referência e contador de
+        fixações. Ao admitir uma página com o pool cheio, o ponteiro do
+        relógio percorre os quadros limpando bits de referência até achar
+        uma página não fixada e não referenciada, que é despejada. Páginas
+        fixadas nunca são despejadas; se todas estiverem fixadas, o pool
+        excede a capacidade temporariamente e volta a ela em reduzir().
+
+        Args:
+            despejar (Callable[[Any], None]): Chamado com a página despejada;
+                deve gravá-la, se suja, e descarregá-la.
+            capacidade_paginas (Optional[int]): Capacidade em páginas.
+            capacidade_bytes (Optional[int]): Capacidade em bytes, convertida
+                em páginas por tamanho_pagina.
+            tamanho_pagina (int): Bytes ocupados por página.
+
+        Raises:
+            ValueError: Se as duas capacidades forem informadas ou se a
+                capacidade resultante não for positiva.
+        """
+        if capacidade_paginas is not None and capacidade_bytes is not None:
+            raise ValueError("Informe a capacidade em páginas ou em bytes, não ambas")
+        if capacidade_bytes is not None:
+            capacidade_paginas = capacidade_bytes // tamanho_pagina
+        if capacidade_paginas is None:
+            capacidade_paginas = CAPACIDADE_PADRAO
+        if capacidade_paginas < 1:
+            raise ValueError("A capacidade do pool deve comportar ao menos uma página")
+        self.capacidade: int = capacidade_paginas
+        self.acertos: int = 0
+        self.faltas: int = 0
+        self.despejos: int = 0
+        self._despejar = despejar
+        self._quadros: List[Any] = []
+        self._ponteiro: int = 0
+
+    def __len__(self) -> int:
+        return len(self._quadros)
+
+    def __contains__(self, pagina: Any) -> bool:
+        return pagina._quadro is not None
+
+    def acessar(self, pagina: Any) -> None:
+        """
+        Registra um acerto em uma página que já está no pool.
+
+        Args:
+            pagina (Any): Página presente no pool.
+        """
+        self.acertos += 1
+        pagina._referenciada = True
+
+    def admitir(self, pagina: Any, falta: bool = True) -> None:
+        """
+        Coloca uma página recém-carregada ou recém-criada no pool,
+        despejando outra se necessário.
+
+        Args:
+            pagina (Any): Página fora do pool.
+            falta (bool): Indica se a página foi lida do armazenamento.
+        """
+        if falta:
+            self.faltas += 1
+        pagina._referenciada = True
+        if len(self._quadros) >= self.capacidade:
+            indice = self._vitima()
+            if indice is not None:
+                self._despejar_quadro(indice)
+                self._quadros[indice] = pagina
+                pagina._quadro = indice
+                self._ponteiro = (indice + 1) % len(self._quadros)
+                return
+        pagina._quadro = len(self._quadros)
+        self._quadros.append(pagina)
+
+    def fixar(self, pagina: Any) -> None:
+        """
+        Impede o despejo da página até a chamada correspondente de desafixar().
+
+        Args:
+            pagina (Any): Página do pool.
+        """
+        pagina._fixacoes += 1
+
+    def desafixar(self, pagina: Any) -> None:
+        """
+        Desfaz uma fixação.
+
+        Args:
+            pagina (Any): Página fixada.
+
+        Raises:
+            ValueError: Se a página não estiver fixada.
+        """
+        if pagina._fixacoes == 0:
+            raise ValueError("A página não está fixada")
+        pagina._fixacoes -= 1
+
+    def remover(self, pagina: Any) -> None:
+        """
+        Retira do pool, sem despejá-la, uma página que deixou de existir.
+
+        Args:
+            pagina (Any): Página liberada.
+        """
+        if pagina._quadro is not None:
+            self._retirar_quadro(pagina._quadro)
+
+    def reduzir(self) -> None:
+        """
+        Despeja páginas não fixadas até o pool voltar à capacidade.
+        """
+        while len(self._quadros) > self.capacidade:
+            indice = self._vitima()
+            if indice is None:
+                return
+            self._despejar_quadro(indice)
+            self._retirar_quadro(indice)
+
+    def paginas(self) -> List[Any]:
+        """
+        Retorna as páginas presentes no pool.
+
+        Returns:
+            List[Any]: Cópia da lista de quadros.
+        """
+        return list(self._quadros)
+
+    def estatisticas(self) -> Dict[str, int]:
+        """
+        Retorna os contadores do pool, úteis para dimensioná-lo.
+
+        Returns:
+            Dict[str, int]: Capacidade, ocupação, acertos, faltas e despejos.
+        """
+        return {
+            "capacidade": self.capacidade,
+            "ocupacao": len(self._quadros),
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "despejos": self.despejos,
+        }
+
+    def _vitima(self) -> Optional[int]:
+        """
+        Avança o ponteiro do relógio até uma página despejável.
+
+        Returns:
+            Optional[int]: Índice do quadro escolhido, ou None se todos
+            estiverem fixados.
+        """
+        n = len(self._quadros)
+        for _ in range(2 * n):
+            pagina = self._quadros[self._ponteiro]
+            if pagina._fixacoes == 0:
+                if not pagina._referenciada:
+                    return self._ponteiro
+                pagina._referenciada = False
+            self._ponteiro = (self._ponteiro + 1) % n
+        return None
+
+    def _despejar_quadro(self, indice: int) -> None:
+        pagina = self._quadros[indice]
+        pagina._quadro = None
+        self._despejar(pagina)
+        self.despejos += 1
+
+    def _retirar_quadro(self, indice: int) -> None:
+        self._quadros[indice]._quadro = None
+        ultima = self._quadros.pop()
+        if indice < len(self._quadros):
+            self._quadros[indice] = ultima
+            ultima._quadro = indice
+        if self._ponteiro >= len(self._quadros):
+            self._ponteiro = 0
@@ -0,0 +1,156 @@
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Iterator, Tuple
+
+MOLDURA = struct.Struct("<II")
+
+
+class RegistroEscrita:
+    def __init__(self, caminho: str, atraso_grupo: float = 0.0):
+        """
+        Registro de escrita antecipada (WAL) somente de acréscimo.
+
+        Cada entrada é gravada como uma moldura (tamanho, CRC32, conteúdo).
+        Uma moldura incompleta ou com CRC inválido no fim do arquivo indica
+        escrita interrompida e encerra a leitura. anexar() apenas escreve no
+        arquivo; a durabilidade vem de confirmar(), que implementa commit em
+        grupo: a primeira thread que precisa sincronizar vira líder e faz um
+        único fsync cobrindo tudo o que foi anexado até então, enquanto as
+        demais esperam por ele.
+
+        Args:
+            caminho (str): Caminho do arquivo de registro.
+            atraso_grupo (float): Segundos que o líder espera antes do fsync
+                para que mais operações entrem no mesmo grupo.
+
+        Attributes:
+            sincronizacoes (int): Quantidade de fsyncs realizados.
+            tamanho (int): Bytes válidos no registro.
+
+        Raises:
+            ValueError: Se o atraso do grupo for negativo.
+        """
+        if atraso_grupo < 0:
+            raise ValueError("O atraso do grupo não pode ser negativo")
+        self.caminho: str = caminho
+        self.atraso_grupo: float = atraso_grupo
+        self.sincronizacoes: int = 0
+        self._fd: int = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o644)
+        self.tamanho: int = self._tamanho_valido()
+        os.ftruncate(self._fd, self.tamanho)
+        self._condicao = threading.Condition()
+        self._anexado: int = 0
+        self._duravel: int = 0
+        self._sincronizando: bool = False
+
+    def _tamanho_valido(self) -> int:
+        fim = 0
+        for _, fim in self._molduras():
+            pass
+        return fim
+
+    def _molduras(self) -> Iterator[Tuple[bytes, int]]:
+        posicao = 0
+        total = os.fstat(self._fd).st_size
+        while posicao + MOLDURA.size <= total:
+            tamanho, crc = MOLDURA.unpack(os.pread(self._fd, MOLDURA.size, posicao))
+            inicio = posicao + MOLDURA.size
+            if inicio + tamanho > total:
+                return
+            conteudo = os.pread(self._fd, tamanho, inicio)
+            if zlib.crc32(conteudo) != crc:
+                return
+            posicao = inicio + tamanho
+            yield conteudo, posicao
+
+    def entradas(self) -> Iterator[bytes]:
+        """
+        Percorre as entradas válidas, da mais antiga para a mais recente.
+
+        Returns:
+            Iterator[bytes]: Conteúdo de cada entrada.
+        """
+        return (conteudo for conteudo, _ in self._molduras())
+
+    def anexar(self, conteudo: bytes) -> int:
+        """
+        Acrescenta uma entrada ao fim do registro, sem sincronizar.
+
+        Args:
+            conteudo (bytes): Conteúdo da entrada.
+
+        Returns:
+            int: Número de sequência (LSN) da entrada, a ser passado a confirmar().
+        """
+        moldura = MOLDURA.pack(len(conteudo), zlib.crc32(conteudo)) + conteudo
+        with self._condicao:
+            os.pwrite(self._fd, moldura, self.tamanho)
+            self.tamanho += len(moldura)
+            self._anexado += 1
+            return self._anexado
+
+    def confirmar(self, lsn: int) -> None:
+        """
+        Bloqueia até que a entrada `lsn` (e todas as anteriores) esteja em disco.
+
+        Args:
+            lsn (int): Número de sequência devolvido por anexar().
+        """
+        with self._condicao:
+            while self._duravel < lsn:
+                if self._sincronizando:
+                    self._condicao.wait()
+                    continue
+                self._sincronizando = True
+                alvo = None
+                self._condicao.release()
+                try:
+                    if self.atraso_grupo:
+                        time.sleep(self.atraso_grupo)
+                    with self._condicao:
+                        candidato = self._anexado
+                    os.fsync(self._fd)
+                    alvo = candidato
+                finally:
+                    self._condicao.acquire()
+                    if alvo is not None:
+                        self._duravel = max(self._duravel, alvo)
+                        self.sincronizacoes += 1
+                    self._sincronizando = False
+                    self._condicao.notify_all()
+
+    @property
+    def ultimo_lsn(self) -> int:
+        """
+        LSN da entrada anexada mais recentemente.
+
+        Returns:
+            int: Número de sequência, ou 0 se nada foi anexado.
+        """
+        return self._anexado
+
+    def confirmar_tudo(self) -> None:
+        """
+        Bloqueia até que todas as entradas anexadas estejam em disco.
+        """
+        self.confirmar(self._anexado)
+
+    def truncar(self) -> None:
+        """
+        Descarta todas as entradas, após um ponto de controle.
+        """
+        with self._condicao:
+            os.ftruncate(self._fd, 0)
+            os.fsync(self._fd)
+            self.tamanho = 0
+            self._duravel = self._anexado
+
+    def fechar(self) -> None:
+        """
+        Sincroniza e fecha o arquivo de registro.
+        """
+        self.confirmar_tudo()
+        os.close(self._fd)
@@ -0,0 +1,65 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class TravaLeituraEscrita:
+    """
+    Trava de leitores e escritor com preferência para escritores: vários
+    leitores podem segurá-la ao mesmo tempo, um escritor a segura sozinho,
+    e novos leitores esperam enquanto houver escritor aguardando.
+    """
+    __slots__ = ("_condicao", "_leitores", "_escritor", "_escritores_esperando")
+
+    def __init__(self):
+        self._condicao = threading.Condition(threading.Lock())
+        self._leitores = 0
+        self._escritor = False
+        self._escritores_esperando = 0
+
+    def adquirir_leitura(self) -> None:
+        with self._condicao:
+            while self._escritor or self._escritores_esperando:
+                self._condicao.wait()
+            self._leitores += 1
+
+    def liberar_leitura(self) -> None:
+        with self._condicao:
+            self._leitores -= 1
+            if self._leitores == 0:
+                self._condicao.notify_all()
+
+    def adquirir_escrita(self) -> None:
+        with self._condicao:
+            self._escritores_esperando += 1
+            while self._escritor or self._leitores:
+                self._condicao.wait()
+            self._escritores_esperando -= 1
+            self._escritor = True
+
+    def liberar_escrita(self) -> None:
+        with self._condicao:
+            self._escritor = False
+            self._condicao.notify_all()
+
+    @contextmanager
+    def leitura(self) -> Iterator[None]:
+        """
+        Segura a trava em modo de leitura durante o bloco with.
+        """
+        self.adquirir_leitura()
+        try:
+            yield
+        finally:
+            self.liberar_leitura()
+
+    @contextmanager
+    def escrita(self) -> Iterator[None]:
+        """
+        Segura a trava em modo de escrita durante o bloco with.
+        """
+        self.adquirir_escrita()
+        try:
+            yield
+        finally:
+            self.liberar_escrita()
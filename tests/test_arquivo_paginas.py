@@ -0,0 +1,134 @@
+import random
+import pytest
+from src.ArvoreB import ArvoreB
+
+
+def test_persistencia_entre_aberturas(tmp_path):
+    """
+    Verifica que as chaves gravadas sobrevivem ao fechamento e à reabertura
+    do arquivo, sem informar o grau novamente.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2)
+    for chave in range(100, 0, -1):
+        tree.inserir(chave)
+    tree.fechar()
+
+    tree = ArvoreB.abrir(caminho)
+    assert tree.t == 2
+    assert list(tree) == list(range(1, 101))
+    assert tree.buscar(42)
+    assert not tree.buscar(0)
+    tree.fechar()
+
+def test_busca_le_apenas_o_caminho(tmp_path):
+    """
+    Verifica que uma busca lê do arquivo apenas uma página por nível.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=3)
+    tree.inserir_lote(range(5000))
+    niveis = tree.altura()
+    tree.fechar()
+
+    tree = ArvoreB.abrir(caminho)
+    gerenciador = tree._armazenamento
+    assert tree.buscar(1234)
+    assert gerenciador.leituras == niveis
+    tree.fechar()
+
+def test_remocoes_reaproveitam_slots(tmp_path):
+    """
+    Verifica que páginas descartadas por fusões voltam à lista de livres
+    e são reaproveitadas por inserções posteriores.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2)
+    for chave in range(300):
+        tree.inserir(chave)
+    arquivo = tree._armazenamento.arquivo
+    total = arquivo.total
+    for chave in range(0, 300, 2):
+        tree.remover(chave)
+    assert list(tree) == list(range(1, 300, 2))
+    for chave in range(0, 300, 2):
+        tree.inserir(chave)
+    assert arquivo.total <= total + 2
+    tree.fechar()
+
+    tree = ArvoreB.abrir(caminho)
+    assert list(tree) == list(range(300))
+    tree.fechar()
+
+def test_operacoes_mistas_com_contratos(tmp_path):
+    """
+    Verifica, com os contratos completos ligados, operações unitárias e em
+    lote sobre a árvore em disco contra um conjunto de referência.
+    """
+    random.seed(9)
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2, contratos="completo", tamanhos_subarvore=True)
+    esperado = set()
+    for _ in range(40):
+        chaves = random.sample(range(1000), 20)
+        if random.random() < 0.5:
+            tree.inserir_lote(chaves)
+            esperado.update(chaves)
+        else:
+            tree.remover_lote(chaves)
+            esperado.difference_update(chaves)
+        chave = random.randrange(1000)
+        if chave in esperado:
+            tree.remover(chave)
+            esperado.discard(chave)
+        else:
+            tree.inserir(chave)
+            esperado.add(chave)
+    assert list(tree) == sorted(esperado)
+    tree.fechar()
+
+    tree = ArvoreB.abrir(caminho, tamanhos_subarvore=True)
+    assert list(tree) == sorted(esperado)
+    assert tree.contar_intervalo(0, 999) == len(esperado)
+    tree.fechar()
+
+def test_grau_divergente(tmp_path):
+    """
+    Verifica que reabrir o arquivo com outro grau lança ValueError.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    ArvoreB.abrir(caminho, m=2).fechar()
+    with pytest.raises(ValueError):
+        ArvoreB.abrir(caminho, m=3)
+
+def test_arquivo_invalido(tmp_path):
+    """
+    Verifica que um arquivo que não é de páginas lança ValueError, assim
+    como a criação sem grau mínimo.
+    """
+    caminho = tmp_path / "outro.bin"
+    caminho.write_bytes(b"conteudo qualquer" * 8)
+    with pytest.raises(ValueError):
+        ArvoreB.abrir(str(caminho))
+    with pytest.raises(ValueError):
+        ArvoreB.abrir(str(tmp_path / "novo.pag"))
+
+def test_chaves_fora_de_int64_recusadas_na_insercao(tmp_path):
+    """
+    Verifica que chaves que não cabem nas páginas são recusadas ao serem
+    inseridas, sem alterar a árvore, que continua podendo ser fechada.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2)
+    tree.inserir_lote(range(50))
+    with pytest.raises(ValueError):
+        tree.inserir(2 ** 70)
+    with pytest.raises(ValueError):
+        tree.inserir_lote([60, "x"])
+    assert tree.buscar(60) is None and len(tree) == 50
+    tree.inserir(100)
+    tree.fechar()
+
+    tree = ArvoreB.abrir(caminho)
+    assert list(tree) == list(range(50)) + [100]
+    tree.fechar()
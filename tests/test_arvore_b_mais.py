@@ -0,0 +1,138 @@
+import random
+import icontract
+import pytest
+from src.ArvoreBMais import ArvoreBMais
+from src.Pagina import Pagina
+from src.PaginaBMais import FolhaEncadeada
+from src.PaginaCompacta import PaginaCompacta, PaginaCompactaInt
+
+
+def _folhas(tree: ArvoreBMais) -> list:
+    """
+    Retorna as folhas na ordem do encadeamento.
+    """
+    folhas = []
+    folha = tree._folha_extrema(False)
+    while folha is not None:
+        folhas.append(folha)
+        folha = folha.proxima
+    return folhas
+
+def test_chaves_ficam_apenas_nas_folhas():
+    """
+    Verifica que todas as chaves estão nas folhas, em ordem pelo
+    encadeamento, e que as internas guardam apenas cópias separadoras.
+    """
+    tree = ArvoreBMais(2)
+    for chave in range(1, 51):
+        tree.inserir(chave)
+    folhas = _folhas(tree)
+    assert [chave for folha in folhas for chave in folha.registros] == list(range(1, 51))
+    internas = [no for no in tree._todos_nos() if not no.folha]
+    assert internas and all(set(no.registros) <= set(range(1, 51)) for no in internas)
+    assert tree.altura() > 1
+
+@pytest.mark.parametrize("tipo_pagina", [None, PaginaCompacta, PaginaCompactaInt])
+def test_operacoes_aleatorias_mantem_contratos(tipo_pagina):
+    """
+    Verifica, com contratos completos, uma sequência aleatória de inserções
+    e remoções até esvaziar a árvore.
+    """
+    opcoes = {"tipo_pagina": tipo_pagina} if tipo_pagina else {}
+    tree = ArvoreBMais(3, contratos="completo", **opcoes)
+    sorteio = random.Random(17)
+    presentes = set()
+    for _ in range(800):
+        chave = sorteio.randrange(400)
+        if chave in presentes:
+            tree.remover(chave)
+            presentes.discard(chave)
+        else:
+            tree.inserir(chave)
+            presentes.add(chave)
+        assert tree.buscar(chave) == (chave if chave in presentes else None)
+    assert list(tree) == sorted(presentes)
+    for chave in sorted(presentes):
+        tree.remover(chave)
+    assert tree.raiz is None and list(tree) == []
+
+def test_intervalos_percorrem_folhas_encadeadas():
+    """
+    Verifica intervalos crescentes e decrescentes, com e sem limites.
+    """
+    tree = ArvoreBMais(2)
+    for chave in range(0, 200, 2):
+        tree.inserir(chave)
+    assert list(tree.intervalo(15, 41)) == list(range(16, 41, 2))
+    assert list(tree.intervalo(None, 7)) == [0, 2, 4, 6]
+    assert list(tree.intervalo(193)) == [194, 196, 198]
+    assert list(tree.intervalo_reverso(15, 41)) == list(range(40, 15, -2))
+    assert list(reversed(tree)) == list(range(198, -1, -2))
+    assert list(tree.intervalo(50, 40)) == []
+
+def test_remocao_mantem_separadores_validos():
+    """
+    Verifica que remover a chave copiada em um separador não quebra as
+    buscas nem o encadeamento.
+    """
+    tree = ArvoreBMais(2, contratos="completo")
+    for chave in range(1, 30):
+        tree.inserir(chave)
+    separador = tree.raiz.registros[0]
+    tree.remover(separador)
+    assert tree.buscar(separador) is None
+    assert list(tree) == [chave for chave in range(1, 30) if chave != separador]
+
+def test_contratos_de_duplicata_e_ausencia():
+    """
+    Verifica as pré-condições de inserção duplicada e remoção inexistente.
+    """
+    tree = ArvoreBMais(2, contratos="completo")
+    tree.inserir(1)
+    with pytest.raises(icontract.ViolationError):
+        tree.inserir(1)
+    with pytest.raises(icontract.ViolationError):
+        tree.remover(2)
+
+@pytest.mark.parametrize("tipo_pagina", [None, PaginaCompacta, PaginaCompactaInt])
+def test_apenas_folhas_da_arvore_b_mais_sao_encadeadas(tipo_pagina):
+    """
+    Verifica que as folhas usam a variante encadeada da representação
+    escolhida e que as páginas comuns e as internas não têm ponteiros.
+    """
+    opcoes = {"tipo_pagina": tipo_pagina} if tipo_pagina else {}
+    tree = ArvoreBMais(2, **opcoes)
+    for chave in range(40):
+        tree.inserir(chave)
+    base = tipo_pagina or Pagina
+    for no in tree._todos_nos():
+        assert isinstance(no, base)
+        assert isinstance(no, FolhaEncadeada) == no.folha
+    assert not hasattr(base(2, True), "proxima")
+    with pytest.raises(ValueError):
+        ArvoreBMais(2, tipo_pagina=lambda t, folha: Pagina(t, folha))
+
+def test_incremental_confere_paginas_tocadas():
+    """
+    Verifica que o modo incremental registra apenas as páginas alteradas,
+    mantém as pré-condições e acusa a corrupção na própria operação.
+    """
+    tree = ArvoreBMais(2, contratos="incremental")
+    sorteio = random.Random(4)
+    chaves = sorteio.sample(range(1000), 300)
+    for chave in chaves:
+        tree.inserir(chave)
+    for chave in chaves[:200]:
+        tree.remover(chave)
+    assert list(tree) == sorted(chaves[200:])
+    tree.inserir(5000)
+    assert tree._folha_extrema(True) in tree._tocadas
+    assert tree._folha_extrema(False) not in tree._tocadas
+    with pytest.raises(icontract.ViolationError):
+        tree.inserir(5000)
+
+    folha = tree._folha_de(5000)
+    folha.registros.append(-1)
+    folha.qtdRegistros += 1
+    with pytest.raises(icontract.ViolationError):
+        tree.inserir(5001)
@@ -0,0 +1,138 @@
+import asyncio
+import random
+import threading
+import pytest
+from src.ArvoreB import ArvoreB
+from src.ArvoreBAssincrona import ArvoreBAssincrona
+
+
+def test_operacoes_em_arquivo(tmp_path):
+    """
+    Verifica inserção, busca, remoção e varredura pela fachada assíncrona
+    sobre uma árvore em arquivo, e que os dados persistem ao fechar.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+
+    async def cenario():
+        async with await ArvoreBAssincrona.abrir(caminho, m=3, tamanho_bloco=7) as arv:
+            for chave in range(100):
+                await arv.inserir(chave)
+            await arv.remover(50)
+            assert await arv.buscar(42) == 42
+            assert await arv.buscar(50) is None
+            assert [chave async for chave in arv.intervalo(45, 60)] == \
+                [chave for chave in range(45, 61) if chave != 50]
+
+    asyncio.run(cenario())
+    tree = ArvoreB.abrir(caminho)
+    assert list(tree) == [chave for chave in range(100) if chave != 50]
+    tree.fechar()
+
+def test_buscas_simultaneas_sao_agrupadas(tmp_path):
+    """
+    Verifica que milhares de buscas simultâneas seguem em poucos lotes, que
+    buscas pela mesma chave compartilham o resultado e que todas as
+    respostas estão corretas.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=4)
+    tree.inserir_lote(range(0, 20000, 2))
+
+    async def cenario():
+        arv = ArvoreBAssincrona(tree)
+        sorteio = random.Random(7)
+        chaves = [sorteio.randrange(20000) for _ in range(3000)]
+        resultados = await asyncio.gather(*(arv.buscar(chave) for chave in chaves))
+        esperado = [chave if chave % 2 == 0 else None for chave in chaves]
+        assert resultados == esperado
+        assert arv.lotes_busca <= 2
+        assert arv.buscas_coalescidas == len(chaves) - len(set(chaves))
+        await arv.fechar()
+
+    asyncio.run(cenario())
+
+def test_busca_apos_escrita_ve_a_escrita():
+    """
+    Verifica que uma busca iniciada depois de uma escrita não reaproveita
+    o resultado de uma busca anterior pela mesma chave.
+    """
+    async def cenario():
+        arv = ArvoreBAssincrona(ArvoreB(2))
+        antes = asyncio.ensure_future(arv.buscar(5))
+        await asyncio.sleep(0)
+        await arv.inserir(5)
+        depois = await arv.buscar(5)
+        assert await antes is None
+        assert depois == 5
+        await arv.fechar()
+
+    asyncio.run(cenario())
+
+def test_intervalo_em_blocos_tolera_escritas():
+    """
+    Verifica que a varredura em blocos entrega chaves crescentes e sem
+    repetição mesmo com escritas entre os blocos.
+    """
+    async def cenario():
+        arv = ArvoreBAssincrona(ArvoreB(2), tamanho_bloco=10)
+        for chave in range(0, 100, 2):
+            await arv.inserir(chave)
+        vistas = []
+        async for chave in arv.intervalo():
+            vistas.append(chave)
+            if chave == 18:
+                await arv.remover(22)
+                await arv.inserir(99)
+        assert vistas == sorted(set(vistas))
+        assert 22 not in vistas and 99 in vistas
+        await arv.fechar()
+
+    asyncio.run(cenario())
+
+def test_tamanho_bloco_invalido():
+    """
+    Verifica que o tamanho do bloco deve ser positivo.
+    """
+    with pytest.raises(ValueError):
+        ArvoreBAssincrona(ArvoreB(2), tamanho_bloco=0)
+
+def test_escrita_com_lote_em_voo_mantem_agrupamento():
+    """
+    Verifica que uma escrita feita com um lote de buscas em voo não faz as
+    buscas seguintes escaparem do agrupamento: enquanto houver lote em
+    voo, novas buscas esperam e seguem juntas.
+    """
+    tree = ArvoreB(2)
+    tree.inserir_lote(range(10))
+    portoes = {1: threading.Event(), 3: threading.Event()}
+    original = tree.buscar
+
+    def buscar(chave):
+        if chave in portoes:
+            portoes[chave].wait()
+        return original(chave)
+
+    tree.buscar = buscar
+
+    async def cenario():
+        arv = ArvoreBAssincrona(tree)
+        primeira = asyncio.ensure_future(arv.buscar(1))
+        await asyncio.sleep(0)
+        segunda = asyncio.ensure_future(arv.buscar(2))
+        await asyncio.sleep(0)
+        escrita = asyncio.ensure_future(arv.inserir(50))
+        await asyncio.sleep(0)
+        terceira = asyncio.ensure_future(arv.buscar(3))
+        await asyncio.sleep(0)
+        portoes[1].set()
+        assert await primeira == 1 and await segunda == 2
+        await escrita
+        seguintes = [asyncio.ensure_future(arv.buscar(chave)) for chave in (4, 5, 50)]
+        await asyncio.sleep(0)
+        portoes[3].set()
+        assert await terceira == 3
+        assert await asyncio.gather(*seguintes) == [4, 5, 50]
+        assert arv.lotes_busca == 4
+        await arv.fechar()
+
+    asyncio.run(cenario())
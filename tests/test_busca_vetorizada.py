@@ -0,0 +1,42 @@
+import pytest
+from src.ArvoreB import ArvoreB
+from src.PaginaCompacta import PaginaCompactaInt
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("tipo_pagina", [None, PaginaCompactaInt])
+def test_buscar_lote_equivale_a_buscar(tipo_pagina):
+    """
+    Verifica que a máscara de buscar_lote coincide com buscar chave a
+    chave, mantendo a ordem das consultas e as repetições.
+    """
+    opcoes = {"tipo_pagina": tipo_pagina} if tipo_pagina else {}
+    tree = ArvoreB(m=3, contratos="desligado", **opcoes)
+    tree.inserir_lote(range(0, 3000, 3))
+    consultas = np.random.default_rng(1).integers(-10, 3100, size=5000)
+    mascara = tree.buscar_lote(consultas)
+    assert mascara.dtype == bool
+    assert mascara.tolist() == [tree.buscar(int(c)) is not None for c in consultas]
+
+def test_buscar_lote_posicoes_equivalem_a_rank():
+    """
+    Verifica que, com posicoes, cada chave presente recebe seu rank e as
+    ausentes recebem -1.
+    """
+    tree = ArvoreB(m=2, tamanhos_subarvore=True, contratos="desligado")
+    tree.inserir_lote(range(0, 1000, 2))
+    consultas = np.array([998, 3, 0, 500, 500, 1001, 42])
+    posicoes = tree.buscar_lote(consultas, posicoes=True)
+    esperado = [tree.rank(int(c)) if c % 2 == 0 and c < 1000 else -1 for c in consultas]
+    assert posicoes.tolist() == esperado
+
+def test_buscar_lote_em_arvore_vazia_e_sem_tamanhos():
+    """
+    Verifica o lote em árvore vazia e a exigência de tamanhos de subárvore.
+    """
+    tree = ArvoreB(m=2)
+    assert tree.buscar_lote(np.array([1, 2])).tolist() == [False, False]
+    assert len(tree.buscar_lote([])) == 0
+    with pytest.raises(ValueError):
+        tree.buscar_lote([1], posicoes=True)
@@ -0,0 +1,74 @@
+import pytest
+from src.ArvoreB import ArvoreB
+from src.PaginaCompacta import PaginaCompactaInt
+
+
+def _chaves_em_ordem(tree: ArvoreB) -> list:
+    """
+    Percorre a árvore em ordem simétrica e devolve as chaves.
+    """
+    chaves = []
+    def _percorrer(pagina):
+        if pagina.folha:
+            chaves.extend(pagina.registros)
+            return
+        for i in range(pagina.qtdRegistros + 1):
+            _percorrer(pagina.paginas[i])
+            if i < pagina.qtdRegistros:
+                chaves.append(pagina.registros[i])
+    if tree.raiz is not None:
+        _percorrer(tree.raiz)
+    return chaves
+
+@pytest.mark.parametrize("t", [2, 3, 5])
+@pytest.mark.parametrize("fator", [0.0, 0.5, 1.0])
+@pytest.mark.parametrize("n", [1, 2, 7, 30, 301])
+def test_carga_produz_arvore_valida(t, fator, n):
+    """
+    Verifica que a carga em lote respeita limites de chaves, de filhos,
+    nível das folhas e preserva a ordem das chaves.
+    """
+    tree = ArvoreB.de_ordenados(range(n), t, fator_preenchimento=fator)
+    assert tree._limites_chaves_ok()
+    assert tree._limites_filhos_ok()
+    assert tree._folhas_mesmo_nivel()
+    assert _chaves_em_ordem(tree) == list(range(n))
+
+def test_carga_vazia_gera_arvore_vazia():
+    """
+    Verifica que um iterável vazio gera árvore sem raiz.
+    """
+    tree = ArvoreB.de_ordenados([], 3)
+    assert tree.raiz is None
+    assert tree.buscar(1) is None
+
+def test_carga_aceita_gerador_e_opcoes_do_construtor():
+    """
+    Verifica que a carga consome um gerador e repassa as opções da árvore.
+    """
+    tree = ArvoreB.de_ordenados((i * 2 for i in range(1000)), 4,
+                                tipo_pagina=PaginaCompactaInt, contratos="incremental")
+    assert isinstance(tree.raiz, PaginaCompactaInt)
+    assert tree.contratos.nivel == "incremental"
+    assert tree.buscar(998) == 998
+    assert tree.buscar(999) is None
+
+def test_carga_rejeita_chaves_fora_de_ordem():
+    """
+    Verifica que chaves repetidas ou fora de ordem são rejeitadas.
+    """
+    with pytest.raises(ValueError):
+        ArvoreB.de_ordenados([1, 3, 2], 2)
+    with pytest.raises(ValueError):
+        ArvoreB.de_ordenados([1, 1], 2)
+
+def test_arvore_carregada_aceita_insercoes_e_remocoes():
+    """
+    Verifica que a árvore carregada continua operável com contratos completos.
+    """
+    tree = ArvoreB.de_ordenados(range(0, 200, 2), 2)
+    for chave in range(1, 200, 2):
+        tree.inserir(chave)
+    for chave in range(0, 200, 3):
+        tree.remover(chave)
+    assert _chaves_em_ordem(tree) == [c for c in range(200) if c % 3]
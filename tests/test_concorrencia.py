@@ -0,0 +1,138 @@
+import random
+import sys
+import threading
+import pytest
+from src.ArvoreB import ArvoreB
+from src.ModoContratos import ModoContratos
+from src.PaginaCompacta import PaginaCompacta
+from src.TravaLeituraEscrita import TravaLeituraEscrita
+
+
+@pytest.fixture
+def trocas_frequentes():
+    """
+    Reduz o intervalo de troca de threads para expor entrelaçamentos.
+    """
+    anterior = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(anterior)
+
+def _verificar_estrutura(tree: ArvoreB) -> None:
+    """
+    Reativa os contratos e verifica as invariantes da árvore.
+    """
+    tree.contratos = ModoContratos("completo")
+    assert tree._limites_chaves_ok()
+    assert tree._limites_filhos_ok()
+    assert tree._folhas_mesmo_nivel()
+
+@pytest.mark.parametrize("m, tipo_pagina", [(2, None), (3, PaginaCompacta)])
+def test_escritores_concorrentes(trocas_frequentes, m, tipo_pagina):
+    """
+    Verifica que várias threads inserindo, removendo e buscando chaves
+    disjuntas deixam a árvore válida e com o conteúdo esperado.
+    """
+    opcoes = {"tipo_pagina": tipo_pagina} if tipo_pagina else {}
+    tree = ArvoreB(m, concorrente=True, **opcoes)
+    inicial = list(range(0, 3000, 3))
+    tree.inserir_lote(inicial)
+    n_threads = 4
+    finais = [None] * n_threads
+    erros = []
+
+    def escritor(indice):
+        try:
+            sorteio = random.Random(indice)
+            minhas = {chave for chave in inicial if chave % n_threads == indice}
+            for _ in range(300):
+                chave = sorteio.randrange(3000)
+                if chave % n_threads != indice:
+                    tree.buscar(chave)
+                elif chave in minhas:
+                    tree.remover(chave)
+                    minhas.discard(chave)
+                    assert tree.buscar(chave) is None
+                else:
+                    tree.inserir(chave)
+                    minhas.add(chave)
+                    assert tree.buscar(chave) == chave
+            finais[indice] = minhas
+        except Exception as erro:
+            erros.append(erro)
+
+    threads = [threading.Thread(target=escritor, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not erros
+    assert list(tree) == sorted(set().union(*finais))
+    _verificar_estrutura(tree)
+
+def test_varredura_concorrente_ve_estado_consistente(trocas_frequentes):
+    """
+    Verifica que a iteração durante escritas percorre um instantâneo: as
+    chaves saem ordenadas e as que nunca são tocadas aparecem sempre.
+    """
+    tree = ArvoreB(2, concorrente=True)
+    tree.inserir_lote(range(0, 2000, 2))
+    parar = threading.Event()
+
+    def escritor():
+        chave = 1
+        while not parar.is_set():
+            tree.inserir(chave)
+            tree.remover(chave)
+            chave = (chave + 2) % 2000
+
+    thread = threading.Thread(target=escritor)
+    thread.start()
+    try:
+        for _ in range(5):
+            chaves = list(tree)
+            assert chaves == sorted(chaves)
+            assert [chave for chave in chaves if chave % 2 == 0] == list(range(0, 2000, 2))
+            assert [chave for chave in tree.intervalo(100, 199) if chave % 2 == 0] == list(range(100, 200, 2))
+    finally:
+        parar.set()
+        thread.join()
+    _verificar_estrutura(tree)
+
+def test_concorrente_rejeita_contratos():
+    """
+    Verifica que o modo concorrente exige contratos desligados.
+    """
+    with pytest.raises(ValueError):
+        ArvoreB(2, contratos=ModoContratos("completo"), concorrente=True)
+    assert ArvoreB(2, concorrente=True).contratos.nivel == "desligado"
+
+def test_concorrente_rejeita_tamanhos_subarvore():
+    """
+    Verifica que o modo concorrente não aceita tamanhos de subárvore.
+    """
+    with pytest.raises(ValueError):
+        ArvoreB(2, tamanhos_subarvore=True, concorrente=True)
+
+def test_trava_leitura_compartilhada():
+    """
+    Verifica que vários leitores seguram a trava ao mesmo tempo e que o
+    escritor espera todos saírem.
+    """
+    trava = TravaLeituraEscrita()
+    trava.adquirir_leitura()
+    trava.adquirir_leitura()
+    entrou = threading.Event()
+
+    def escritor():
+        with trava.escrita():
+            entrou.set()
+
+    thread = threading.Thread(target=escritor)
+    thread.start()
+    assert not entrou.wait(0.05)
+    trava.liberar_leitura()
+    assert not entrou.wait(0.05)
+    trava.liberar_leitura()
+    thread.join()
+    assert entrou.is_set()
@@ -0,0 +1,111 @@
+import random
+import pytest
+from src.ArvoreB import ArvoreB
+from src.ArvoreBCongelada import ArvoreBCongelada
+
+
+def _arvore(quantidade: int = 800, m: int = 2) -> ArvoreB:
+    """
+    Cria uma árvore com chaves aleatórias, mantendo tamanhos de subárvore
+    para comparar o rank.
+    """
+    sorteio = random.Random(5)
+    tree = ArvoreB(m=m, tamanhos_subarvore=True, contratos="desligado")
+    tree.inserir_lote(sorteio.sample(range(-5000, 5000), quantidade))
+    return tree
+
+def _conferir(congelada: ArvoreBCongelada, tree: ArvoreB) -> None:
+    """
+    Compara busca, rank, intervalos e altura da cópia congelada com a origem.
+    """
+    assert len(congelada) == len(tree)
+    assert congelada.altura() == tree.altura()
+    assert list(congelada) == list(tree)
+    for chave in range(-5100, 5100, 37):
+        assert congelada.buscar(chave) == tree.buscar(chave)
+        assert congelada.rank(chave) == tree.rank(chave)
+    for inicio, fim in ((None, None), (-100, 100), (None, -4000), (4000, None), (7, 7)):
+        assert list(congelada.intervalo(inicio, fim)) == list(tree.intervalo(inicio, fim))
+
+@pytest.mark.parametrize("m", [2, 5])
+def test_congelar_preserva_consultas(m):
+    """
+    Verifica que a árvore congelada responde como a árvore de origem.
+    """
+    tree = _arvore(m=m)
+    _conferir(tree.congelar(), tree)
+
+def test_congelada_independe_de_escritas_posteriores():
+    """
+    Verifica que alterações na origem não afetam a cópia congelada.
+    """
+    tree = _arvore()
+    congelada = tree.congelar()
+    chaves = list(tree)
+    tree.remover(chaves[0])
+    assert congelada.buscar(chaves[0]) == chaves[0]
+    assert list(congelada) == chaves
+
+def test_salvar_e_abrir_com_mmap(tmp_path):
+    """
+    Verifica que a árvore gravada e mapeada de volta responde igual à
+    origem e que fechar() libera o mapeamento.
+    """
+    caminho = str(tmp_path / "arvore.cong")
+    tree = _arvore()
+    tree.congelar().salvar(caminho)
+    aberta = ArvoreBCongelada.abrir(caminho)
+    _conferir(aberta, tree)
+    aberta.fechar()
+    assert len(aberta) == 0 and aberta.buscar(1) is None
+
+def test_arvore_vazia_e_arquivo_invalido(tmp_path):
+    """
+    Verifica a árvore vazia congelada e a recusa de arquivos inválidos.
+    """
+    caminho = str(tmp_path / "vazia.cong")
+    vazia = ArvoreB(m=3).congelar()
+    vazia.salvar(caminho)
+    aberta = ArvoreBCongelada.abrir(caminho)
+    assert len(aberta) == 0 and list(aberta) == [] and aberta.rank(10) == 0
+    aberta.fechar()
+
+    invalido = tmp_path / "invalido.cong"
+    invalido.write_bytes(b"x" * 100)
+    with pytest.raises(ValueError):
+        ArvoreBCongelada.abrir(str(invalido))
+
+def test_congelar_exige_chaves_int64():
+    """
+    Verifica que chaves fora de int64 são recusadas.
+    """
+    tree = ArvoreB(m=2)
+    tree.inserir(2 ** 70)
+    with pytest.raises(ValueError):
+        tree.congelar()
+
+def test_fechar_com_iterador_aberto(tmp_path):
+    """
+    Verifica que fechar() com um iterador em andamento libera o arquivo e
+    faz o iterador falhar ao avançar, e que uma vista externa ainda em uso
+    impede o fechamento sem deixar a árvore inutilizável.
+    """
+    caminho = str(tmp_path / "arvore.cong")
+    tree = _arvore()
+    tree.congelar().salvar(caminho)
+    aberta = ArvoreBCongelada.abrir(caminho)
+    iterador = iter(aberta)
+    assert next(iterador) == min(tree)
+    aberta.fechar()
+    assert len(aberta) == 0
+    with pytest.raises(ValueError):
+        next(iterador)
+
+    aberta = ArvoreBCongelada.abrir(caminho)
+    vista = memoryview(aberta._mapa)
+    with pytest.raises(BufferError):
+        aberta.fechar()
+    _conferir(aberta, tree)
+    vista.release()
+    aberta.fechar()
+    assert len(aberta) == 0
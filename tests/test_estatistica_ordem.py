@@ -0,0 +1,92 @@
+import pytest
+import icontract
+from src.ArvoreB import ArvoreB
+
+
+def _arvore(chaves, m=2) -> ArvoreB:
+    """
+    Cria uma árvore com tamanhos de subárvore e as chaves informadas.
+    """
+    tree = ArvoreB(m=m, tamanhos_subarvore=True)
+    for chave in chaves:
+        tree.inserir(chave)
+    return tree
+
+def test_tamanho_da_raiz_acompanha_insercoes_e_remocoes():
+    """
+    Verifica que o tamanho da raiz reflete divisões, empréstimos e fusões.
+    """
+    tree = _arvore(range(100))
+    assert tree.raiz.tamanho == 100
+    for chave in range(0, 100, 3):
+        tree.remover(chave)
+    assert tree.raiz.tamanho == 66
+    assert tree._tamanhos_ok()
+
+def test_rank_conta_chaves_menores():
+    """
+    Verifica rank para chaves presentes, ausentes e nos extremos.
+    """
+    tree = _arvore(range(0, 200, 2))
+    assert tree.rank(0) == 0
+    assert tree.rank(10) == 5
+    assert tree.rank(11) == 6
+    assert tree.rank(1000) == 100
+
+def test_selecionar_e_inverso_de_rank():
+    """
+    Verifica que selecionar(rank(x)) devolve x para todas as chaves.
+    """
+    chaves = [(i * 37) % 301 for i in range(301)]
+    tree = _arvore(chaves, m=3)
+    for chave in chaves:
+        assert tree.selecionar(tree.rank(chave)) == chave
+
+def test_selecionar_fora_do_intervalo():
+    """
+    Verifica que posições inválidas disparam IndexError.
+    """
+    tree = _arvore([1, 2, 3])
+    with pytest.raises(IndexError):
+        tree.selecionar(3)
+    with pytest.raises(IndexError):
+        tree.selecionar(-1)
+
+def test_contar_intervalo_fechado():
+    """
+    Verifica a contagem de chaves em intervalos fechados.
+    """
+    tree = _arvore(range(0, 100, 5))
+    assert tree.contar_intervalo(10, 30) == 5
+    assert tree.contar_intervalo(11, 29) == 3
+    assert tree.contar_intervalo(30, 10) == 0
+    assert tree.contar_intervalo(-50, 500) == 20
+
+def test_tamanhos_mantidos_em_lotes_e_carga():
+    """
+    Verifica os tamanhos após carga ordenada e operações em lote.
+    """
+    tree = ArvoreB.de_ordenados(range(500), 3, tamanhos_subarvore=True)
+    tree.inserir_lote(range(500, 800))
+    tree.remover_lote(range(0, 800, 4))
+    assert tree._tamanhos_ok()
+    assert tree.raiz.tamanho == 600
+    assert tree.selecionar(0) == 1
+
+def test_estatisticas_exigem_tamanhos():
+    """
+    Verifica que rank e afins exigem a árvore com tamanhos de subárvore.
+    """
+    tree = ArvoreB(m=2)
+    tree.inserir(1)
+    with pytest.raises(ValueError):
+        tree.rank(1)
+
+def test_invariante_detecta_tamanho_inconsistente():
+    """
+    Verifica que o invariante acusa tamanhos de subárvore corrompidos.
+    """
+    tree = _arvore(range(10))
+    tree.raiz.tamanho += 1
+    with pytest.raises(icontract.ViolationError):
+        tree.buscar(3)
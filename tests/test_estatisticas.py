@@ -0,0 +1,99 @@
+import random
+import threading
+from src.ArvoreB import ArvoreB
+
+
+def _conferir(tree: ArvoreB) -> None:
+    """
+    Compara as estatísticas mantidas com as obtidas percorrendo a árvore.
+    """
+    paginas = tree._todos_nos()
+    assert len(tree) == sum(pagina.qtdRegistros for pagina in paginas)
+    assert tree.altura() == tree._altura_interna()
+    assert tree.estatisticas()["paginas"] == len(paginas)
+
+def test_estatisticas_acompanham_insercoes_e_remocoes():
+    """
+    Verifica len(), altura() e a contagem de páginas ao longo de uma
+    sequência aleatória de inserções e remoções, até esvaziar a árvore.
+    """
+    sorteio = random.Random(7)
+    tree = ArvoreB(m=2, contratos="desligado")
+    chaves = sorteio.sample(range(2000), 600)
+    for chave in chaves:
+        tree.inserir(chave)
+    _conferir(tree)
+    sorteio.shuffle(chaves)
+    for i, chave in enumerate(chaves):
+        tree.remover(chave)
+        if i % 50 == 0:
+            _conferir(tree)
+    assert len(tree) == 0 and tree.altura() == 0
+    assert tree.estatisticas() == {"chaves": 0, "altura": 0, "paginas": 0,
+                                   "preenchimento_medio": 0.0}
+
+def test_estatisticas_em_lotes_carga_e_imagem(tmp_path):
+    """
+    Verifica as estatísticas após operações em lote, carga ordenada e
+    leitura de imagem, e o preenchimento médio da carga completa.
+    """
+    tree = ArvoreB(m=3)
+    tree.inserir_lote(range(300))
+    tree.remover_lote(range(0, 300, 3))
+    _conferir(tree)
+
+    carregada = ArvoreB.de_ordenados(range(1000), 4, contratos="desligado")
+    _conferir(carregada)
+    assert carregada.estatisticas()["preenchimento_medio"] > 0.9
+
+    caminho = str(tmp_path / "arvore.img")
+    tree.salvar(caminho)
+    _conferir(ArvoreB.carregar(caminho))
+
+def test_raiz_trocada_recalcula_estatisticas():
+    """
+    Verifica que, ao trocar a raiz fora das operações, as estatísticas
+    são recalculadas e voltam a ser mantidas.
+    """
+    origem = ArvoreB(m=2)
+    origem.inserir_lote(range(40))
+    tree = ArvoreB(m=2)
+    tree.raiz = origem.raiz
+    assert len(tree) == 40 and tree.altura() == origem.altura()
+    tree.inserir(100)
+    tree.remover(0)
+    _conferir(tree)
+
+def test_estatisticas_em_arvore_aberta(tmp_path):
+    """
+    Verifica que uma árvore reaberta conta chaves e páginas sob demanda.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=3)
+    tree.inserir_lote(range(500))
+    tree.fechar()
+    tree = ArvoreB.abrir(caminho)
+    assert len(tree) == 500
+    tree.remover(10)
+    _conferir(tree)
+    tree.fechar()
+
+def test_estatisticas_no_modo_concorrente():
+    """
+    Verifica a contagem de chaves após inserções e remoções em várias threads.
+    """
+    tree = ArvoreB(m=2, concorrente=True)
+
+    def trabalhar(base: int) -> None:
+        for chave in range(base, base + 200):
+            tree.inserir(chave)
+        for chave in range(base, base + 200, 2):
+            tree.remover(chave)
+
+    threads = [threading.Thread(target=trabalhar, args=(i * 1000,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _conferir(tree)
+    assert len(tree) == 400
@@ -0,0 +1,102 @@
+import random
+import pytest
+from src.ArvoreB import ArvoreB
+from src.FiltroBloom import FiltroBloom
+
+
+def test_filtro_nao_tem_falsos_negativos_e_respeita_a_taxa():
+    """
+    Verifica que toda chave adicionada passa pelo filtro e que a taxa de
+    falsos positivos medida fica próxima da estimada.
+    """
+    filtro = FiltroBloom(capacidade=5000, taxa_erro=0.01)
+    for chave in range(0, 10000, 2):
+        filtro.adicionar(chave)
+    assert all(chave in filtro for chave in range(0, 10000, 2))
+    falsos = sum(chave in filtro for chave in range(1, 40000, 2))
+    assert falsos / 20000 < 0.03
+    assert 0.005 < filtro.taxa_estimada() < 0.02
+    assert not filtro.saturado()
+
+def test_buscar_descarta_ausentes_sem_descer():
+    """
+    Verifica que buscas de chaves ausentes são respondidas pelo filtro,
+    sem visitar páginas, e que a taxa observada é contabilizada.
+    """
+    tree = ArvoreB(m=3, filtro=FiltroBloom(capacidade=1000))
+    tree.inserir_lote(range(0, 1000, 2))
+    visitadas = []
+    original = tree._buscar_em_pagina
+    tree._buscar_em_pagina = lambda pagina, chave: visitadas.append(chave) or original(pagina, chave)
+    resultados = [tree.buscar(chave) for chave in range(1, 1000, 2)]
+    assert resultados == [None] * 500
+    assert len(visitadas) == tree.filtro.falsos_positivos < 50
+    assert tree.filtro.negativas == 500 - len(visitadas)
+    assert tree.filtro.taxa_observada() == len(visitadas) / 500
+    assert all(tree.buscar(chave) == chave for chave in range(0, 1000, 2))
+
+def test_filtro_acompanha_remocoes_e_reconstroi_ao_saturar():
+    """
+    Verifica que, com inserções e remoções aleatórias, o filtro nunca
+    descarta uma chave presente e é reconstruído ao saturar.
+    """
+    sorteio = random.Random(3)
+    tree = ArvoreB(m=2, filtro=FiltroBloom(capacidade=64), contratos="incremental")
+    presentes = set()
+    for _ in range(3000):
+        chave = sorteio.randrange(500)
+        if chave in presentes:
+            tree.remover(chave)
+            presentes.discard(chave)
+        else:
+            tree.inserir(chave)
+            presentes.add(chave)
+    assert all(tree.buscar(chave) == chave for chave in presentes)
+    assert tree.filtro.capacidade > 64
+    assert tree.filtro.adicionadas <= tree.filtro.capacidade
+    tree.reconstruir_filtro()
+    assert tree.filtro.adicionadas == len(presentes) and tree.filtro.removidas == 0
+
+def test_filtro_em_carga_imagem_e_raiz_trocada(tmp_path):
+    """
+    Verifica que o filtro é preenchido na carga ordenada, na leitura de
+    imagem e quando a raiz é trocada fora das operações.
+    """
+    carregada = ArvoreB.de_ordenados(range(300), 3, filtro=FiltroBloom())
+    assert all(carregada.buscar(chave) == chave for chave in range(300))
+
+    caminho = str(tmp_path / "arvore.img")
+    carregada.salvar(caminho)
+    lida = ArvoreB.carregar(caminho, filtro=FiltroBloom())
+    assert all(lida.buscar(chave) == chave for chave in range(300))
+
+    tree = ArvoreB(m=3, filtro=FiltroBloom())
+    tree.raiz = lida.raiz
+    assert tree.buscar(123) == 123
+    tree.remover(123)
+    assert tree.buscar(123) is None
+
+def test_filtro_recusado_no_modo_concorrente():
+    """
+    Verifica que o filtro não pode ser combinado com o modo concorrente.
+    """
+    with pytest.raises(ValueError):
+        ArvoreB(m=2, concorrente=True, filtro=FiltroBloom())
+
+def test_busca_descartada_pelo_filtro_conclui_operacao(tmp_path):
+    """
+    Verifica que, em árvore aberta com abrir(), a busca descartada pelo
+    filtro encerra a operação, sem deixar páginas fixadas no pool.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=3)
+    tree.inserir_lote(range(0, 400, 2))
+    tree.fechar()
+    tree = ArvoreB.abrir(caminho, filtro=FiltroBloom(capacidade=1000))
+    gerenciador = tree._armazenamento
+    epoca = gerenciador.epoca
+    assert tree.buscar(1) is None
+    assert tree.filtro.negativas == 1
+    assert not gerenciador._fixadas
+    assert gerenciador.epoca > epoca
+    tree.fechar()
@@ -0,0 +1,126 @@
+import icontract
+import pytest
+from src.FlorestaParticionada import FlorestaParticionada
+
+
+def test_operacoes_sao_roteadas_por_faixa():
+    """
+    Verifica que cada chave vai para a partição da sua faixa e que as
+    operações unitárias funcionam através dos processos.
+    """
+    with FlorestaParticionada(2, [100, 200]) as floresta:
+        for chave in (5, 150, 250, 100, 199):
+            floresta.inserir(chave)
+        floresta.remover(150)
+        assert floresta.particao(99) == 0 and floresta.particao(100) == 1
+        assert floresta.buscar(199) == 199
+        assert floresta.buscar(150) is None
+        assert floresta.quantidades() == [1, 2, 1]
+
+def test_lotes_e_intervalo_entre_particoes():
+    """
+    Verifica as operações em lote e a varredura que atravessa partições
+    em blocos pequenos.
+    """
+    with FlorestaParticionada(3, [250, 500, 750], tamanho_bloco=16) as floresta:
+        inseridas = floresta.inserir_lote(range(0, 1000, 3))
+        assert all(inseridas.values()) and len(inseridas) == 334
+        assert floresta.inserir_lote([3, 1000]) == {3: False, 1000: True}
+        assert floresta.buscar_lote([999, 998, 0]) == [999, None, 0]
+        removidas = floresta.remover_lote(range(0, 1000, 6))
+        assert sum(removidas.values()) == 167
+        esperado = [c for c in range(0, 1000, 3) if c % 6 != 0] + [1000]
+        assert list(floresta) == esperado
+        assert list(floresta.intervalo(240, 760)) == [c for c in esperado if 240 <= c <= 760]
+        assert len(floresta) == len(esperado)
+
+def test_mover_limite_transfere_a_faixa():
+    """
+    Verifica que deslocar um limite move as chaves da faixa intermediária
+    para a partição vizinha, nos dois sentidos.
+    """
+    with FlorestaParticionada(2, [50, 90]) as floresta:
+        floresta.inserir_lote(range(100))
+        assert floresta.mover_limite(0, 30) == 20
+        assert floresta.quantidades() == [30, 60, 10]
+        assert floresta.mover_limite(0, 80) == 50
+        assert floresta.quantidades() == [80, 10, 10]
+        assert list(floresta) == list(range(100))
+        with pytest.raises(ValueError):
+            floresta.mover_limite(0, 95)
+
+def test_rebalancear_iguala_particoes():
+    """
+    Verifica que o rebalanceamento deixa as partições com quantidades
+    iguais a menos de uma e preserva o conteúdo.
+    """
+    with FlorestaParticionada(2, [10, 20, 30], tamanhos_subarvore=True) as floresta:
+        floresta.inserir_lote(range(1000, 2000))
+        floresta.inserir_lote(range(5))
+        assert floresta.quantidades() == [5, 0, 0, 1000]
+        assert floresta.rebalancear() > 0
+        quantidades = floresta.quantidades()
+        assert max(quantidades) - min(quantidades) <= 1
+        assert list(floresta) == list(range(5)) + list(range(1000, 2000))
+        assert floresta.buscar(1500) == 1500
+
+def test_erros_das_particoes_sao_repassados():
+    """
+    Verifica que a violação de contrato em um processo chega a quem chamou
+    e que a floresta continua utilizável depois dela.
+    """
+    with FlorestaParticionada(2, [10], contratos="completo") as floresta:
+        floresta.inserir(3)
+        with pytest.raises(icontract.ViolationError):
+            floresta.inserir(3)
+        floresta.inserir(4)
+        assert list(floresta) == [3, 4]
+
+def test_duplicatas_e_ausentes_recusadas_com_contratos_desligados():
+    """
+    Verifica que, com os contratos desligados nos processos, inserir uma
+    chave existente ou remover uma ausente é recusado com ValueError.
+    """
+    with FlorestaParticionada(2, [10], contratos="desligado") as floresta:
+        floresta.inserir(3)
+        floresta.inserir(12)
+        with pytest.raises(ValueError):
+            floresta.inserir(3)
+        with pytest.raises(ValueError):
+            floresta.inserir(12)
+        with pytest.raises(ValueError):
+            floresta.remover(4)
+        with pytest.raises(ValueError):
+            floresta.remover(13)
+        assert list(floresta) == [3, 12]
+        assert floresta.quantidades() == [1, 1]
+
+def test_limites_mantidos_se_a_reparticao_falhar():
+    """
+    Verifica que, se a entrega das chaves extraídas falhar, elas voltam às
+    partições de origem e os limites antigos continuam valendo.
+    """
+    with FlorestaParticionada(2, [10], contratos="desligado") as floresta:
+        floresta.inserir_lote(range(20))
+        original = floresta._executar
+        chamadas = []
+
+        def falhar_na_chegada(pedidos):
+            chamadas.append(pedidos)
+            if len(chamadas) == 2:
+                raise RuntimeError("falha simulada")
+            return original(pedidos)
+
+        floresta._executar = falhar_na_chegada
+        with pytest.raises(RuntimeError):
+            floresta.mover_limite(0, 15)
+        assert floresta.limites == [10]
+        assert list(floresta) == list(range(20))
+        assert floresta.quantidades() == [10, 10]
+
+def test_limites_devem_ser_crescentes():
+    """
+    Verifica que limites fora de ordem são rejeitados.
+    """
+    with pytest.raises(ValueError):
+        FlorestaParticionada(2, [10, 10])
@@ -0,0 +1,79 @@
+import random
+import pytest
+from src.ArvoreB import ArvoreB
+from src.PaginaCompacta import PaginaCompactaInt
+
+
+def _estrutura(pagina) -> tuple:
+    """
+    Descreve recursivamente as páginas (chaves e filhos) para comparação.
+    """
+    if pagina is None:
+        return ()
+    filhos = () if pagina.folha else tuple(
+        _estrutura(filho) for filho in pagina.paginas[: pagina.qtdRegistros + 1])
+    return (list(pagina.registros[: pagina.qtdRegistros]), filhos)
+
+def test_salvar_e_carregar_preserva_paginas(tmp_path):
+    """
+    Verifica que a árvore carregada tem exatamente as mesmas páginas.
+    """
+    random.seed(12)
+    caminho = str(tmp_path / "arvore.img")
+    tree = ArvoreB(m=2)
+    for chave in random.sample(range(10000), 400):
+        tree.inserir(chave)
+    tree.salvar(caminho)
+    carregada = ArvoreB.carregar(caminho)
+    assert carregada.t == 2
+    assert _estrutura(carregada.raiz) == _estrutura(tree.raiz)
+    carregada.inserir(-1)
+    carregada.remover(list(tree)[10])
+
+def test_chaves_inteiras_em_pagina_compacta(tmp_path):
+    """
+    Verifica a carga direta do buffer int64 em páginas array('q') e a
+    reconstrução dos tamanhos de subárvore.
+    """
+    caminho = str(tmp_path / "arvore.img")
+    tree = ArvoreB.de_ordenados(range(0, 3000, 3), m=4)
+    tree.salvar(caminho)
+    carregada = ArvoreB.carregar(caminho, tipo_pagina=PaginaCompactaInt,
+                                 tamanhos_subarvore=True)
+    assert list(carregada) == list(range(0, 3000, 3))
+    assert carregada.rank(1500) == 500
+    assert carregada.selecionar(999) == 2997
+
+def test_chaves_nao_inteiras(tmp_path):
+    """
+    Verifica o formato alternativo para chaves que não cabem em int64.
+    """
+    caminho = str(tmp_path / "arvore.img")
+    for chaves in (["maçã", "banana", "uva", "pera", "kiwi", "figo"], [2 ** 70, -1, 5]):
+        tree = ArvoreB(m=2)
+        for chave in chaves:
+            tree.inserir(chave)
+        tree.salvar(caminho)
+        assert list(ArvoreB.carregar(caminho)) == sorted(chaves)
+
+def test_arvore_vazia(tmp_path):
+    """
+    Verifica que uma árvore vazia é salva e carregada sem raiz.
+    """
+    caminho = str(tmp_path / "arvore.img")
+    ArvoreB(m=3).salvar(caminho)
+    carregada = ArvoreB.carregar(caminho)
+    assert carregada.raiz is None and carregada.t == 3
+
+def test_imagem_invalida(tmp_path):
+    """
+    Verifica que arquivos que não são imagens, ou truncados, lançam ValueError.
+    """
+    caminho = tmp_path / "arvore.img"
+    caminho.write_bytes(b"qualquer coisa")
+    with pytest.raises(ValueError):
+        ArvoreB.carregar(str(caminho))
+    ArvoreB.de_ordenados(range(100), m=2).salvar(str(caminho))
+    caminho.write_bytes(caminho.read_bytes()[:-16])
+    with pytest.raises(ValueError):
+        ArvoreB.carregar(str(caminho))
@@ -0,0 +1,70 @@
+import pytest
+from src.ArvoreB import ArvoreB
+from src.Instrumentacao import Instrumentacao, EVENTOS
+
+
+def test_busca_conta_paginas_e_comparacoes():
+    """
+    Verifica que cada busca visita no máximo altura() páginas e que as
+    comparações são contadas.
+    """
+    instrumentacao = Instrumentacao()
+    tree = ArvoreB(2, contratos="desligado", instrumentacao=instrumentacao)
+    tree.inserir_lote(range(200))
+    instrumentacao.zerar()
+    for chave in range(0, 400, 7):
+        assert tree.buscar(chave) == (chave if chave < 200 else None)
+    contadores = instrumentacao.instantaneo()
+    assert contadores["buscas"] == len(range(0, 400, 7))
+    assert 1 <= instrumentacao.paginas_por_busca() <= tree.altura()
+    assert contadores["comparacoes"] >= contadores["paginas_visitadas"]
+
+def test_eventos_estruturais():
+    """
+    Verifica a contagem de divisões e divisões da raiz na inserção, e de
+    fusões, empréstimos e recolhimentos da raiz na remoção.
+    """
+    instrumentacao = Instrumentacao()
+    tree = ArvoreB(2, instrumentacao=instrumentacao)
+    for chave in range(1, 101):
+        tree.inserir(chave)
+    contadores = instrumentacao.instantaneo()
+    assert contadores["divisoes_raiz"] == tree.altura() - 1
+    assert contadores["divisoes"] >= contadores["divisoes_raiz"]
+    for chave in range(1, 101):
+        tree.remover(chave)
+    contadores = instrumentacao.instantaneo()
+    assert contadores["fusoes"] > 0
+    assert contadores["emprestimos_anterior"] + contadores["emprestimos_posterior"] > 0
+    assert contadores["recolhimentos_raiz"] == contadores["divisoes_raiz"] + 1
+    assert tree.raiz is None
+
+def test_ganchos_recebem_eventos():
+    """
+    Verifica que os ganchos recebem cada registro e podem ser removidos.
+    """
+    instrumentacao = Instrumentacao()
+    recebidos = {}
+    gancho = lambda evento, quantidade: recebidos.update(
+        {evento: recebidos.get(evento, 0) + quantidade})
+    instrumentacao.adicionar_gancho(gancho)
+    tree = ArvoreB(2, instrumentacao=instrumentacao)
+    tree.inserir_lote(range(50))
+    tree.buscar(10)
+    assert recebidos == {evento: valor for evento, valor in
+                         instrumentacao.instantaneo().items() if valor}
+    instrumentacao.remover_gancho(gancho)
+    tree.buscar(11)
+    assert recebidos["buscas"] == 1
+    with pytest.raises(ValueError):
+        instrumentacao.remover_gancho(gancho)
+
+def test_sem_instrumentacao_nada_e_contado():
+    """
+    Verifica que a árvore funciona sem instrumentação e que os eventos
+    conhecidos começam zerados.
+    """
+    tree = ArvoreB(2)
+    tree.inserir_lote(range(20))
+    assert tree.instrumentacao is None and tree.buscar(5) == 5
+    assert Instrumentacao().instantaneo() == dict.fromkeys(EVENTOS, 0)
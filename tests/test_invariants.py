@@ -98,3 +98,18 @@ def test_folha_em_ordem_nao_dispara():
 
     tree.inserir(4)
     assert tree.buscar(4) == 4
+
+def test_grau_alto_mantem_ordem_com_busca_binaria():
+    """
+    Verifica que, com grau mínimo alto, inserções fora de ordem e remoções
+    localizam a posição correta em cada página.
+    """
+    tree = ArvoreB(m=64, contratos="incremental")
+    chaves = [(i * 7919) % 1000 for i in range(1000)]
+    for chave in chaves:
+        tree.inserir(chave)
+    assert tree.raiz.registros == sorted(tree.raiz.registros)
+    for chave in chaves[:500]:
+        tree.remover(chave)
+    assert all(tree.buscar(c) is None for c in chaves[:500])
+    assert all(tree.buscar(c) == c for c in chaves[500:])
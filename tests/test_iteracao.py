@@ -0,0 +1,65 @@
+from itertools import islice
+from src.ArvoreB import ArvoreB
+
+
+def _arvore(chaves, m=2) -> ArvoreB:
+    """
+    Cria uma árvore com as chaves informadas, inseridas uma a uma.
+    """
+    tree = ArvoreB(m=m)
+    for chave in chaves:
+        tree.inserir(chave)
+    return tree
+
+def test_iteracao_em_ordem_crescente():
+    """
+    Verifica que iterar a árvore produz as chaves em ordem crescente.
+    """
+    chaves = [(i * 17) % 101 for i in range(101)]
+    tree = _arvore(chaves)
+    assert list(tree) == sorted(chaves)
+
+def test_iteracao_reversa():
+    """
+    Verifica que reversed() produz as chaves em ordem decrescente.
+    """
+    tree = _arvore(range(50), m=3)
+    assert list(reversed(tree)) == list(range(49, -1, -1))
+
+def test_iteracao_em_arvore_vazia():
+    """
+    Verifica que árvores vazias não produzem chaves.
+    """
+    tree = ArvoreB(m=2)
+    assert list(tree) == []
+    assert list(tree.intervalo(1, 10)) == []
+    assert list(tree.intervalo_reverso(1, 10)) == []
+
+def test_intervalo_inclui_limites():
+    """
+    Verifica que o intervalo é fechado e aceita limites ausentes na árvore.
+    """
+    tree = _arvore(range(0, 100, 5))
+    assert list(tree.intervalo(10, 30)) == [10, 15, 20, 25, 30]
+    assert list(tree.intervalo(11, 29)) == [15, 20, 25]
+    assert list(tree.intervalo(None, 7)) == [0, 5]
+    assert list(tree.intervalo(90, None)) == [90, 95]
+    assert list(tree.intervalo(40, 30)) == []
+
+def test_intervalo_reverso_inclui_limites():
+    """
+    Verifica o intervalo reverso com limites presentes e ausentes.
+    """
+    tree = _arvore(range(0, 100, 5))
+    assert list(tree.intervalo_reverso(10, 30)) == [30, 25, 20, 15, 10]
+    assert list(tree.intervalo_reverso(11, 29)) == [25, 20, 15]
+    assert list(tree.intervalo_reverso(None, 7)) == [5, 0]
+
+def test_intervalo_e_preguicoso():
+    """
+    Verifica que consumir parte do intervalo não exige percorrer o restante.
+    """
+    tree = ArvoreB.de_ordenados(range(100000), 8, contratos="desligado")
+    gerador = tree.intervalo(5000, None)
+    assert list(islice(gerador, 3)) == [5000, 5001, 5002]
+    assert next(gerador) == 5003
@@ -0,0 +1,92 @@
+import pytest
+from src.ArvoreB import ArvoreB
+from src.PaginaCompacta import PaginaCompactaInt
+
+
+def _chaves_em_ordem(tree: ArvoreB) -> list:
+    """
+    Percorre a árvore em ordem simétrica e devolve as chaves.
+    """
+    chaves = []
+    def _percorrer(pagina):
+        if pagina.folha:
+            chaves.extend(pagina.registros)
+            return
+        for i in range(pagina.qtdRegistros + 1):
+            _percorrer(pagina.paginas[i])
+            if i < pagina.qtdRegistros:
+                chaves.append(pagina.registros[i])
+    if tree.raiz is not None:
+        _percorrer(tree.raiz)
+    return chaves
+
+def test_inserir_lote_em_arvore_vazia():
+    """
+    Verifica que um lote grande em árvore vazia gera árvore válida,
+    com a raiz dividida em vários níveis.
+    """
+    tree = ArvoreB(m=2)
+    resultado = tree.inserir_lote(range(500, 0, -1))
+    assert all(resultado.values())
+    assert _chaves_em_ordem(tree) == list(range(1, 501))
+    assert tree.altura() > 2
+
+def test_inserir_lote_reporta_duplicatas_sem_falhar():
+    """
+    Verifica que chaves já existentes retornam False em vez de disparar erro.
+    """
+    tree = ArvoreB(m=3)
+    tree.inserir_lote(range(0, 100, 2))
+    resultado = tree.inserir_lote([1, 2, 3, 4, 3])
+    assert resultado == {1: True, 2: False, 3: True, 4: False}
+    assert tree.buscar(3) == 3
+
+def test_remover_lote_reporta_ausentes_sem_falhar():
+    """
+    Verifica que chaves ausentes retornam False e as demais são removidas.
+    """
+    tree = ArvoreB(m=2)
+    tree.inserir_lote(range(50))
+    resultado = tree.remover_lote([10, 11, 99, -1])
+    assert resultado == {10: True, 11: True, 99: False, -1: False}
+    assert _chaves_em_ordem(tree) == [c for c in range(50) if c not in (10, 11)]
+
+def test_remover_lote_inclui_chaves_internas():
+    """
+    Verifica a remoção de separadores de páginas internas no mesmo lote.
+    """
+    tree = ArvoreB(m=2)
+    tree.inserir_lote(range(100))
+    separadores = list(tree.raiz.registros)
+    resultado = tree.remover_lote(separadores + [0, 1, 2])
+    assert all(resultado.values())
+    restantes = [c for c in range(100) if c not in set(separadores + [0, 1, 2])]
+    assert _chaves_em_ordem(tree) == restantes
+
+def test_remover_lote_esvazia_arvore():
+    """
+    Verifica que remover todas as chaves deixa a árvore sem raiz.
+    """
+    tree = ArvoreB(m=3)
+    tree.inserir_lote(range(300))
+    assert all(tree.remover_lote(range(300)).values())
+    assert tree.raiz is None
+
+@pytest.mark.parametrize("contratos", ["completo", "incremental"])
+def test_lotes_intercalados_mantem_contratos(contratos):
+    """
+    Verifica lotes intercalados com operações unitárias sob contratos.
+    """
+    tree = ArvoreB(m=2, contratos=contratos, tipo_pagina=PaginaCompactaInt)
+    esperado = set()
+    for rodada in range(20):
+        lote = [(rodada * 37 + i * 11) % 400 for i in range(60)]
+        if rodada % 3 == 2:
+            tree.remover_lote(lote)
+            esperado -= set(lote)
+        else:
+            tree.inserir_lote(lote)
+            esperado |= set(lote)
+    tree.inserir(1000)
+    esperado.add(1000)
+    assert _chaves_em_ordem(tree) == sorted(esperado)
@@ -0,0 +1,151 @@
+import pytest
+import icontract
+from src.ArvoreB import ArvoreB
+from src.Pagina import Pagina
+from src.ModoContratos import ModoContratos
+
+
+def _arvore_com_folha_desordenada(**kwargs) -> ArvoreB:
+    """
+    Cria uma árvore cuja raiz folha viola o invariante de ordenação.
+    """
+    tree = ArvoreB(m=2, **kwargs)
+    tree.raiz = Pagina(t=2, folha=True)
+    tree.raiz.registros = [5, 2, 8]
+    tree.raiz.qtdRegistros = 3
+    return tree
+
+def test_modo_padrao_e_completo(monkeypatch):
+    """
+    Verifica que, sem configuração, os contratos ficam em modo completo.
+    """
+    monkeypatch.delenv("ARVOREB_CONTRATOS", raising=False)
+    tree = ArvoreB(m=2)
+    assert tree.contratos.nivel == "completo"
+
+def test_modo_lido_da_variavel_de_ambiente(monkeypatch):
+    """
+    Verifica que o nível e a amostragem podem vir do ambiente.
+    """
+    monkeypatch.setenv("ARVOREB_CONTRATOS", "amostrado")
+    monkeypatch.setenv("ARVOREB_AMOSTRAGEM", "7")
+    tree = ArvoreB(m=2)
+    assert tree.contratos.nivel == "amostrado"
+    assert tree.contratos.amostragem == 7
+
+def test_modo_invalido_dispara_erro():
+    """
+    Verifica que níveis desconhecidos ou amostragem inválida são rejeitados.
+    """
+    with pytest.raises(ValueError):
+        ModoContratos("talvez")
+    with pytest.raises(ValueError):
+        ModoContratos("amostrado", 0)
+
+def test_desligado_nao_verifica_invariantes():
+    """
+    Verifica que no modo desligado a violação de invariante não é detectada.
+    """
+    tree = _arvore_com_folha_desordenada(contratos="desligado")
+    assert tree.buscar(99) is None
+
+def test_desligado_permite_operacoes_sem_precondicao():
+    """
+    Verifica que no modo desligado a pré-condição de remoção não é avaliada.
+    """
+    tree = ArvoreB(m=2, contratos="desligado")
+    tree.inserir(1)
+    tree.remover(42)
+    assert tree.buscar(1) == 1
+
+def test_amostrado_verifica_a_cada_n_operacoes():
+    """
+    Verifica que o modo amostrado só detecta a violação na operação amostrada.
+    """
+    tree = ArvoreB(m=2, contratos="amostrado", amostragem=3)
+    tree.inserir(1)
+    tree.raiz.registros = [5, 2, 8]
+    tree.raiz.qtdRegistros = 3
+    assert tree.buscar(99) is None
+    with pytest.raises(icontract.ViolationError):
+        tree.buscar(99)
+
+def test_amostrado_mantem_arvore_valida():
+    """
+    Verifica que inserções e remoções em modo amostrado mantêm a árvore válida.
+    """
+    tree = ArvoreB(m=3, contratos="amostrado", amostragem=10)
+    chaves = [(i * 37) % 500 for i in range(500)]
+    for chave in chaves:
+        tree.inserir(chave)
+    for chave in chaves[::2]:
+        tree.remover(chave)
+    assert tree._limites_chaves_ok()
+    assert tree._limites_filhos_ok()
+    assert tree._folhas_mesmo_nivel()
+    assert all(tree.buscar(c) == c for c in chaves[1::2])
+    assert all(tree.buscar(c) is None for c in chaves[::2])
+
+def test_completo_insercoes_sequenciais_respeitam_contratos():
+    """
+    Verifica que inserções sequenciais redistribuem chaves entre irmãos
+    sem violar os limites de chaves das páginas.
+    """
+    tree = ArvoreB(m=2)
+    for chave in range(100):
+        tree.inserir(chave)
+    assert all(tree.buscar(c) == c for c in range(100))
+
+def test_incremental_registra_apenas_paginas_tocadas():
+    """
+    Verifica que o modo incremental registra o caminho da inserção,
+    sem incluir páginas que a operação não alterou.
+    """
+    tree = ArvoreB(m=2, contratos="incremental")
+    for chave in range(20):
+        tree.inserir(chave)
+    tree.inserir(100)
+    assert tree.raiz in tree._tocadas
+    assert tree.raiz.paginas[0] not in tree._tocadas
+
+def test_incremental_detecta_corrupcao_na_operacao(monkeypatch):
+    """
+    Verifica que o modo incremental acusa a violação na própria operação
+    que desordenou a folha.
+    """
+    tree = ArvoreB(m=2, contratos="incremental")
+    for chave in [10, 20, 30, 40, 50]:
+        tree.inserir(chave)
+
+    def inserir_no_fim(self, pagina, chave):
+        while not pagina.folha:
+            pagina = pagina.paginas[pagina.qtdRegistros]
+        self._tocar(pagina)
+        pagina.registros.append(chave)
+        pagina.qtdRegistros += 1
+
+    monkeypatch.setattr(ArvoreB, '_inserir_em_pagina_nao_cheia', inserir_no_fim)
+
+    with pytest.raises(icontract.ViolationError):
+        tree.inserir(1)
+
+def test_incremental_mantem_pre_condicoes():
+    """
+    Verifica que o modo incremental continua rejeitando duplicatas.
+    """
+    tree = ArvoreB(m=2, contratos="incremental")
+    tree.inserir(3)
+    with pytest.raises(icontract.ViolationError):
+        tree.inserir(3)
+
+def test_incremental_remocoes_com_fusao_nao_disparam():
+    """
+    Verifica que fusões e colapsos da raiz não geram falsos positivos
+    no modo incremental.
+    """
+    tree = ArvoreB(m=2, contratos="incremental")
+    for chave in range(50):
+        tree.inserir(chave)
+    for chave in range(50):
+        tree.remover(chave)
+    assert tree.raiz is None
@@ -0,0 +1,61 @@
+import pytest
+import icontract
+from array import array
+from src.ArvoreB import ArvoreB
+from src.PaginaCompacta import PaginaCompacta, PaginaCompactaInt
+
+
+def test_pagina_compacta_sem_dict_e_folha_sem_filhos():
+    """
+    Verifica que a página compacta não tem __dict__ e que folhas
+    não alocam vetor de filhos.
+    """
+    folha = PaginaCompacta(t=4, folha=True)
+    interna = PaginaCompacta(t=4, folha=False)
+    assert not hasattr(folha, "__dict__")
+    assert folha.paginas is None
+    assert interna.paginas == []
+
+def test_pagina_compacta_int_usa_array():
+    """
+    Verifica que a variante inteira guarda as chaves em array('q').
+    """
+    pagina = PaginaCompactaInt(t=4, folha=True)
+    assert isinstance(pagina.registros, array)
+    assert pagina.registros.typecode == 'q'
+
+@pytest.mark.parametrize("tipo", [PaginaCompacta, PaginaCompactaInt])
+def test_arvore_com_pagina_compacta(tipo):
+    """
+    Verifica inserções e remoções com as representações compactas,
+    incluindo divisões, empréstimos e fusões.
+    """
+    tree = ArvoreB(m=2, tipo_pagina=tipo)
+    chaves = [(i * 31) % 200 for i in range(200)]
+    for chave in chaves:
+        tree.inserir(chave)
+    for chave in chaves[:150]:
+        tree.remover(chave)
+    assert all(isinstance(no, tipo) for no in tree._todos_nos())
+    assert all(tree.buscar(c) == c for c in chaves[150:])
+    assert all(tree.buscar(c) is None for c in chaves[:150])
+
+def test_invariante_detecta_array_desordenado():
+    """
+    Verifica que o invariante de ordenação também vale para chaves em array.
+    """
+    tree = ArvoreB(m=2, tipo_pagina=PaginaCompactaInt)
+    tree.inserir(1)
+    tree.raiz.registros = array('q', [5, 2, 8])
+    tree.raiz.qtdRegistros = 3
+    with pytest.raises(icontract.ViolationError):
+        tree.buscar(2)
+
+def test_pagina_compacta_int_rejeita_chave_nao_inteira():
+    """
+    Verifica que o buffer tipado recusa chaves que não são inteiras.
+    """
+    tree = ArvoreB(m=2, tipo_pagina=PaginaCompactaInt)
+    tree.inserir(1)
+    with pytest.raises(TypeError):
+        tree.inserir(2.5)
@@ -0,0 +1,84 @@
+import json
+import math
+import random
+import icontract
+import pytest
+from src.ArvoreB import ArvoreB
+from src.Perfil import HistogramaLatencia, Perfil, perfilar
+
+
+def test_histograma_respeita_precisao():
+    """
+    Verifica que os percentis do histograma ficam dentro do erro relativo
+    prometido pelos dígitos significativos.
+    """
+    sorteio = random.Random(3)
+    valores = sorted(int(sorteio.lognormvariate(10, 2)) for _ in range(20000))
+    histograma = HistogramaLatencia(2)
+    for valor in valores:
+        histograma.registrar(valor)
+    for percentual in (50, 90, 99, 99.9):
+        exato = valores[max(0, math.ceil(round(len(valores) * percentual / 100, 6)) - 1)]
+        assert abs(histograma.percentil(percentual) - exato) <= exato / 100 + 1
+    assert histograma.contagem == len(valores)
+    assert histograma.minimo == valores[0] and histograma.maximo == valores[-1]
+    assert histograma.percentil(100) == valores[-1]
+
+def test_histograma_combinar_e_distribuicao():
+    """
+    Verifica que combinar histogramas soma as contagens e que a
+    distribuição exportada reconstrói o histograma.
+    """
+    a, b = HistogramaLatencia(), HistogramaLatencia()
+    for valor in range(0, 5000, 7):
+        a.registrar(valor)
+    b.registrar(10 ** 9, vezes=3)
+    a.combinar(b)
+    assert a.contagem == len(range(0, 5000, 7)) + 3 and a.maximo == 10 ** 9
+    copia = HistogramaLatencia()
+    for valor, vezes in a.distribuicao():
+        copia.registrar(valor, vezes)
+    assert copia.distribuicao() == a.distribuicao()
+    with pytest.raises(ValueError):
+        a.combinar(HistogramaLatencia(3))
+    with pytest.raises(ValueError):
+        HistogramaLatencia(0)
+
+def test_perfilar_separa_algoritmo_e_contratos(tmp_path):
+    """
+    Verifica que o perfil registra cada chamada, que o total é a soma de
+    algoritmo e contratos e que o modo anterior é restaurado ao sair.
+    """
+    tree = ArvoreB(2, contratos="completo")
+    with perfilar(tree) as perfil:
+        for chave in range(100):
+            tree.inserir(chave)
+        for chave in range(100):
+            tree.buscar(chave)
+        tree.remover(5)
+    assert tree.perfil is None
+    tree.inserir(500)
+    inserir = perfil.histogramas["inserir"]
+    assert inserir["total"].contagem == inserir["algoritmo"].contagem == 100
+    assert inserir["total"].soma == inserir["algoritmo"].soma + inserir["contratos"].soma
+    assert inserir["contratos"].soma > inserir["algoritmo"].soma
+    assert perfil.histograma("buscar").contagem == 100
+    assert perfil.histograma("remover", "algoritmo").contagem == 1
+    caminho = tmp_path / "perfil.json"
+    dados = perfil.despejar(str(caminho))
+    assert json.loads(caminho.read_text()) == json.loads(json.dumps(dados))
+    assert "contratos" in perfil.resumo()
+
+def test_violacao_conta_como_contratos():
+    """
+    Verifica que uma chamada barrada pela pré-condição é registrada só
+    como tempo de contratos.
+    """
+    perfil = Perfil()
+    tree = ArvoreB(2, contratos="completo", perfil=perfil)
+    tree.inserir(1)
+    with pytest.raises(icontract.ViolationError):
+        tree.inserir(1)
+    inserir = perfil.histogramas["inserir"]
+    assert inserir["total"].contagem == inserir["contratos"].contagem == 2
+    assert inserir["algoritmo"].contagem == 1
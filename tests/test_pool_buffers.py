@@ -0,0 +1,96 @@
+import pytest
+from src.ArvoreB import ArvoreB
+from src.PoolBuffers import PoolBuffers
+
+
+class _Quadro:
+    """
+    Página mínima com os atributos usados pelo pool.
+    """
+    def __init__(self, nome):
+        self.nome = nome
+        self._referenciada = False
+        self._fixacoes = 0
+        self._quadro = None
+
+
+def test_relogio_despeja_nao_referenciada():
+    """
+    Verifica que o relógio dá segunda chance às páginas referenciadas e
+    despeja a primeira encontrada sem bit de referência.
+    """
+    despejadas = []
+    pool = PoolBuffers(despejadas.append, capacidade_paginas=3)
+    a, b, c, d = (_Quadro(n) for n in "abcd")
+    for quadro in (a, b, c):
+        pool.admitir(quadro)
+    pool.acessar(a)
+    b._referenciada = False
+    pool.admitir(d)
+    assert despejadas == [b]
+    assert len(pool) == 3
+    assert b not in pool and d in pool
+    assert pool.estatisticas()["despejos"] == 1
+
+def test_paginas_fixadas_nao_sao_despejadas():
+    """
+    Verifica que páginas fixadas excedem a capacidade em vez de serem
+    despejadas, e que reduzir() devolve o pool à capacidade.
+    """
+    despejadas = []
+    pool = PoolBuffers(despejadas.append, capacidade_paginas=1)
+    a, b = _Quadro("a"), _Quadro("b")
+    pool.admitir(a)
+    pool.fixar(a)
+    pool.admitir(b)
+    assert despejadas == [] and len(pool) == 2
+    pool.desafixar(a)
+    pool.reduzir()
+    assert len(pool) == 1
+    with pytest.raises(ValueError):
+        pool.desafixar(a)
+
+def test_capacidade_invalida():
+    """
+    Verifica as validações de capacidade do pool.
+    """
+    with pytest.raises(ValueError):
+        PoolBuffers(print, capacidade_paginas=0)
+    with pytest.raises(ValueError):
+        PoolBuffers(print, capacidade_paginas=2, capacidade_bytes=4096)
+    assert PoolBuffers(print, capacidade_bytes=4096, tamanho_pagina=512).capacidade == 8
+
+def test_buscas_repetidas_acertam_o_pool(tmp_path):
+    """
+    Verifica que repetir uma busca não lê o arquivo de novo e conta acertos.
+    """
+    tree = ArvoreB.abrir(str(tmp_path / "arvore.pag"), m=2)
+    tree.inserir_lote(range(200))
+    gerenciador = tree._armazenamento
+    assert tree.buscar(77) == 77
+    leituras = gerenciador.leituras
+    acertos = gerenciador.pool.acertos
+    assert tree.buscar(77) == 77
+    assert gerenciador.leituras == leituras
+    assert gerenciador.pool.acertos > acertos
+    tree.fechar()
+
+def test_pool_pequeno_grava_ao_despejar(tmp_path):
+    """
+    Verifica que, com pool de poucas páginas, as páginas sujas despejadas
+    são gravadas e a árvore continua correta após reabrir.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2, capacidade_paginas=3)
+    for chave in range(400):
+        tree.inserir(chave)
+        assert len(tree._armazenamento.pool) <= 3
+    for chave in range(0, 400, 3):
+        tree.remover(chave)
+    estatisticas = tree._armazenamento.pool.estatisticas()
+    assert estatisticas["despejos"] > 0 and estatisticas["faltas"] > 0
+    tree.fechar()
+
+    tree = ArvoreB.abrir(caminho, capacidade_bytes=4096)
+    assert list(tree) == [c for c in range(400) if c % 3]
+    tree.fechar()
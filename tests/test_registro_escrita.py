@@ -0,0 +1,165 @@
+import os
+import threading
+import pytest
+from src.ArvoreB import ArvoreB
+from src.RegistroEscrita import RegistroEscrita
+
+
+def _queda(tree: ArvoreB) -> None:
+    """
+    Simula uma queda do processo: fecha os arquivos sem gravar o pool.
+    """
+    gerenciador = tree._armazenamento
+    os.close(gerenciador.arquivo._fd)
+    os.close(gerenciador.registro._fd)
+    tree._armazenamento = None
+
+def test_entradas_e_cauda_corrompida(tmp_path):
+    """
+    Verifica que as entradas são relidas na ordem e que uma moldura
+    incompleta no fim do arquivo é descartada.
+    """
+    caminho = str(tmp_path / "registro")
+    registro = RegistroEscrita(caminho)
+    for i in range(3):
+        registro.confirmar(registro.anexar(bytes([i]) * 10))
+    registro.fechar()
+    with open(caminho, "ab") as arquivo:
+        arquivo.write(b"\x40\x00\x00\x00lixo")
+
+    registro = RegistroEscrita(caminho)
+    assert list(registro.entradas()) == [bytes([i]) * 10 for i in range(3)]
+    assert registro.tamanho == os.path.getsize(caminho)
+    registro.fechar()
+
+def test_commit_em_grupo_compartilha_fsync(tmp_path):
+    """
+    Verifica que confirmações concorrentes são atendidas por menos fsyncs
+    do que entradas anexadas.
+    """
+    registro = RegistroEscrita(str(tmp_path / "registro"), atraso_grupo=0.01)
+    barreira = threading.Barrier(8)
+
+    def _trabalhar():
+        barreira.wait()
+        for _ in range(5):
+            registro.confirmar(registro.anexar(b"operacao"))
+
+    threads = [threading.Thread(target=_trabalhar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(list(registro.entradas())) == 40
+    assert registro.sincronizacoes < 40
+    registro.fechar()
+
+def test_insercoes_nao_gravam_paginas(tmp_path):
+    """
+    Verifica que, com registro e pool folgado, cada operação custa uma
+    entrada sincronizada no registro e nenhuma gravação de página.
+    """
+    tree = ArvoreB.abrir(str(tmp_path / "arvore.pag"), m=2, registro_escrita=True)
+    gerenciador = tree._armazenamento
+    for chave in range(100):
+        tree.inserir(chave)
+    assert gerenciador.gravacoes == 0
+    assert gerenciador.registro.sincronizacoes == 100
+    tree.ponto_de_controle()
+    assert gerenciador.gravacoes > 0
+    assert gerenciador.registro.tamanho == 0
+    tree.fechar()
+
+def test_escritores_concorrentes_compartilham_fsync(tmp_path):
+    """
+    Verifica que threads inserindo na mesma árvore aberta com abrir()
+    terminam com muito menos fsyncs do que operações, e que todas as
+    operações sobrevivem a uma queda.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=3, registro_escrita=True, atraso_grupo=0.005)
+    barreira = threading.Barrier(8)
+
+    def _trabalhar(inicio):
+        barreira.wait()
+        for chave in range(inicio, 200, 8):
+            tree.inserir(chave)
+
+    threads = [threading.Thread(target=_trabalhar, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tree._armazenamento.registro.sincronizacoes < 200 // 4
+    _queda(tree)
+
+    tree = ArvoreB.abrir(caminho, registro_escrita=True, contratos="completo")
+    assert list(tree) == list(range(200))
+    tree.fechar()
+
+def test_recuperacao_apos_queda(tmp_path):
+    """
+    Verifica que operações confirmadas sobrevivem a uma queda sem que o
+    pool tenha sido gravado, inclusive remoções com fusões.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2, registro_escrita=True)
+    tree.inserir_lote(range(300))
+    tree.ponto_de_controle()
+    for chave in range(0, 300, 2):
+        tree.remover(chave)
+    tree.inserir(1000)
+    _queda(tree)
+
+    tree = ArvoreB.abrir(caminho, registro_escrita=True, contratos="completo")
+    assert tree._armazenamento.recuperadas == 151
+    assert list(tree) == list(range(1, 300, 2)) + [1000]
+    tree.inserir(2)
+    tree.fechar()
+
+def test_recuperacao_com_pool_pequeno_e_confirmacao_adiada(tmp_path):
+    """
+    Verifica que, com confirmação adiada e despejos frequentes, a árvore
+    reaberta após a queda é íntegra e contém o que foi sincronizado.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2, capacidade_paginas=2, registro_escrita=True,
+                         confirmacao_sincrona=False)
+    for chave in range(200):
+        tree.inserir(chave)
+    tree.sincronizar()
+    _queda(tree)
+
+    tree = ArvoreB.abrir(caminho, registro_escrita=True, contratos="completo")
+    assert list(tree) == list(range(200))
+    tree.fechar()
+
+def test_chave_fora_de_int64_nao_trava_o_registro(tmp_path, monkeypatch):
+    """
+    Verifica que a chave fora de int64 é recusada antes de alterar páginas
+    e que uma falha ao registrar a operação ainda a encerra, sem deixar
+    páginas fixadas nem a escrita aberta.
+    """
+    caminho = str(tmp_path / "arvore.pag")
+    tree = ArvoreB.abrir(caminho, m=2, registro_escrita=True)
+    gerenciador = tree._armazenamento
+    tree.inserir_lote(range(50))
+    with pytest.raises(ValueError):
+        tree.inserir(2 ** 70)
+    assert not gerenciador.escrita and not gerenciador._fixadas
+    tree.inserir(100)
+
+    def falhar(raiz_id):
+        raise OverflowError("falha simulada")
+
+    monkeypatch.setattr(gerenciador, "_registrar", falhar)
+    with pytest.raises(OverflowError):
+        tree.remover(100)
+    assert not gerenciador.escrita and not gerenciador._fixadas
+    monkeypatch.undo()
+    tree.inserir(200)
+    tree.fechar()
+
+    tree = ArvoreB.abrir(caminho, registro_escrita=True)
+    assert tree.buscar(200) == 200 and tree.buscar(2 ** 62) is None
+    tree.fechar()
@@ -0,0 +1,84 @@
+import gc
+import weakref
+import pytest
+from src.ArvoreB import ArvoreB, InstantaneoArvoreB
+
+
+def _paginas(tree: ArvoreB) -> set:
+    """
+    Retorna os identificadores de todas as páginas alcançáveis da raiz.
+    """
+    return {id(pagina) for pagina in tree._todos_nos()}
+
+def test_snapshot_nao_ve_escritas_posteriores():
+    """
+    Verifica que o instantâneo mantém o conteúdo do momento em que foi
+    criado, enquanto a árvore continua recebendo escritas.
+    """
+    tree = ArvoreB(m=2, tamanhos_subarvore=True)
+    tree.inserir_lote(range(100))
+    instantaneo = tree.snapshot()
+    for chave in range(0, 100, 2):
+        tree.remover(chave)
+    tree.inserir_lote(range(100, 150))
+    assert isinstance(instantaneo, InstantaneoArvoreB)
+    assert list(instantaneo) == list(range(100))
+    assert instantaneo.buscar(40) == 40 and tree.buscar(40) is None
+    assert instantaneo.contar_intervalo(0, 49) == 50
+    assert list(tree) == list(range(1, 100, 2)) + list(range(100, 150))
+
+def test_escrita_copia_apenas_o_caminho():
+    """
+    Verifica que uma inserção após o instantâneo copia poucas páginas e
+    compartilha as demais.
+    """
+    tree = ArvoreB(m=2)
+    tree.inserir_lote(range(0, 2000, 2))
+    instantaneo = tree.snapshot()
+    antes = _paginas(instantaneo)
+    tree.inserir(501)
+    copiadas = _paginas(tree) - antes
+    assert 0 < len(copiadas) <= 2 * tree.altura()
+    assert len(_paginas(tree) & antes) > len(antes) - 2 * tree.altura()
+
+def test_snapshot_e_somente_leitura():
+    """
+    Verifica que as operações de escrita no instantâneo lançam TypeError.
+    """
+    tree = ArvoreB(m=2)
+    tree.inserir(1)
+    instantaneo = tree.snapshot()
+    for operacao, argumento in ((instantaneo.inserir, 2), (instantaneo.remover, 1),
+                                (instantaneo.inserir_lote, [2]),
+                                (instantaneo.remover_lote, [1])):
+        with pytest.raises(TypeError):
+            operacao(argumento)
+    assert instantaneo.snapshot() is instantaneo
+    assert list(instantaneo) == [1]
+
+def test_paginas_antigas_liberadas_ao_descartar():
+    """
+    Verifica que páginas substituídas ficam vivas só enquanto o instantâneo
+    existe, e que sem instantâneos as escritas voltam a ser feitas no lugar.
+    """
+    tree = ArvoreB(m=2)
+    tree.inserir_lote(range(50))
+    raiz_antiga = weakref.ref(tree.raiz)
+    instantaneo = tree.snapshot()
+    tree.inserir(100)
+    assert tree.raiz is not raiz_antiga()
+    del instantaneo
+    gc.collect()
+    assert raiz_antiga() is None
+    raiz = tree.raiz
+    tree.inserir(101)
+    assert tree.raiz is raiz
+
+def test_snapshot_em_arvore_em_disco(tmp_path):
+    """
+    Verifica que árvores abertas de arquivo não oferecem instantâneos.
+    """
+    tree = ArvoreB.abrir(str(tmp_path / "arvore.pag"), m=2)
+    with pytest.raises(ValueError):
+        tree.snapshot()
+    tree.fechar()